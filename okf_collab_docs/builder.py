@@ -0,0 +1,375 @@
+""" Build the static site for all languages """
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import copy
+import io
+import logging
+import os
+import tempfile
+from mkdocs.commands import build
+from mkdocs import config as mkdocs_config
+from mkdocs.utils import clean_directory
+from helpers import load_yaml
+from incremental import PLUGIN_NAME, IncrementalPlugin, pages_manifest_path
+from pdf_cache import cached_pdf_path, pdf_cache_key, restore_pdf, store_pdf
+from profiling import Profiler, run_profiled
+from render import prune_folder
+
+
+PDF_PLUGIN = 'with-pdf'
+# with-pdf default
+DEFAULT_PDF_OUTPUT_PATH = 'pdf/document.pdf'
+# (plugin, event, phase name) recorded with --profile
+PROFILED_PLUGIN_EVENTS = [
+    ('search', 'post_build', 'search index'),
+    (PDF_PLUGIN, 'post_build', 'PDF render'),
+]
+
+
+def is_not_dirty_warning(record):
+    """ Log filter for the mkdocs warning about dirty builds """
+    return not record.getMessage().startswith("A 'dirty' build is being performed")
+
+
+def mkdocs_build(config, dirty=False):
+    """ Run the mkdocs build. Dirty builds are expected here: the site folder is cleaned
+        once for all the languages (see build_sites) and each language is built as dirty
+        so it doesn't remove the others. The mkdocs warning about them is hidden """
+    build_logger = logging.getLogger('mkdocs.commands.build')
+    build_logger.addFilter(is_not_dirty_warning)
+    try:
+        build.build(config, dirty=dirty)
+    finally:
+        build_logger.removeFilter(is_not_dirty_warning)
+
+
+def get_plugin_name(plugin):
+    """ Plugins are defined as a string or as a dict {name: settings} """
+    return plugin if isinstance(plugin, str) else list(plugin.keys())[0]
+
+
+def in_memory_config(config_file, config):
+    """ A language config resolved in memory, used instead of a config file path
+        (config_file is the path it would be written to, relative paths in
+        the config are resolved from its folder. It doesn't need to exist) """
+    return {'config_file': str(config_file), 'config': config}
+
+
+def read_language_config(config_file):
+    """ Return the raw config (dict, as in the YAML file) and the config file path
+        of a language. config_file is a file path or an in-memory config """
+    if isinstance(config_file, dict):
+        return config_file['config'], config_file['config_file']
+    with open(config_file) as f:
+        return load_yaml(f), str(config_file)
+
+
+def resolve_cover_logo(plugins, config_folder):
+    """ Plugins list with the PDF cover logo as an absolute path, if it's a file
+        relative to the config folder (e.g. a vendored copy, see vendor.py).
+        The PDF plugin only looks for it in the template, theme, docs and working
+        folders. Return None if the cover logo is not changed """
+    settings = get_plugin_settings(plugins, PDF_PLUGIN) or {}
+    cover_logo = settings.get('cover_logo')
+    if not cover_logo or '://' in cover_logo or os.path.isabs(cover_logo):
+        return None
+    path = os.path.abspath(os.path.join(config_folder, cover_logo))
+    if not os.path.isfile(path):
+        return None
+    return [
+        {PDF_PLUGIN: dict(settings, cover_logo=path)} if get_plugin_name(plugin) == PDF_PLUGIN else plugin
+        for plugin in plugins
+    ]
+
+
+def load_language_config(config_file, pdf=True, **overrides):
+    """ Load a language mkdocs config file or in-memory config (optionally without the PDF plugin) """
+    raw_config, config_file_path = read_language_config(config_file)
+    plugins = raw_config.get('plugins', [])
+    if not pdf:
+        overrides['plugins'] = [plugin for plugin in plugins if get_plugin_name(plugin) != PDF_PLUGIN]
+    else:
+        pdf_plugins = resolve_cover_logo(plugins, os.path.dirname(config_file_path))
+        if pdf_plugins:
+            overrides['plugins'] = pdf_plugins
+    if isinstance(config_file, dict):
+        # mkdocs changes some values while validating, don't touch the original ones
+        options = dict(copy.deepcopy(config_file['config']), **overrides)
+        return mkdocs_config.load_config(
+            config_file=io.StringIO('{}'), config_file_path=config_file['config_file'], **options
+        )
+    with open(config_file) as f:
+        return mkdocs_config.load_config(config_file=f, **overrides)
+
+
+def get_plugin_settings(plugins, name):
+    """ Settings of a plugin from the plugins list of a config file (None if not used) """
+    for plugin in plugins:
+        if get_plugin_name(plugin) == name:
+            return {} if isinstance(plugin, str) else plugin[name]
+    return None
+
+
+def wrap_plugin_event(config, plugin_name, event, wrapper):
+    """ Replace a plugin event handler (e.g. on_post_build) with wrapper(handler) """
+    plugin = config.plugins[plugin_name]
+    events = config.plugins.events[event]
+    for index, handler in enumerate(events):
+        if getattr(handler, '__self__', None) is plugin or getattr(handler, 'plugin_name', None) == plugin_name:
+            new_handler = wrapper(handler)
+
+            def wrapped(*args, **kwargs):
+                return new_handler(*args, **kwargs)
+            wrapped.plugin_name = plugin_name
+            events[index] = wrapped
+            return
+
+
+def replace_plugin_event(config, plugin_name, event, function):
+    """ Run a function instead of a plugin event handler """
+    wrap_plugin_event(config, plugin_name, event, lambda handler: function)
+
+
+def profile_plugin_events(config, profiler):
+    """ Record the slow plugin steps (search index, PDF render) as profiler phases """
+    for plugin_name, event, phase in PROFILED_PLUGIN_EVENTS:
+        if plugin_name not in config.plugins:
+            continue
+
+        def wrapper(handler, phase=phase):
+            def profiled(*args, **kwargs):
+                with profiler.phase(phase):
+                    return handler(*args, **kwargs)
+            return profiled
+        wrap_plugin_event(config, plugin_name, event, wrapper)
+
+
+def get_pdf_cache_path(config_file, pdf_cache_folder):
+    """ Return the PDF output path (relative to the site folder) for a language
+        and the path of its PDF in the cache """
+    raw_config, config_file_path = read_language_config(config_file)
+    settings = get_plugin_settings(raw_config['plugins'], PDF_PLUGIN)
+    output_path = settings.get('output_path', DEFAULT_PDF_OUTPUT_PATH)
+    key = pdf_cache_key(raw_config, os.path.dirname(config_file_path), settings)
+    return output_path, cached_pdf_path(pdf_cache_folder, output_path, key)
+
+
+def build_with_pdf_cache(config, config_file, dirty, pdf_cache_folder):
+    """ Build a language with the PDF plugin, using a cached PDF if the inputs didn't change.
+        On a cache hit, the plugin still runs for each page (it adds the PDF link)
+        but the PDF is not rendered again """
+    output_path, cached_path = get_pdf_cache_path(config_file, pdf_cache_folder)
+    pdf_file = os.path.join(config['site_dir'], output_path)
+
+    if os.path.exists(cached_path):
+        print(f'PDF cache hit for {output_path}, not rendering it again')
+        replace_plugin_event(config, PDF_PLUGIN, 'post_build', lambda config: restore_pdf(cached_path, pdf_file))
+        mkdocs_build(config, dirty=dirty)
+        return
+
+    print(f'PDF cache miss for {output_path}')
+    mkdocs_build(config, dirty=dirty)
+    store_pdf(pdf_file, cached_path)
+
+
+def build_incremental(config, config_file, pages_cache_folder):
+    """ Build only the pages with changed inputs (see incremental.py).
+        Return False if a full build is required (page titles changed) """
+    raw_config, _ = read_language_config(config_file)
+    plugin = IncrementalPlugin(pages_manifest_path(pages_cache_folder, config['site_dir']), raw_config)
+    config.plugins[PLUGIN_NAME] = plugin
+    mkdocs_build(config, dirty=True)
+    return not plugin.full_build_required
+
+
+def build_language(
+    config_file, dirty, pdf=True, pdf_cache_folder=None, render_pdf=True, profiler=None, pages_cache_folder=None,
+):
+    """ Build the site for a single language config file.
+        If a PDF cache folder is defined, unchanged PDF files are not rendered again.
+        With render_pdf=False the PDF plugin adds its links to the pages but the PDF
+        is not rendered (see build_pdf).
+        If a pages cache folder is defined, only the changed pages are built again
+        (not possible if the PDF is rendered, it needs all the pages) """
+    config = load_language_config(config_file, pdf=pdf)
+    if profiler and profiler.enabled:
+        profile_plugin_events(config, profiler)
+    if pdf and PDF_PLUGIN in config.plugins:
+        if not render_pdf:
+            replace_plugin_event(config, PDF_PLUGIN, 'post_build', lambda config: None)
+        else:
+            pages_cache_folder = None
+            if pdf_cache_folder:
+                build_with_pdf_cache(config, config_file, dirty, pdf_cache_folder)
+                return
+    if pages_cache_folder:
+        if not build_incremental(config, config_file, pages_cache_folder):
+            print('Page titles changed, building all the pages')
+            build_language(
+                config_file, dirty, pdf=pdf, render_pdf=render_pdf, profiler=profiler,
+                pages_cache_folder=pages_cache_folder,
+            )
+        return
+    mkdocs_build(config, dirty=dirty)
+
+
+def get_site_dir(config_file):
+    """ Absolute site folder of a language config file """
+    raw_config, config_file_path = read_language_config(config_file)
+    return os.path.abspath(os.path.join(os.path.dirname(config_file_path), raw_config['site_dir']))
+
+
+def clean_language_sites(site_folder, config_files, languages, keep=None):
+    """ Remove the files of some languages from the site folder.
+        The folders of other languages (e.g. /es inside the EN site folder)
+        and the keep paths (relative to the site folder) are not touched """
+    keep = keep or set()
+    site_dirs = {language: get_site_dir(config_file) for language, config_file in config_files.items()}
+    other_dirs = {site_dir for language, site_dir in site_dirs.items() if language not in languages}
+    for language in languages:
+        for root, dirs, files in os.walk(site_dirs[language]):
+            dirs[:] = [folder for folder in dirs if os.path.join(root, folder) not in other_dirs]
+            for file in files:
+                path = os.path.join(root, file)
+                if os.path.relpath(path, site_folder) not in keep:
+                    os.remove(path)
+
+
+def site_pdf_files(site_folder):
+    """ Paths (relative to the site folder) of the PDF files in the site folder """
+    pdf_files = set()
+    for root, _, files in os.walk(site_folder):
+        pdf_files |= {os.path.relpath(os.path.join(root, file), site_folder) for file in files if file.endswith('.pdf')}
+    return pdf_files
+
+
+def build_pdf(config_file, pdf_cache_folder=None, profiler=None):
+    """ Render the PDF file for a language and copy it to its site folder.
+        The site is built in a temporary folder, the HTML files of the final site are not changed """
+    site_dir = get_site_dir(config_file)
+
+    if pdf_cache_folder:
+        output_path, cached_path = get_pdf_cache_path(config_file, pdf_cache_folder)
+        if os.path.exists(cached_path):
+            print(f'PDF cache hit for {output_path}, not rendering it again')
+            restore_pdf(cached_path, os.path.join(site_dir, output_path))
+            return
+
+    with tempfile.TemporaryDirectory() as tmp_site_dir:
+        config = load_language_config(config_file, site_dir=tmp_site_dir)
+        if profiler and profiler.enabled:
+            profile_plugin_events(config, profiler)
+        output_path = config.plugins[PDF_PLUGIN].config['output_path']
+        mkdocs_build(config)
+        tmp_pdf_file = os.path.join(tmp_site_dir, output_path)
+        if pdf_cache_folder:
+            store_pdf(tmp_pdf_file, cached_path)
+        restore_pdf(tmp_pdf_file, os.path.join(site_dir, output_path))
+
+
+def get_docs_size(config_file):
+    """ Total size (bytes) of the docs folder used by a language config file """
+    config, config_file_path = read_language_config(config_file)
+    docs_folder = os.path.join(os.path.dirname(config_file_path), config['docs_dir'])
+    size = 0
+    for root, dirs, files in os.walk(docs_folder):
+        for file in files:
+            size += os.path.getsize(os.path.join(root, file))
+    return size
+
+
+def sort_languages(config_files):
+    """ Languages sorted by the size of their docs folder, largest first """
+    sizes = {language: get_docs_size(config_file) for language, config_file in config_files.items()}
+    return sorted(config_files, key=lambda language: sizes[language], reverse=True)
+
+
+def run_for_languages(function, config_files, languages, jobs, action, profiler=None, **kwargs):
+    """ Call function(config_file, profiler=profiler, **kwargs) for each language (in this order),
+        sequentially or in a pool of jobs processes.
+        Each language is a profiler phase (recorded in the worker processes and then merged) """
+    profiler = profiler or Profiler(enabled=False)
+    if jobs <= 1:
+        for language in languages:
+            print(f'{action} for {language}')
+            with profiler.phase(action, language):
+                function(config_files[language], profiler=profiler, **kwargs)
+        return
+
+    print(f'{action} for {len(languages)} languages with {jobs} jobs: {", ".join(languages)}')
+    with profiler.phase(f'{action} ({jobs} jobs)'), ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for language in languages:
+            if profiler.enabled:
+                future = executor.submit(run_profiled, function, action, language, config_files[language], **kwargs)
+            else:
+                future = executor.submit(function, config_files[language], **kwargs)
+            futures[future] = language
+        for future in as_completed(futures):
+            language = futures[future]
+            try:
+                records = future.result()
+            except Exception as e:
+                raise Exception(f'Error in "{action}" for language "{language}": {e}') from e
+            if profiler.enabled:
+                profiler.add_records(records, language)
+            print(f'{action} for {language}: done')
+
+
+def build_pdfs(config_files, jobs=1, pdf_cache_folder=None, profiler=None):
+    """ Render the PDF files for all the languages (config_files: dict language -> config file) """
+    languages = sort_languages(config_files)
+    run_for_languages(
+        build_pdf, config_files, languages, jobs, 'Building PDF',
+        profiler=profiler, pdf_cache_folder=pdf_cache_folder,
+    )
+
+
+def build_sites(
+    config_files, site_folder, jobs=1, keep=None, pdf_cache_folder=None, pdf=True, deferred_pdf=False, profiler=None,
+    languages=None, pages_cache_folder=None,
+):
+    """ Build the site for all languages.
+        config_files: dict with key=language and value=mkdocs config file
+        (or in-memory config, see in_memory_config).
+        The site folder is cleaned once, before all the builds, so each language
+        can be built as "dirty" (the EN build at the root of the site folder won't
+        remove other language sub-folders). The largest languages are built first.
+        keep: paths (relative to the site folder) not removed while cleaning
+        pdf_cache_folder: folder to reuse PDF files from previous builds
+        pdf: False to build the sites without PDF files. The PDF files from previous
+        builds are kept, the nav still links to them (see helpers.add_pdf_url)
+        deferred_pdf: build the HTML for all languages first and then the PDF files
+        profiler: record each step as a profiler phase
+        languages: build only these languages (all by default). Only their files
+        are removed from the site folder
+        pages_cache_folder: build only the changed pages (see incremental.py). The site
+        folder is not cleaned and the PDF files are built at the end (as deferred_pdf) """
+    profiler = profiler or Profiler(enabled=False)
+    deferred_pdf = deferred_pdf or bool(pages_cache_folder)
+    if not pdf:
+        keep = (keep or set()) | site_pdf_files(str(site_folder))
+
+    with profiler.phase('clean site'):
+        if pages_cache_folder:
+            print(f'Incremental build, only removing old pages from {site_folder}')
+        elif languages is not None:
+            print(f'Cleaning site folder {site_folder} for {", ".join(languages)}')
+            clean_language_sites(str(site_folder), config_files, languages, keep)
+        elif keep and os.path.exists(site_folder):
+            print(f'Cleaning site folder {site_folder}')
+            prune_folder(str(site_folder), keep)
+        else:
+            print(f'Cleaning site folder {site_folder}')
+            clean_directory(str(site_folder))
+
+    if languages is not None:
+        config_files = {language: config_files[language] for language in languages}
+    ordered_languages = sort_languages(config_files)
+    run_for_languages(
+        build_language, config_files, ordered_languages, jobs, 'Building site', profiler=profiler,
+        dirty=True, pdf=pdf, pdf_cache_folder=pdf_cache_folder, render_pdf=not deferred_pdf,
+        pages_cache_folder=pages_cache_folder,
+    )
+    if pdf and deferred_pdf:
+        build_pdfs(config_files, jobs=jobs, pdf_cache_folder=pdf_cache_folder, profiler=profiler)
@@ -0,0 +1,191 @@
+""" Precompressed copies (.gz and .br) of the built site files.
+    Servers can send them as they are instead of compressing on every request.
+    Brotli is optional (pip install brotli).
+    Compressed data can be kept in a cache folder (by content hash), so files
+    generated again with the same content (e.g. after a clean build) are not
+    compressed again.
+    The compressed copies written are listed in a manifest, only those are
+    removed when their source file is removed (other .gz/.br files in the
+    site, e.g. downloads, are never touched). """
+
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import hashlib
+import os
+import threading
+import time
+from render import load_manifest, save_manifest
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+COMPRESSIBLE_EXTENSIONS = ('.html', '.css', '.js', '.json', '.xml', '.svg', '.txt', '.map')
+# Small files don't get smaller
+MIN_SIZE = 256
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+# Remove cached compressed data not used for this time (seconds)
+CACHE_MAX_AGE = 7 * 24 * 3600
+COMPRESS_MANIFEST = 'manifest-compress.json'
+
+
+def available_encodings():
+    """ Content encodings (and file extension) we can generate, preferred first """
+    encodings = []
+    if brotli is not None:
+        encodings.append(('br', '.br'))
+    encodings.append(('gzip', '.gz'))
+    return encodings
+
+
+def is_compressible(path):
+    return path.endswith(COMPRESSIBLE_EXTENSIONS)
+
+
+def is_compressed_fresh(path, compressed_path):
+    """ The compressed copy gets the mtime of its source file.
+        It's up to date if both mtimes are the same """
+    try:
+        return os.stat(compressed_path).st_mtime_ns == os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def compress_data(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    # mtime=0: same input, same output
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def write_file(path, data, mtime_ns=None):
+    """ Write a file atomically (optionally with a given mtime) """
+    # Different threads can write the same (cache) file
+    tmp_path = f'{path}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    if mtime_ns is not None:
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+    os.replace(tmp_path, path)
+
+
+def get_compressed(data, encoding, cache_folder=None):
+    """ Compressed data for an encoding, from the cache folder if possible.
+        Return the compressed data and whether it came from the cache """
+    if not cache_folder:
+        return compress_data(data, encoding), False
+    level = BROTLI_QUALITY if encoding == 'br' else GZIP_LEVEL
+    cached_path = os.path.join(cache_folder, f'{hashlib.sha256(data).hexdigest()}.{encoding}{level}')
+    try:
+        with open(cached_path, 'rb') as f:
+            compressed = f.read()
+        # Recently used, see prune_cache
+        os.utime(cached_path)
+        return compressed, True
+    except FileNotFoundError:
+        pass
+    compressed = compress_data(data, encoding)
+    write_file(cached_path, compressed)
+    return compressed, False
+
+
+def compress_file(path, encodings, cache_folder=None):
+    """ Write the compressed siblings of a file that are not up to date.
+        Return a dict with the bytes written and the number of copies taken from the cache """
+    result = {'bytes_written': 0, 'reused': 0}
+    pending = [
+        (encoding, path + extension)
+        for encoding, extension in encodings
+        if not is_compressed_fresh(path, path + extension)
+    ]
+    if not pending:
+        return result
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    fs = os.stat(path)
+    for encoding, compressed_path in pending:
+        compressed, reused = get_compressed(data, encoding, cache_folder)
+        write_file(compressed_path, compressed, fs.st_mtime_ns)
+        result['bytes_written'] += len(compressed)
+        result['reused'] += reused
+    return result
+
+
+def find_site_files(site_folder):
+    """ Site files to compress """
+    to_compress = []
+    for root, _, files in os.walk(site_folder):
+        for name in files:
+            path = os.path.join(root, name)
+            if is_compressible(name) and os.path.getsize(path) >= MIN_SIZE:
+                to_compress.append(path)
+    return to_compress
+
+
+def find_orphans(site_folder, generated):
+    """ Compressed copies written by previous runs (paths relative to the site folder)
+        whose source file was removed """
+    orphans = []
+    for rel_path in generated:
+        path = os.path.join(site_folder, rel_path)
+        if os.path.exists(path) and not os.path.exists(os.path.splitext(path)[0]):
+            orphans.append(path)
+    return orphans
+
+
+def prune_cache(cache_folder, max_age=CACHE_MAX_AGE):
+    """ Remove the cache files not used recently """
+    if not cache_folder or not os.path.isdir(cache_folder):
+        return
+    limit = time.time() - max_age
+    for entry in os.scandir(cache_folder):
+        if entry.stat().st_mtime < limit:
+            os.remove(entry.path)
+
+
+def precompress_site(site_folder, workers=None, cache_folder=None, manifest_path=None):
+    """ Write .gz (and .br) copies of the text files in the site folder.
+        Files with up to date copies are skipped. zlib and brotli release
+        the GIL so a thread pool compresses files in parallel.
+        manifest_path: list of the copies written, to remove them with their source file
+        (without a manifest no compressed file is removed)
+        Return a dict with stats """
+    start = time.perf_counter()
+    encodings = available_encodings()
+    to_compress = find_site_files(site_folder)
+    manifest = load_manifest(manifest_path)
+    orphans = find_orphans(site_folder, manifest['files'])
+    for path in orphans:
+        os.remove(path)
+    if cache_folder:
+        os.makedirs(cache_folder, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda path: compress_file(path, encodings, cache_folder), to_compress))
+    prune_cache(cache_folder)
+    manifest['files'] = {
+        os.path.relpath(path + extension, site_folder): True for path in to_compress for _, extension in encodings
+    }
+    save_manifest(manifest_path, manifest)
+
+    written = [result for result in results if result['bytes_written']]
+    stats = {
+        'encodings': [encoding for encoding, _ in encodings],
+        'files_compressed': len(written),
+        'files_skipped': len(results) - len(written),
+        'files_removed': len(orphans),
+        'copies_from_cache': sum(result['reused'] for result in results),
+        'bytes_written': sum(result['bytes_written'] for result in results),
+        'duration': time.perf_counter() - start,
+    }
+    print(
+        f'Precompressed {stats["files_compressed"]} files ({", ".join(stats["encodings"])}), '
+        f'{stats["copies_from_cache"]} copies from cache, '
+        f'{stats["files_skipped"]} up to date, {stats["files_removed"]} removed, '
+        f'{stats["bytes_written"]} bytes written in {stats["duration"]:.2f}s'
+    )
+    return stats
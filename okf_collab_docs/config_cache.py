@@ -0,0 +1,68 @@
+""" Cache for the resolved language configs (before rendering the MD files).
+    The key is a hash of the raw content of the base and custom config files
+    (a cache hit doesn't parse them), the environment and the source code of
+    this tool (so changes in the resolution rules invalidate it) """
+
+import functools
+import glob
+import os
+import pickle
+from render import hash_data, hash_file
+
+
+TOOL_FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+
+@functools.lru_cache(maxsize=None)
+def tool_hash():
+    """ Hash of the Python files of this tool (once per process) """
+    files = sorted(glob.glob(os.path.join(glob.escape(TOOL_FOLDER), '*.py')))
+    return hash_data([[os.path.basename(path), hash_file(path)] for path in files])
+
+
+def config_cache_key(base_source, custom_source, env):
+    """ base_source, custom_source: raw content of the config files """
+    return hash_data({
+        'base': base_source,
+        'custom': custom_source,
+        'env': env,
+        'tool': tool_hash(),
+    })
+
+
+def config_cache_file(cache_folder, env):
+    return os.path.join(cache_folder, f'configs-{env}.pickle')
+
+
+def load_cached_configs(cache_file, key):
+    """ Resolved configs (dict language -> config) saved for this key, None if not found """
+    try:
+        with open(cache_file, 'rb') as f:
+            data = pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return None
+    if data.get('key') != key:
+        return None
+    return data['configs']
+
+
+def save_cached_configs(cache_file, key, configs):
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_file = f'{cache_file}.tmp'
+    with open(tmp_file, 'wb') as f:
+        pickle.dump({'key': key, 'configs': configs}, f)
+    os.replace(tmp_file, cache_file)
+
+
+def write_if_changed(path, content):
+    """ Write a text file only if its content changed (its modification time
+        is kept otherwise). Return True if the file was written """
+    try:
+        with open(path) as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'w') as f:
+        f.write(content)
+    return True
@@ -0,0 +1,188 @@
+""" Long-lived build daemon (run.py daemon) and its client (run.py daemon-build).
+    The daemon imports mkdocs, the theme and plugins used by the project,
+    GitPython and Jinja once, and keeps the compiled Jinja templates between
+    builds. Build requests are JSON lines on a local Unix socket, handled one
+    at a time:
+        {"command": "build", "languages": ["es"], "phases": ["config", "site"], "options": {...}}
+    The output of the build is sent back as {"output": "line"} messages and
+    the last message is {"status": "ok"} or {"status": "error", "error": "..."} """
+
+from contextlib import redirect_stdout
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import traceback
+
+
+PHASES = ('config', 'site', 'pdf')
+DAEMON_SOCKET = 'daemon.sock'
+
+
+def daemon_socket_path(paths):
+    return paths['cache_folder'] / DAEMON_SOCKET
+
+
+def send_message(wfile, message):
+    wfile.write(json.dumps(message).encode('utf-8') + b'\n')
+    wfile.flush()
+
+
+class OutputWriter(io.TextIOBase):
+    """ Text stream sending each output line to the client """
+    # Used by click.echo to check the stream is a valid text stream
+    encoding = 'utf-8'
+    errors = 'strict'
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+        self.pending = ''
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self.pending += text
+        *lines, self.pending = self.pending.split('\n')
+        for line in lines:
+            send_message(self.wfile, {'output': line})
+        return len(text)
+
+    def flush(self):
+        if self.pending:
+            send_message(self.wfile, {'output': self.pending})
+            self.pending = ''
+
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+
+    def run_build(self, request):
+        """ Run a build request sending its output and log warnings/errors (e.g. from mkdocs)
+            to the client. The working directory is restored after each build """
+        cwd = os.getcwd()
+        output = OutputWriter(self.wfile)
+        log_handler = logging.StreamHandler(output)
+        log_handler.setLevel(logging.WARNING)
+        log_handler.setFormatter(logging.Formatter('%(levelname)-7s -  %(message)s'))
+        logging.getLogger().addHandler(log_handler)
+        try:
+            with redirect_stdout(output):
+                self.server.build(request)
+        finally:
+            logging.getLogger().removeHandler(log_handler)
+            output.flush()
+            os.chdir(cwd)
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            command = request.get('command', 'build')
+            if command == 'stop':
+                send_message(self.wfile, {'output': 'Stopping the build daemon'})
+                # shutdown() waits for the serve loop, that is running this handler
+                threading.Thread(target=self.server.shutdown).start()
+            elif command == 'build':
+                self.run_build(request)
+            elif command != 'ping':
+                raise Exception(f'Unknown daemon command "{command}"')
+        except BrokenPipeError:
+            print('Client disconnected')
+            return
+        except Exception as e:
+            traceback.print_exc()
+            send_message(self.wfile, {'status': 'error', 'error': f'{type(e).__name__}: {e}'})
+            return
+        send_message(self.wfile, {'status': 'ok'})
+
+
+def is_daemon_running(socket_path):
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+
+
+def new_daemon_server(socket_path, build):
+    """ Unix socket server running build(request) for each build request.
+        Requests are handled one at a time (others wait in the socket backlog) """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise Exception('Unix sockets are not available on this system')
+    if os.path.exists(socket_path):
+        if is_daemon_running(socket_path):
+            raise Exception(f'A build daemon is already running on {socket_path}')
+        # Left by a daemon that didn't stop cleanly
+        os.remove(socket_path)
+    os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+    server = socketserver.UnixStreamServer(str(socket_path), DaemonHandler)
+    # Only for this user
+    os.chmod(socket_path, 0o600)
+    server.build = build
+    return server
+
+
+def serve_daemon(socket_path, build, warm_up=None):
+    """ Run the daemon until a stop request (or Ctrl+C) """
+    server = new_daemon_server(socket_path, build)
+    try:
+        if warm_up:
+            warm_up()
+        print(f'Build daemon listening on {socket_path}')
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        print('Build daemon stopped')
+
+
+def send_request(socket_path, request, echo=print):
+    """ Send a request to the daemon and echo its output.
+        Return the final status message """
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(socket_path))
+    except OSError as e:
+        raise Exception(
+            f'No build daemon running on {socket_path} ({e}). '
+            'Start it with "python3 okf_collab_docs/run.py daemon"'
+        ) from e
+    with sock, sock.makefile('rwb') as stream:
+        send_message(stream, request)
+        for line in stream:
+            message = json.loads(line)
+            if 'output' in message:
+                echo(message['output'])
+            else:
+                return message
+    raise Exception('The build daemon closed the connection before finishing the request')
+
+
+def warm_up_mkdocs(base_config):
+    """ Import the theme and the plugins used by the project, the first build
+        in the daemon doesn't pay for it """
+    from mkdocs.plugins import get_plugins
+    from mkdocs.utils import get_theme_dir
+
+    theme = base_config.get('theme', {})
+    theme_name = theme.get('name') if isinstance(theme, dict) else theme
+    if theme_name:
+        get_theme_dir(theme_name)
+    names = [list(plugin)[0] if isinstance(plugin, dict) else plugin for plugin in base_config.get('plugins', [])]
+    plugins = get_plugins()
+    for name in names:
+        if name not in plugins:
+            continue
+        try:
+            plugins[name].load()
+        except Exception as e:
+            print(f'Unable to load the mkdocs plugin {name}: {e}')
@@ -1,8 +1,31 @@
 from pathlib import Path
 import os
 import shutil
+import time
 import yaml
-from jinja2 import Template
+from materialize import DEFAULT_STRATEGY, materialize
+from reachability import reachable_files
+from render import (
+    MD_MANIFEST_VERSION,
+    format_walk_stats,
+    hash_data,
+    is_copy_entry_fresh,
+    is_md_entry_fresh,
+    is_template_free,
+    load_manifest,
+    new_jinja_env,
+    new_walk_stats,
+    prune_folder,
+    render_md_files,
+    save_manifest,
+    stat_signature,
+    walk_docs,
+)
+
+
+# C (libyaml) loader and dumper are much faster, use them when available
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 
 
 def get_lang_setting(cfg_dict, lang, key):
@@ -24,55 +47,161 @@ def get_list_setting(cfg_list, key):
             return dct[key]
 
 
-def _update_md_folder(docs_folder, context, fix_folder_fn):
-    """ Update the MD files with extra values within a folder """
+def overlay(base, **changes):
+    """ Copy-on-write layer over a config dict: a new dict with the changed keys.
+        Other values are shared with base (not copied), base is never modified """
+    return dict(base, **changes)
+
+
+def overlay_list_setting(cfg_list, key, **changes):
+    """ Copy-on-write layer over a list of dicts (e.g. plugins): a new list where
+        the settings for key are overlaid with changes. Other items are shared """
+    return [
+        {key: overlay(dct[key], **changes)} if list(dct.keys())[0] == key else dct
+        for dct in cfg_list
+    ]
+
+
+def _update_file(orig_file, dest_file, entry, context, search_path, stats, strategy=DEFAULT_STRATEGY):
+    """ Update a single file from the docs folder (if required).
+        Non MD files are materialized with the strategy (copy, hardlink, etc).
+        Return the new manifest entry or None for a MD file that needs to be rendered """
+    is_md = orig_file.endswith(".md")
+    if is_md:
+        fresh = is_md_entry_fresh(entry, orig_file, dest_file, context, search_path)
+    else:
+        fresh = is_copy_entry_fresh(entry, orig_file, dest_file)
+    if fresh:
+        stats['files_skipped'] += 1
+        return entry
+    if is_md and not is_template_free(orig_file):
+        print(f'Fixing {orig_file} -> {dest_file}')
+        return None
+
+    # Copy the file (MD files without Jinja markup don't need to be rendered)
+    if is_md:
+        # Always a real copy, it could be rendered into the same file later
+        shutil.copyfile(orig_file, dest_file)
+    else:
+        materialize(orig_file, dest_file, strategy)
+    entry = {
+        'stat': stat_signature(orig_file),
+        'out': stat_signature(dest_file),
+    }
+    if is_md:
+        print(f'Copying {orig_file} -> {dest_file} (no template markup)')
+        entry['plain'] = True
+        stats['files_fast_path'] += 1
+    else:
+        stats['files_copied'] += 1
+    stats['bytes_written'] += entry['out'][0]
+    return entry
+
+
+def _update_md_folder(
+    docs_folder, fixed_folder, context, manifest, env, workers=1, strategy=DEFAULT_STRATEGY, include=None,
+):
+    """ Update the MD files with extra values within a folder (and all its sub-folders).
+        Each file is visited only once. Files still valid in the manifest are skipped.
+        include: only these files (relative paths) are updated, others are excluded
+        Return the stats for this run """
     if not os.path.exists(docs_folder):
         raise Exception(f'Docs folder not found: {docs_folder} at {os.getcwd()}')
-    for root, dirs, files in os.walk(docs_folder):
+    stats = new_walk_stats()
+    start = time.perf_counter()
+    previous_entries = manifest['files']
+    files_entries = {}
+    search_path = env.loader.searchpath[0]
+    render_jobs = []
+    for root, rel_root, files in walk_docs(docs_folder):
+        dest_folder = os.path.normpath(os.path.join(fixed_folder, rel_root))
+        os.makedirs(dest_folder, exist_ok=True)
         for file in files:
+            rel_path = os.path.normpath(os.path.join(rel_root, file))
+            if include is not None and rel_path not in include:
+                print(f'Excluding {rel_path} (not reachable from the nav)')
+                stats['files_excluded'] += 1
+                continue
             print(f'Checking file {root} {file}')
             orig_file = os.path.join(root, file)
-            dest_file = os.path.join(fix_folder_fn(root), file)
-            if file.endswith(".md"):
-                print(f'Fixing {orig_file} -> {dest_file}')
-                with open(orig_file, "r") as f:
-                    template = Template(f.read())
-                with open(dest_file, "w") as f:
-                    f.write(template.render(context))
+            dest_file = os.path.join(dest_folder, file)
+            entry = previous_entries.get(rel_path)
+            new_entry = _update_file(orig_file, dest_file, entry, context, search_path, stats, strategy)
+            if new_entry is None:
+                render_jobs.append((rel_path, orig_file, dest_file, entry))
             else:
-                # Copy the file
-                shutil.copyfile(orig_file, dest_file)
+                files_entries[rel_path] = new_entry
+
+    entries = render_md_files([job[1:] for job in render_jobs], env, context, workers=workers)
+    for (rel_path, *_), entry in zip(render_jobs, entries):
+        files_entries[rel_path] = entry
+        stats['files_rendered'] += 1
+        stats['bytes_written'] += entry['out'][0]
 
-        for dir in dirs:
-            _update_md_folder(os.path.join(root, dir), context, fix_folder_fn)
+    # Files removed from the docs folder are not in the manifest anymore
+    manifest['files'] = files_entries
+    stats['duration'] = time.perf_counter() - start
+    return stats
 
 
-def update_md_files(docs_folder, config_folder, context):
+def update_md_files(
+    docs_folder, config_folder, context, cache_folder=None, stats=None, workers=1, jinja_env=None,
+    strategy=DEFAULT_STRATEGY, nav=None, snippet_paths=None,
+):
     """ Update the MD files with extra values.
-        Return a fixed folder path to use in the config file. """
+        Return a fixed folder path to use in the config file.
+        If a nav is defined, only the files reachable from it (see reachability.py)
+        are rendered or copied. snippet_paths: pymdownx.snippets base paths (absolute)
+        If a cache folder is defined, a manifest from previous runs is used
+        to re-render only changed files (source, used context or included templates).
+        If a stats dict is defined, it's updated with the counters for this run.
+        With more than one worker, MD files are rendered in a process pool.
+        The same Jinja environment (jinja_env) should be used for all languages in a build.
+        By default, one is created to load templates from the docs root folder.
+        Other files are materialized with the strategy (see materialize.py). """
 
     # Change dir to fit the config folder
     pwd = os.getcwd()
     os.chdir(config_folder)
-    parts = docs_folder.split('/')
-    parts[-1] = f"fixed-{parts[-1]}"
-    fixed_folder = '/'.join(parts)
-    print(f'Fixing MD files in {docs_folder} -> {fixed_folder}')
-
-    if os.path.exists(fixed_folder):
-        print(f'Cleaning the fixed folder {fixed_folder}')
-        shutil.rmtree(fixed_folder)
-
-    def fix_folder_fn(folder):
-        dest_folder = folder.replace(docs_folder, fixed_folder)
-        if not os.path.exists(dest_folder):
-            os.mkdir(dest_folder)
-        return dest_folder
-
-    _update_md_folder(docs_folder, context, fix_folder_fn)
+    try:
+        parts = docs_folder.split('/')
+        parts[-1] = f"fixed-{parts[-1]}"
+        fixed_folder = '/'.join(parts)
+        print(f'Fixing MD files in {docs_folder} -> {fixed_folder}')
+
+        manifest_path = None
+        if cache_folder:
+            # The same docs folder name can be used from different places
+            folder_id = hash_data(os.path.abspath(fixed_folder))[:12]
+            manifest_path = os.path.join(cache_folder, f'manifest-{parts[-1]}-{folder_id}.json')
+        manifest = load_manifest(manifest_path, MD_MANIFEST_VERSION)
+
+        if not manifest['files'] and os.path.exists(fixed_folder):
+            print(f'Cleaning the fixed folder {fixed_folder}')
+            shutil.rmtree(fixed_folder)
+
+        if jinja_env is None:
+            # Included templates are searched from the docs root folder
+            bytecode_folder = os.path.join(cache_folder, 'jinja') if cache_folder else None
+            jinja_env = new_jinja_env(os.path.dirname(docs_folder.rstrip('/')), bytecode_folder)
+        include = None
+        if nav is not None and os.path.exists(docs_folder):
+            include = reachable_files(docs_folder, nav, snippet_paths)
+        run_stats = _update_md_folder(
+            docs_folder, fixed_folder, context, manifest, jinja_env, workers=workers, strategy=strategy, include=include,
+        )
 
-    # Back to previous folder
-    os.chdir(pwd)
+        removed = prune_folder(fixed_folder, manifest['files'])
+        for rel_path in removed:
+            print(f'Removed {rel_path} from {fixed_folder} (no longer in {docs_folder})')
+        run_stats['files_removed'] = len(removed)
+        save_manifest(manifest_path, manifest)
+        print(format_walk_stats(run_stats))
+        if stats is not None:
+            stats.update(run_stats)
+    finally:
+        # Back to previous folder (also on errors, e.g. in the build daemon)
+        os.chdir(pwd)
     return fixed_folder
 
 
@@ -121,21 +250,55 @@ def update_gh_action_language_files(gh_workflow_file_path, langs):
     f.close()
 
 
+def load_yaml(stream):
+    """ Parse YAML data (string or open file), with the C loader if available """
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def dump_yaml(data, stream=None):
+    """ Dump data as YAML (return a string if no stream is defined), with the C dumper if available """
+    return yaml.dump(data, stream, Dumper=YAML_DUMPER)
+
+
+def read_yaml_source(yaml_path):
+    """ Raw content of a YAML file (to detect changes without parsing it) """
+    if not os.path.exists(yaml_path):
+        raise Exception(f'YAML file does not exists {yaml_path}')
+    with open(yaml_path) as f:
+        return f.read()
+
+
 def get_yaml(yaml_path):
     if not os.path.exists(yaml_path):
         raise Exception(f'YAML file does not exists {yaml_path}')
     try:
-        yaml_data = yaml.safe_load(open(yaml_path))
+        yaml_data = load_yaml(open(yaml_path))
     except yaml.parser.ParserError as e:
         raise Exception(f'YAML file is not valid YAML {yaml_path}') from e
     return yaml_data
 
 
+def get_language_config_files(paths, languages=None):
+    """ Final mkdocs config file for each language (all languages by default).
+        Return a dict with key=language and value=config file """
+    with open(paths['custom_config_file']) as f:
+        all_languages = list(load_yaml(f)['site_name'].keys())
+    for language in languages or []:
+        if language not in all_languages:
+            raise Exception(f'Language "{language}" not found. Available languages: {", ".join(all_languages)}')
+    return {
+        language: paths['base_config_folder'] / f'mkdocs-{language}.yml'
+        for language in all_languages
+        if not languages or language in languages
+    }
+
+
 def get_paths(base_folder):
     base_path = Path(base_folder)
     base_config_folder = base_path / 'conf'
     base_page_folder = base_path / 'page'
     site_folder = base_path / 'site'
+    cache_folder = base_path / '.cache'
     ret = {
         'base_folder': base_path,
         'base_config_folder': base_config_folder,
@@ -145,6 +308,7 @@ def get_paths(base_folder):
         'site_folder': site_folder,
         'user_assets_folder': base_page_folder / 'assets',
         'site_assets_folder': site_folder / 'assets',
+        'cache_folder': cache_folder,
     }
 
     return ret
@@ -164,16 +328,16 @@ def validate_index_lang_file(nav, lang):
 
 
 def add_pdf_url(config, wpdf_plugin, language):
-    """ Add a final PDF URL for this language config"""
+    """ Add a final PDF URL for this language config.
+        The extra and nav values are replaced (not changed) since they can be shared """
     base_url = config['site_url'].rstrip('/')
     rel_pdf_url = wpdf_plugin['output_path'].lstrip('/')
     if language == 'en':
-        config['extra']['pdf_url'] = f'{base_url}/{rel_pdf_url}'
+        pdf_url = f'{base_url}/{rel_pdf_url}'
     else:
-        config['extra']['pdf_url'] = f'{base_url}/{language}/{rel_pdf_url}'
-    config['nav'].append(
-        {'PDF': config['extra']['pdf_url']}
-    )
+        pdf_url = f'{base_url}/{language}/{rel_pdf_url}'
+    config['extra'] = overlay(config['extra'], pdf_url=pdf_url)
+    config['nav'] = config['nav'] + [{'PDF': pdf_url}]
 
 
 def validate_langs(custom_config):
@@ -0,0 +1,137 @@
+""" Page level incremental builds (build-local-site --incremental).
+    A manifest for each language records the inputs of each output page:
+    its fixed MD file and the snippets it includes. A global key covers the
+    inputs shared by all pages: the language config (nav, theme settings,
+    extra context, markdown extensions, plugins, etc), the theme template
+    files, the list of pages and the versions of the packages.
+    On later builds only the pages with changed inputs are rendered again;
+    a change in the global key renders all the pages.
+    Unchanged pages are skipped by mkdocs as in a "dirty" build and their
+    search index entries are restored from the manifest.
+    If the title of a rebuilt page changes (used in the nav of all pages)
+    a full build is required. """
+
+import hashlib
+import os
+from mkdocs.plugins import BasePlugin
+from pdf_cache import package_versions
+from render import hash_data, load_manifest, save_manifest, snippet_references, snippets_hash, stat_signature
+
+
+PLUGIN_NAME = 'okf-incremental'
+
+
+def pages_manifest_path(cache_folder, site_dir):
+    """ Manifest file of a language (by its site folder) """
+    site_id = hash_data(os.path.abspath(site_dir))[:12]
+    return os.path.join(cache_folder, f'pages-{site_id}.json')
+
+
+def snippets_base_paths(config):
+    base_path = config['mdx_configs'].get('pymdownx.snippets', {}).get('base_path', ['.'])
+    return [base_path] if isinstance(base_path, str) else list(base_path)
+
+
+def theme_signature(theme_dirs):
+    """ Paths, sizes and modification times of the theme template files """
+    files = []
+    for theme_dir in theme_dirs:
+        for root, _, names in os.walk(theme_dir):
+            for name in sorted(names):
+                path = os.path.join(root, name)
+                files.append([os.path.relpath(path, theme_dir), stat_signature(path)])
+    return hash_data(files)
+
+
+class IncrementalPlugin(BasePlugin):
+    """ mkdocs plugin added by the builder (not declared in the config files).
+        raw_config: the language config (dict, as in the YAML file) """
+
+    def __init__(self, manifest_path, raw_config):
+        self.load_config({})
+        self.manifest_path = manifest_path
+        self.raw_config = raw_config
+        self.full_build_required = False
+        self.stats = {'pages_built': 0, 'pages_skipped': 0}
+
+    def global_key(self, config, files):
+        return hash_data({
+            'config': self.raw_config,
+            'theme': theme_signature(config.theme.dirs),
+            'pages': sorted(file.src_uri for file in files.documentation_pages()),
+            'versions': package_versions(),
+        })
+
+    def page_inputs(self, file, base_paths):
+        with open(file.abs_src_path, 'rb') as f:
+            data = f.read()
+        references = snippet_references(data.decode('utf-8', errors='replace'))
+        return {'hash': hashlib.sha256(data).hexdigest(), 'deps': snippets_hash(references, base_paths)}
+
+    def on_files(self, files, config):
+        self.files = files
+        self.previous = load_manifest(self.manifest_path)
+        self.key = self.global_key(config, files)
+        self.old_pages = {} if self.previous.get('global') != self.key else self.previous['files']
+        base_paths = snippets_base_paths(config)
+        self.pages = {}
+        self.fresh = set()
+        for file in files.documentation_pages():
+            entry = self.page_inputs(file, base_paths)
+            old = self.old_pages.get(file.src_uri)
+            fresh = (
+                old is not None and old['hash'] == entry['hash'] and old['deps'] == entry['deps']
+                and os.path.exists(file.abs_dest_path)
+            )
+            if fresh:
+                self.fresh.add(file.src_uri)
+                entry = old
+            self.pages[file.src_uri] = entry
+            # Used by mkdocs (dirty builds) to skip unchanged pages
+            file.is_modified = (lambda fresh: lambda: not fresh)(fresh)
+        self.stats['pages_skipped'] = len(self.fresh)
+        self.stats['pages_built'] = len(self.pages) - len(self.fresh)
+        return files
+
+    def on_env(self, env, config, files):
+        """ Restore the titles (used in the nav) and search index entries of the skipped pages """
+        for file in files.documentation_pages():
+            if file.src_uri in self.fresh:
+                file.page.title = self.pages[file.src_uri]['title']
+        search = config.plugins.get('search')
+        self.search_entries = getattr(getattr(search, 'search_index', None), '_entries', None)
+        if self.search_entries is not None:
+            for src_uri in sorted(self.fresh):
+                self.search_entries.extend(self.pages[src_uri].get('search', []))
+            self.search_mark = len(self.search_entries)
+        return env
+
+    def on_page_context(self, context, page, config, nav):
+        """ Record the title and search index entries of a rebuilt page (runs after the search plugin) """
+        entry = self.pages[page.file.src_uri]
+        old = self.old_pages.get(page.file.src_uri)
+        if old is not None and old.get('title') != page.title:
+            # The title is used in the nav of the other pages
+            self.full_build_required = True
+        entry['title'] = page.title
+        if self.search_entries is not None:
+            entry['search'] = self.search_entries[self.search_mark:]
+            self.search_mark = len(self.search_entries)
+        return context
+
+    def on_post_build(self, config):
+        """ Remove the outputs no longer generated and save the manifest """
+        outputs = sorted(file.dest_uri for file in self.files)
+        for dest_uri in set(self.previous.get('outputs', [])) - set(outputs):
+            path = os.path.join(config['site_dir'], dest_uri)
+            if os.path.exists(path):
+                os.remove(path)
+        manifest = {
+            'version': self.previous['version'],
+            # Build all the pages next time if this build was not complete
+            'global': None if self.full_build_required else self.key,
+            'files': self.pages,
+            'outputs': outputs,
+        }
+        save_manifest(self.manifest_path, manifest)
+        print(f'Pages: {self.stats["pages_built"]} built, {self.stats["pages_skipped"]} unchanged')
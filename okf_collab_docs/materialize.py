@@ -0,0 +1,116 @@
+""" Materialize a file in a new place: copy it, hardlink it or clone it.
+    Strategies:
+     - copy: regular copy (shutil)
+     - hardlink: same file (inode) in both places, no data is written.
+       Never write into a hardlinked file, it would change the original one
+     - reflink: copy-on-write clone (Btrfs, XFS). Data blocks are shared until changed
+     - copy_file_range: copy in the kernel, without passing the data through Python
+       (can use server side copies or reflinks depending on the filesystem)
+    If a strategy is not supported (other filesystem or OS) the next fallback is used
+    and finally a regular copy. """
+
+import errno
+import os
+import shutil
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None
+
+
+STRATEGIES = ('copy', 'hardlink', 'reflink', 'copy_file_range')
+DEFAULT_STRATEGY = 'copy'
+# From linux/fs.h
+FICLONE = 0x40049409
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+_FALLBACKS = {
+    'copy': [],
+    'hardlink': ['copy'],
+    'reflink': ['copy_file_range', 'copy'],
+    'copy_file_range': ['copy'],
+}
+# Errors for "not supported here" (other filesystem, OS or kernel)
+_UNSUPPORTED_ERRORS = {
+    errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EINVAL, errno.ENOSYS,
+    errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTTY, errno.EBADF,
+}
+
+
+class UnsupportedStrategy(Exception):
+    pass
+
+
+def _copy(orig_file, dest_file):
+    shutil.copyfile(orig_file, dest_file)
+
+
+def _hardlink(orig_file, dest_file):
+    try:
+        os.link(orig_file, dest_file)
+    except OSError as e:
+        if e.errno in _UNSUPPORTED_ERRORS:
+            raise UnsupportedStrategy(str(e)) from e
+        raise
+
+
+def _reflink(orig_file, dest_file):
+    if fcntl is None:
+        raise UnsupportedStrategy('fcntl is not available')
+    with open(orig_file, 'rb') as src, open(dest_file, 'wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError as e:
+            if e.errno in _UNSUPPORTED_ERRORS:
+                raise UnsupportedStrategy(str(e)) from e
+            raise
+
+
+def _copy_file_range(orig_file, dest_file):
+    if not hasattr(os, 'copy_file_range'):
+        raise UnsupportedStrategy('copy_file_range is not available')
+    with open(orig_file, 'rb') as src, open(dest_file, 'wb') as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            try:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), min(remaining, COPY_CHUNK_SIZE))
+            except OSError as e:
+                if e.errno in _UNSUPPORTED_ERRORS:
+                    raise UnsupportedStrategy(str(e)) from e
+                raise
+            if copied == 0:
+                break
+            remaining -= copied
+
+
+_FUNCTIONS = {
+    'copy': _copy,
+    'hardlink': _hardlink,
+    'reflink': _reflink,
+    'copy_file_range': _copy_file_range,
+}
+
+
+def _remove(path):
+    """ Remove the destination file before creating it again.
+        Writing into an existing (maybe hardlinked) file could change other copies """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def materialize(orig_file, dest_file, strategy=DEFAULT_STRATEGY):
+    """ Create dest_file with the content of orig_file.
+        Return the strategy finally used """
+    if strategy not in STRATEGIES:
+        raise Exception(f'Unknown materialization strategy "{strategy}". Use one of: {", ".join(STRATEGIES)}')
+    for name in [strategy] + _FALLBACKS[strategy]:
+        _remove(dest_file)
+        try:
+            _FUNCTIONS[name](orig_file, dest_file)
+        except UnsupportedStrategy:
+            continue
+        return name
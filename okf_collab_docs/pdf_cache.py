@@ -0,0 +1,122 @@
+""" Content-addressed cache for the PDF files generated by the with-pdf plugin.
+    The key is a hash of everything used to render the PDF: the fixed docs
+    folder, the snippets included by its MD files, the nav, the PDF template
+    folder, the PDF event hook, the plugin settings and the versions of the
+    packages involved """
+
+from importlib import metadata
+import glob
+import os
+import shutil
+from render import hash_data, hash_file, snippet_references, snippets_hash, walk_docs
+
+
+# Other config settings used to render the PDF
+CONFIG_KEYS = ('site_name', 'site_url', 'use_directory_urls', 'theme', 'markdown_extensions', 'extra')
+PACKAGES = ('mkdocs', 'mkdocs-material', 'mkdocs-with-pdf', 'weasyprint', 'Markdown')
+# Loaded by the with-pdf plugin from the working directory (a module or a package)
+PDF_EVENT_HOOK = 'pdf_event_hook'
+
+
+def tree_hash(folder):
+    """ Hash of all the file paths and contents in a folder (None if it doesn't exist) """
+    if not folder or not os.path.isdir(folder):
+        return None
+    files = []
+    for root, rel_root, names in walk_docs(folder):
+        for name in names:
+            rel_path = os.path.normpath(os.path.join(rel_root, name))
+            files.append([rel_path, hash_file(os.path.join(root, name))])
+    return hash_data(files)
+
+
+def snippets_base_paths(markdown_extensions):
+    """ pymdownx.snippets base paths from the markdown_extensions setting (None if not enabled) """
+    for extension in markdown_extensions or []:
+        if extension == 'pymdownx.snippets':
+            return ['.']
+        if isinstance(extension, dict) and 'pymdownx.snippets' in extension:
+            base_path = (extension['pymdownx.snippets'] or {}).get('base_path', ['.'])
+            return [base_path] if isinstance(base_path, str) else list(base_path)
+    return None
+
+
+def docs_snippets_hash(docs_folder, base_paths):
+    """ Hash of each snippet file included by the MD files of a docs folder """
+    if base_paths is None or not os.path.isdir(docs_folder):
+        return None
+    references = set()
+    for root, _, names in walk_docs(docs_folder):
+        for name in names:
+            if name.endswith('.md'):
+                with open(os.path.join(root, name), encoding='utf-8', errors='replace') as f:
+                    references.update(snippet_references(f.read()))
+    return snippets_hash(sorted(references), base_paths)
+
+
+def event_hook_hash():
+    """ Hash of the PDF event hook module or package (None if there isn't one) """
+    module_file = f'{PDF_EVENT_HOOK}.py'
+    return {
+        'module': hash_file(module_file) if os.path.isfile(module_file) else None,
+        'package': tree_hash(PDF_EVENT_HOOK),
+    }
+
+
+def package_versions():
+    versions = {}
+    for package in PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+def pdf_cache_key(config, config_folder, settings):
+    """ Cache key for the PDF of a language.
+        config: the language mkdocs config (dict, as in the YAML file)
+        config_folder: folder of the config file (docs_dir is relative to it)
+        settings: the with-pdf plugin settings """
+    # The plugin uses the template path (and the event hook and
+    # snippets base paths) relative to the working directory
+    template_folder = settings.get('custom_template_path')
+    docs_folder = os.path.join(config_folder, config['docs_dir'])
+    data = {
+        'docs': tree_hash(docs_folder),
+        'snippets': docs_snippets_hash(docs_folder, snippets_base_paths(config.get('markdown_extensions'))),
+        'nav': config.get('nav'),
+        'template': tree_hash(template_folder),
+        'hook': event_hook_hash(),
+        'settings': settings,
+        'config': {key: config.get(key) for key in CONFIG_KEYS},
+        'versions': package_versions(),
+    }
+    return hash_data(data)
+
+
+def cached_pdf_path(cache_folder, output_path, key):
+    """ Path of a PDF in the cache. The name starts with the output file name
+        so old versions for the same output can be removed """
+    name = os.path.splitext(os.path.basename(output_path))[0]
+    return os.path.join(cache_folder, f'{name}-{key}.pdf')
+
+
+def store_pdf(pdf_file, cached_path):
+    """ Save a generated PDF in the cache, removing previous versions of the same PDF """
+    folder = os.path.dirname(cached_path)
+    os.makedirs(folder, exist_ok=True)
+    prefix = os.path.basename(cached_path).rsplit('-', 1)[0]
+    for old_file in glob.glob(os.path.join(glob.escape(folder), f'{glob.escape(prefix)}-*.pdf')):
+        # Only <prefix>-<key>.pdf files, other PDFs can share the prefix
+        if old_file != cached_path and '-' not in os.path.basename(old_file)[len(prefix) + 1:]:
+            os.remove(old_file)
+    tmp_path = f'{cached_path}.tmp'
+    shutil.copyfile(pdf_file, tmp_path)
+    os.replace(tmp_path, cached_path)
+
+
+def restore_pdf(cached_path, pdf_file):
+    """ Copy a cached PDF to the site """
+    os.makedirs(os.path.dirname(pdf_file), exist_ok=True)
+    shutil.copyfile(cached_path, pdf_file)
@@ -0,0 +1,152 @@
+""" Per phase profiling for the build commands (--profile).
+    For each phase we record the wall time, the CPU time (this process and
+    its finished child processes) and the peak RSS (memory) of this process.
+    Phases can be nested. On Linux the peak RSS is reset at the start of
+    each phase (/proc/self/clear_refs) so it's the peak for that phase;
+    on other systems it's the peak since the process started. """
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import json
+import os
+import platform
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+
+def cpu_time():
+    """ User + system CPU time (seconds) for this process and its finished children """
+    if resource is None:
+        return time.process_time()
+    total = 0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        total += usage.ru_utime + usage.ru_stime
+    return total
+
+
+def reset_peak_rss():
+    """ Reset the peak RSS of this process (Linux only). Return True if done """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss():
+    """ Peak RSS (bytes) of this process """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KB on Linux and others
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+class Profiler:
+    """ Record phases with profiler.phase(name, language).
+        A disabled profiler doesn't record anything """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.records = []
+        # Peak RSS seen and language of each open phase
+        self._stack = []
+        self._start = time.perf_counter()
+
+    def _fold_peak(self, rss):
+        """ Inner phases reset the peak RSS, keep the max for the outer ones """
+        if rss is None:
+            return
+        for state in self._stack:
+            state['peak_rss'] = max(state['peak_rss'] or 0, rss)
+
+    @contextmanager
+    def phase(self, name, language=None):
+        if not self.enabled:
+            yield
+            return
+        self._fold_peak(peak_rss())
+        reset_peak_rss()
+        if language is None and self._stack:
+            # Nested phases are for the same language
+            language = self._stack[-1]['language']
+        state = {'peak_rss': peak_rss(), 'language': language}
+        self._stack.append(state)
+        record = {'name': name, 'language': language, 'depth': len(self._stack) - 1, 'pid': os.getpid()}
+        self.records.append(record)
+        wall_start, cpu_start = time.perf_counter(), cpu_time()
+        try:
+            yield
+        finally:
+            record['wall'] = time.perf_counter() - wall_start
+            record['cpu'] = cpu_time() - cpu_start
+            self._stack.pop()
+            current = peak_rss()
+            record['peak_rss'] = max(state['peak_rss'] or 0, current or 0) or None
+            self._fold_peak(record['peak_rss'])
+
+    def add_records(self, records, language=None):
+        """ Add the records from other profiler (e.g. from a worker process),
+            nested in the current phase """
+        depth = len(self._stack)
+        for record in records:
+            record = dict(record, depth=record['depth'] + depth)
+            if language and not record['language']:
+                record['language'] = language
+            self.records.append(record)
+
+    def report(self, command):
+        return {
+            'command': command,
+            'date': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'total_wall': time.perf_counter() - self._start,
+            'phases': self.records,
+        }
+
+    def format_table(self):
+        lines = [f'{"Phase":<40} {"Lang":<6} {"Wall (s)":>9} {"CPU (s)":>9} {"Peak RSS (MB)":>14}']
+        for record in self.records:
+            name = '  ' * record['depth'] + record['name']
+            rss = f'{record["peak_rss"] / 1024 / 1024:.1f}' if record['peak_rss'] else '-'
+            lines.append(
+                f'{name:<40} {record["language"] or "":<6} '
+                f'{record["wall"]:>9.2f} {record["cpu"]:>9.2f} {rss:>14}'
+            )
+        return '\n'.join(lines)
+
+    def finish(self, command, report_file):
+        """ Print the summary table and write the JSON report (if enabled) """
+        if not self.enabled:
+            return
+        print(self.format_table())
+        os.makedirs(os.path.dirname(os.path.abspath(report_file)), exist_ok=True)
+        with open(report_file, 'w') as f:
+            json.dump(self.report(command), f, indent=2)
+        print(f'Profile report written to {report_file}')
+
+
+def run_profiled(function, name, language, *args, **kwargs):
+    """ Run function(*args, profiler=..., **kwargs) in a new profiler phase
+        (e.g. in a worker process). Return the profiler records """
+    profiler = Profiler()
+    with profiler.phase(name, language):
+        function(*args, profiler=profiler, **kwargs)
+    return profiler.records
@@ -0,0 +1,117 @@
+""" Index of the docs files reachable from the nav (build-config --nav-only).
+    Starting from the files in the nav, MD files are parsed to follow their
+    links and images (markdown and HTML syntax), their Jinja includes and
+    their pymdownx.snippets (--8<--) to other files in the same docs folder.
+    Drafts and archived pages not linked from any reachable page
+    are not rendered or copied. """
+
+import os
+import re
+from urllib.parse import unquote
+from render import snippet_references
+
+
+# [text](target "title") and ![alt](<target with spaces>)
+INLINE_LINK_RE = re.compile(r'\]\(\s*(<[^>]+>|[^)\s]+)')
+# [id]: target "title"
+REFERENCE_LINK_RE = re.compile(r'^\s{0,3}\[[^\]]+\]:\s*(<[^>]+>|\S+)', re.MULTILINE)
+# <img src="target"> and <a href="target">
+HTML_LINK_RE = re.compile(r'(?:src|href)\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+# {% include "docs-en/partial.md" %} (also import, from and extends)
+JINJA_INCLUDE_RE = re.compile(r'{%-?\s*(?:include|import|from|extends)\s+["\']([^"\']+)["\']')
+# http:, mailto:, etc
+SCHEME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:')
+
+
+def nav_files(nav):
+    """ Paths of the files in a nav section (URLs are ignored) """
+    files = []
+    if isinstance(nav, str):
+        if not SCHEME_RE.match(nav) and not nav.startswith('/'):
+            files.append(os.path.normpath(nav))
+    elif isinstance(nav, dict):
+        for value in nav.values():
+            files += nav_files(value)
+    elif isinstance(nav, list):
+        for item in nav:
+            files += nav_files(item)
+    return files
+
+
+def link_targets(markdown):
+    """ Link and image targets in a MD file """
+    targets = INLINE_LINK_RE.findall(markdown) + REFERENCE_LINK_RE.findall(markdown) + HTML_LINK_RE.findall(markdown)
+    return [target.strip('<>') for target in targets]
+
+
+def include_targets(markdown, docs_folder):
+    """ Paths (relative to the docs folder) of the files in the docs folder
+        included with Jinja. Names are relative to the parent of the docs folder
+        (the search path of the Jinja environment) """
+    docs_name = os.path.basename(os.path.normpath(docs_folder))
+    paths = []
+    for name in JINJA_INCLUDE_RE.findall(markdown):
+        parts = os.path.normpath(name).split(os.sep)
+        if len(parts) > 1 and parts[0] == docs_name:
+            path = os.path.join(*parts[1:])
+            if os.path.isfile(os.path.join(docs_folder, path)):
+                paths.append(path)
+    return paths
+
+
+def snippet_targets(markdown, docs_folder, snippet_paths):
+    """ Paths (relative to the docs folder) of the files in the docs folder included
+        with pymdownx.snippets. Names are relative to the snippets base paths
+        (absolute paths), that can point to the docs folder or to its fixed version """
+    docs_folder = os.path.abspath(docs_folder)
+    fixed_folder = os.path.join(os.path.dirname(docs_folder), f'fixed-{os.path.basename(docs_folder)}')
+    paths = []
+    for name in snippet_references(markdown):
+        for base_path in snippet_paths:
+            snippet_path = os.path.normpath(os.path.join(base_path, name))
+            for folder in (docs_folder, fixed_folder):
+                path = os.path.relpath(snippet_path, folder)
+                if not path.startswith('..') and os.path.isfile(os.path.join(docs_folder, path)):
+                    paths.append(path)
+    return paths
+
+
+def resolve_link(target, rel_path, docs_folder):
+    """ Paths (relative to the docs folder) of the files a link can point to.
+        External links, absolute paths, anchors and template expressions are ignored """
+    target = unquote(target.split('#')[0].split('?')[0])
+    if not target or SCHEME_RE.match(target) or target.startswith(('/', '{')):
+        return []
+    path = os.path.normpath(os.path.join(os.path.dirname(rel_path), target))
+    if path.startswith('..'):
+        return []
+    # Links to pages can use the URL (about/ or about) instead of the file name
+    candidates = [path, f'{path}.md', os.path.join(path, 'index.md'), os.path.join(path, 'README.md')]
+    return [
+        candidate for candidate in candidates
+        if os.path.isfile(os.path.join(docs_folder, candidate))
+    ]
+
+
+def reachable_files(docs_folder, nav, snippet_paths=None):
+    """ Paths (relative to the docs folder) of the files in the nav and
+        all the files linked from them (recursively).
+        snippet_paths: pymdownx.snippets base paths (absolute, None if not enabled) """
+    pending = [path for path in nav_files(nav) if os.path.isfile(os.path.join(docs_folder, path))]
+    reachable = set(pending)
+    while pending:
+        rel_path = pending.pop()
+        if not rel_path.endswith('.md'):
+            continue
+        with open(os.path.join(docs_folder, rel_path), encoding='utf-8', errors='replace') as f:
+            markdown = f.read()
+        paths = include_targets(markdown, docs_folder)
+        if snippet_paths:
+            paths += snippet_targets(markdown, docs_folder, snippet_paths)
+        for target in link_targets(markdown):
+            paths += resolve_link(target, rel_path, docs_folder)
+        for path in paths:
+            if path not in reachable:
+                reachable.add(path)
+                pending.append(path)
+    return reachable
@@ -0,0 +1,446 @@
+""" Incremental rendering support for the MD files.
+    A manifest stores, for each file in a docs folder, the hashes used to
+    build its fixed version so unchanged files can be skipped on the next run. """
+
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import gc
+import hashlib
+import json
+import os
+import re
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateSyntaxError, meta, nodes
+
+
+MANIFEST_VERSION = 2
+# The MD files manifest stores the full closure of the templates used by each file
+# (see template_dependencies), older manifests only have the direct references
+MD_MANIFEST_VERSION = 3
+HASH_CHUNK_SIZE = 1024 * 1024
+# MD files larger than this are rendered by segments (see stream_md_file)
+STREAM_MIN_SIZE = 16 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+# pymdownx.snippets: --8<-- "file.md" (also with line ranges: "file.md:1:10")
+SNIPPET_LINE_RE = re.compile(r'^\s*-{1,}8<-{1,}\s+(["\'])(.+?)\1\s*$')
+# Block of snippets: a --8<-- line, a file name in each line and a --8<-- line
+SNIPPET_BLOCK_RE = re.compile(r'^\s*-{1,}8<-{1,}\s*$')
+SNIPPET_LINES_RE = re.compile(r'(:-?\d*)+$')
+# A tag with whitespace control ({%- ...) strips the whitespace (blank lines too) before it
+WHITESPACE_CONTROL_RE = re.compile(r'^\s*(\{%-|\{\{-|\{#-)')
+# and a tag ending with it (... -%}) strips the whitespace after it
+TRAILING_WHITESPACE_CONTROL_RE = re.compile(r'(-%\}|-\}\}|-#\})\s*$')
+
+
+def hash_file(path):
+    """ Return the sha256 of a file content (read by chunks) """
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def hash_data(data):
+    """ Return the sha256 of any JSON serializable value """
+    dumped = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(dumped.encode('utf-8')).hexdigest()
+
+
+def stat_signature(path):
+    """ Size and modification time of a file (None if it doesn't exist) """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def load_manifest(manifest_path, version=MANIFEST_VERSION):
+    """ Load a manifest file. Return an empty one if it doesn't exist or is outdated """
+    empty = {'version': version, 'files': {}}
+    if not manifest_path or not os.path.exists(manifest_path):
+        return empty
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except ValueError:
+        print(f'Ignoring invalid manifest file {manifest_path}')
+        return empty
+    if manifest.get('version') != version:
+        return empty
+    return manifest
+
+
+def save_manifest(manifest_path, manifest):
+    """ Write the manifest file (atomically, to survive interrupted builds) """
+    if not manifest_path:
+        return
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    tmp_path = f'{manifest_path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def analyze_template(env, source):
+    """ Parse a template source.
+        Return the AST, the context variables it uses and the templates it references
+        (None in the references list means a dynamic include we can't track) """
+    ast = env.parse(source)
+    variables = sorted(meta.find_undeclared_variables(ast))
+    references = list(meta.find_referenced_templates(ast))
+    return ast, variables, references
+
+
+def context_hash(context, variables):
+    """ Hash only the context values used by a template
+        (or the full context if variables is None) """
+    if variables is None:
+        return hash_data(context)
+    return hash_data({var: context.get(var) for var in variables})
+
+
+@functools.lru_cache(maxsize=1024)
+def file_references(env, path, signature):
+    """ Templates referenced by a template file (cached by file stat signature) """
+    with open(path, 'r') as f:
+        return tuple(analyze_template(env, f.read())[2])
+
+
+def template_dependencies(env, references, search_path):
+    """ All the templates used through the references of a template: included and
+        imported templates can include or import other ones.
+        Return the names (sorted) and if any of them has a dynamic include we can't track """
+    names, pending, dynamic = set(), list(references), False
+    while pending:
+        name = pending.pop()
+        if name is None:
+            dynamic = True
+            continue
+        if name in names:
+            continue
+        names.add(name)
+        path = os.path.join(search_path, name)
+        if not os.path.isfile(path):
+            continue
+        try:
+            pending += file_references(env, path, tuple(stat_signature(path)))
+        except TemplateSyntaxError:
+            # Not rendered (e.g. a conditional include), its references are unknown
+            dynamic = True
+    return sorted(names), dynamic
+
+
+def dependencies_hash(references, search_path):
+    """ Hash the templates used by another one (include, import, extends, see template_dependencies).
+        Names are resolved against the Jinja search path (the docs root folder). """
+    deps = {}
+    for name in references:
+        if name is None:
+            continue
+        dep_path = os.path.join(search_path, name)
+        deps[name] = hash_file(dep_path) if os.path.isfile(dep_path) else None
+    return deps
+
+
+def snippet_references(markdown):
+    """ Files included with the pymdownx.snippets syntax (remote and escaped snippets are ignored) """
+    references = []
+    in_block = False
+    for line in markdown.splitlines():
+        if SNIPPET_BLOCK_RE.match(line):
+            in_block = not in_block
+            continue
+        match = SNIPPET_LINE_RE.match(line)
+        name = match.group(2) if match else line.strip() if in_block else None
+        if not name or name.startswith((';', 'http://', 'https://')):
+            continue
+        name = SNIPPET_LINES_RE.sub('', name)
+        if name not in references:
+            references.append(name)
+    return references
+
+
+def snippets_hash(references, base_paths):
+    """ Hash of each snippet file (None if not found) """
+    deps = {}
+    for name in references:
+        deps[name] = None
+        for base_path in base_paths:
+            path = os.path.join(base_path, name)
+            if os.path.isfile(path):
+                deps[name] = hash_file(path)
+                break
+    return deps
+
+
+def is_md_entry_fresh(entry, orig_file, dest_file, context, search_path):
+    """ Check if a rendered MD file from the manifest is still valid.
+        Updates the entry source stat if only the mtime changed. """
+    if not entry or entry.get('dynamic'):
+        return False
+    if entry.get('plain'):
+        # Template free file, just copied
+        return is_copy_entry_fresh(entry, orig_file, dest_file)
+    if stat_signature(dest_file) != entry.get('out'):
+        return False
+    src_stat = stat_signature(orig_file)
+    if src_stat != entry.get('stat'):
+        if hash_file(orig_file) != entry.get('src'):
+            return False
+        # Same content, just touched (e.g. a git checkout)
+        entry['stat'] = src_stat
+    if context_hash(context, entry.get('vars')) != entry.get('ctx'):
+        return False
+    return dependencies_hash(entry.get('deps', {}), search_path) == entry.get('deps', {})
+
+
+def is_copy_entry_fresh(entry, orig_file, dest_file):
+    """ Check if a copied (non MD) file from the manifest is still valid """
+    if not entry:
+        return False
+    return (
+        stat_signature(orig_file) == entry.get('stat') and
+        stat_signature(dest_file) == entry.get('out')
+    )
+
+
+TEMPLATE_MARKS = (b'{{', b'{%', b'{#')
+
+
+def is_template_free(path):
+    """ Check (reading by chunks) if a file has no Jinja markup at all,
+        so it can be copied instead of rendered """
+    previous_tail = b''
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            data = previous_tail + chunk
+            if any(mark in data for mark in TEMPLATE_MARKS):
+                return False
+            # A mark can be split between two chunks
+            previous_tail = data[-1:]
+    return True
+
+
+def template_name(path, search_path):
+    """ Jinja template name (relative to the loader search path) for a file """
+    rel_path = os.path.relpath(os.path.abspath(path), search_path)
+    return rel_path.replace(os.sep, '/')
+
+
+def template_segments(env, path, chunk_size=STREAM_CHUNK_SIZE):
+    """ Split a template file (read line by line) into segments of about chunk_size
+        characters. A segment ends at a line end where no Jinja block, tag or comment
+        is open, so it can be parsed on its own, and where no whitespace control
+        ({%- or -%}) strips the whitespace between both segments.
+        Yield (first line number, AST) """
+    lines, size, start, next_try = [], 0, 1, chunk_size
+    # Last non blank line in the current segment
+    last_text = ''
+    with open(path, 'r') as f:
+        for lineno, line in enumerate(f, 1):
+            if (
+                size >= next_try and line.strip() and not WHITESPACE_CONTROL_RE.match(line)
+                and not TRAILING_WHITESPACE_CONTROL_RE.search(last_text)
+            ):
+                try:
+                    ast = env.parse(''.join(lines))
+                except TemplateSyntaxError:
+                    # A block is still open, try again after the next chunk
+                    next_try = size + chunk_size
+                else:
+                    yield start, ast
+                    lines, size, start, next_try, last_text = [], 0, lineno, chunk_size, ''
+            lines.append(line)
+            size += len(line)
+            if line.strip():
+                last_text = line
+    if lines:
+        try:
+            ast = env.parse(''.join(lines))
+        except TemplateSyntaxError as e:
+            # Line numbers are relative to the segment
+            e.lineno += start - 1
+            raise
+        yield start, ast
+
+
+def stream_md_file(env, orig_file, dest_file, context, chunk_size=STREAM_CHUNK_SIZE):
+    """ Render a (large) MD file by segments, writing the output as it's generated.
+        Memory use depends on the segment size, not on the file size.
+        Top level assignments, macros and imports are passed on to the next segments
+        ({% extends %} is not supported).
+        Return the context variables and templates used (as in analyze_template) """
+    variables, references = set(), []
+    carried = {}
+    with open(dest_file, 'w') as f:
+        for start, ast in template_segments(env, orig_file, chunk_size):
+            if ast.find(nodes.Extends) is not None:
+                raise Exception(f'{{% extends %}} is not supported in large files (line {start} or after)')
+            variables.update(meta.find_undeclared_variables(ast))
+            references += [name for name in meta.find_referenced_templates(ast) if name not in references]
+            template = env.from_string(ast)
+            segment_context = template.new_context(dict(context, **carried))
+            try:
+                f.writelines(template.root_render_func(segment_context))
+            except Exception:
+                # Same error (and traceback) as in template.render
+                env.handle_exception()
+            carried.update(segment_context.vars)
+            # Compiled templates are in a reference cycle (with their module namespace)
+            del template, segment_context
+            gc.collect(1)
+    return sorted(variables), references
+
+
+def write_md_file(env, orig_file, dest_file, context, src_hash, previous=None):
+    """ Render a MD file with the compiled template (from the bytecode cache if possible).
+        Return the context variables and templates used (as in analyze_template) """
+    if previous and previous.get('src') == src_hash and 'refs' in previous:
+        variables, references = previous['vars'], previous['refs']
+    else:
+        with open(orig_file, 'r') as f:
+            _, variables, references = analyze_template(env, f.read())
+    template = env.get_template(template_name(orig_file, env.loader.searchpath[0]))
+    with open(dest_file, 'w') as f:
+        f.writelines(template.generate(context))
+    return variables, references
+
+
+def render_md_file(env, orig_file, dest_file, context, previous=None):
+    """ Render a MD file with the given context.
+        The previous manifest entry (if any) avoids parsing the template again
+        when only the context changed.
+        Return the new manifest entry for this file """
+    search_path = env.loader.searchpath[0]
+    try:
+        src_hash = hash_file(orig_file)
+        if os.path.getsize(orig_file) > STREAM_MIN_SIZE:
+            variables, references = stream_md_file(env, orig_file, dest_file, context)
+        else:
+            variables, references = write_md_file(env, orig_file, dest_file, context, src_hash, previous)
+        if references:
+            # Included templates can use any context value
+            variables = None
+        dependencies, dynamic = template_dependencies(env, references, search_path)
+    except Exception as e:
+        line = f' (line {e.lineno})' if getattr(e, 'lineno', None) else ''
+        raise Exception(f'Error rendering MD file {orig_file}{line}: {type(e).__name__}: {e}') from e
+
+    return {
+        'src': src_hash,
+        'stat': stat_signature(orig_file),
+        'vars': variables,
+        'refs': references,
+        'ctx': context_hash(context, variables),
+        'deps': dependencies_hash(dependencies, search_path),
+        'dynamic': dynamic,
+        'out': stat_signature(dest_file),
+    }
+
+
+# Render state for each process pool worker
+_worker = {}
+
+
+def _init_render_worker(context, search_path, bytecode_folder):
+    """ Process pool initializer. The context is sent once per worker, not once per file """
+    _worker['env'] = new_jinja_env(search_path, bytecode_folder)
+    _worker['context'] = context
+
+
+def _render_in_worker(job):
+    orig_file, dest_file, previous = job
+    return render_md_file(_worker['env'], orig_file, dest_file, _worker['context'], previous)
+
+
+def render_md_files(jobs, env, context, workers=1):
+    """ Render a list of (orig_file, dest_file, previous manifest entry) MD files.
+        With more than one worker (and more than one file) a process pool is used,
+        each worker with its own environment sharing the same bytecode cache.
+        Return the manifest entries in the same order as the jobs
+        (the first failing file, in that order, raises the error) """
+    if workers <= 1 or len(jobs) <= 1:
+        return [
+            render_md_file(env, orig_file, dest_file, context, previous)
+            for orig_file, dest_file, previous in jobs
+        ]
+
+    bytecode_folder = env.bytecode_cache.directory if env.bytecode_cache else None
+    initargs = (context, env.loader.searchpath[0], bytecode_folder)
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker, initargs=initargs) as executor:
+        return list(executor.map(_render_in_worker, jobs, chunksize=chunksize))
+
+
+def new_jinja_env(search_path, bytecode_folder=None):
+    """ Jinja environment used to render MD files.
+        Templates (and includes/macros) are loaded from the docs root folder.
+        Compiled templates are stored in the bytecode folder to be reused in the next builds """
+    bytecode_cache = None
+    if bytecode_folder:
+        os.makedirs(bytecode_folder, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_folder))
+    return Environment(
+        loader=FileSystemLoader(os.path.abspath(search_path)),
+        bytecode_cache=bytecode_cache,
+        # Rendered files must end like template free (copied) files
+        keep_trailing_newline=True,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def shared_jinja_env(search_path, bytecode_folder=None):
+    """ Jinja environment reused by all the builds in this process (e.g. serve --watch
+        or the build daemon): compiled templates are kept in memory and reloaded
+        when their files change """
+    return new_jinja_env(search_path, bytecode_folder)
+
+
+def walk_docs(docs_folder):
+    """ Walk a docs folder in a single pass (sorted, to get the same order in all runs).
+        Yield each folder path, its path relative to docs_folder and its files """
+    for root, dirs, files in os.walk(docs_folder):
+        dirs.sort()
+        yield root, os.path.relpath(root, docs_folder), sorted(files)
+
+
+def new_walk_stats():
+    """ Counters for a docs folder update """
+    return {
+        'files_rendered': 0,
+        'files_fast_path': 0,
+        'files_copied': 0,
+        'files_skipped': 0,
+        'files_removed': 0,
+        'files_excluded': 0,
+        'bytes_written': 0,
+        'duration': 0.0,
+    }
+
+
+def format_walk_stats(stats):
+    """ One line summary of a docs folder update """
+    visited = stats['files_rendered'] + stats['files_fast_path'] + stats['files_copied'] + stats['files_skipped']
+    return (
+        f'{visited} files visited: {stats["files_rendered"]} rendered, '
+        f'{stats["files_fast_path"]} MD without templates (fast path), {stats["files_copied"]} copied, '
+        f'{stats["files_skipped"]} unchanged, {stats["files_removed"]} removed. '
+        f'{stats["bytes_written"]} bytes written in {stats["duration"]:.2f}s'
+    ) + (f'. {stats["files_excluded"]} excluded (not reachable from the nav)' if stats['files_excluded'] else '')
+
+
+def prune_folder(folder, keep):
+    """ Remove files (and then empty folders) not listed in keep (relative paths).
+        Return the list of removed files """
+    removed = []
+    for root, dirs, files in os.walk(folder, topdown=False):
+        for file in files:
+            path = os.path.join(root, file)
+            rel_path = os.path.relpath(path, folder)
+            if rel_path not in keep:
+                os.remove(path)
+                removed.append(rel_path)
+        if root != folder and not os.listdir(root):
+            os.rmdir(root)
+    return removed
@@ -1,18 +1,24 @@
+import os
 from pathlib import Path
-import shutil
-from mkdocs.commands import build
-from mkdocs import config as mkdocs_config
 import click
 import git
-import yaml
 
 
+from builder import build_pdfs, build_sites, in_memory_config, read_language_config
+from compress import COMPRESS_MANIFEST, precompress_site
+from config_cache import config_cache_file, config_cache_key, load_cached_configs, save_cached_configs, write_if_changed
+from daemon import PHASES, daemon_socket_path, send_request, serve_daemon, warm_up_mkdocs
 from helpers import (
     add_pdf_url,
+    dump_yaml,
+    get_language_config_files,
     get_lang_setting,
     get_list_setting,
     get_paths,
+    overlay,
+    overlay_list_setting,
     get_yaml,
+    read_yaml_source,
     update_gh_action_language_files,
     update_language_paths,
     update_md_files,
@@ -20,45 +26,38 @@ from helpers import (
     validate_langs,
     validate_nav_lang_exists,
 )
+from materialize import DEFAULT_STRATEGY, STRATEGIES
+from pdf_cache import snippets_base_paths
+from profiling import Profiler
+from selection import parse_languages, pdf_template_folders, select_languages
+from render import shared_jinja_env
+from server import DEFAULT_CACHE_CONTROL, make_server
+from sync import ASSETS_MANIFEST, sync_assets, synced_files
+from vendor import vendor_configs, vendored_files
+from watch import watch as watch_project
 
 
 BASE_FOLDER = Path(__file__).resolve().parent.parent
 
 
+def profile_options(command):
+    """ Add the --profile and --profile-file options to a command """
+    command = click.option(
+        '--profile-file', type=click.Path(dir_okay=False),
+        help='JSON profile report file (default: .cache/profile-COMMAND.json)'
+    )(command)
+    return click.option(
+        '--profile', is_flag=True, help='Report wall time, CPU time and peak memory for each build phase'
+    )(command)
+
+
 @click.group()
 def cli():
     pass
 
 
-@cli.command(
-    'build-config',
-    short_help='Build config files for all languages'
-)
-@click.option('--env', '-e', default='local', help='Environment to build for (local or prod)')
-@click.option('--skip-gh-action', is_flag=True, help='Skip updating GitHub action file')
-def build_config(skip_gh_action, env):
-    """ Build the config file """
-    PATHS = get_paths(BASE_FOLDER)
-    base_config = get_yaml(PATHS['base_config_file'])
-    custom_config = get_yaml(PATHS['custom_config_file'])
-
-    # Detect languages to validate and prepare final custom mkdocs
-    languages = validate_langs(custom_config)
-
-    # Copy general assets (for all languages).
-    src_folder = PATHS['user_assets_folder']
-    dst_folder = PATHS['site_assets_folder']
-    click.echo(f'Copying assets from {src_folder}  to {dst_folder}')
-    shutil.copytree(src_folder, dst_folder, dirs_exist_ok=True)
-
-    # Update the GitHub action to contain the correct language files
-    if not skip_gh_action:
-        gh_workflow_file_path = PATHS['base_folder'] / '.github/workflows/page.yml'
-        click.echo(f'Updating GitHub action file: {gh_workflow_file_path}')
-        update_gh_action_language_files(gh_workflow_file_path, languages)
-
-    # ====================
-    # URLs
+def update_urls(base_config, custom_config, env='local'):
+    """ Define the repo and site URLs and the final base paths for an environment """
     repo_name = custom_config.pop('repo_name')
     repo_user = custom_config.pop('repo_user')
     custom_config['repo_url'] = f'https://github.com/{repo_user}/{repo_name}'
@@ -78,105 +77,459 @@ def build_config(skip_gh_action, env):
 
     # Define all language final paths
     update_language_paths(custom_config, env)
-    # ====================
 
-    click.echo(f'Languages found: {", ".join(languages)}')
-    for language in languages:
-        # get the base setting
-        config = base_config.copy()
-        base_docs_dir = config['docs_dir']
-
-        config['theme']['language'] = language
-        search_plugin = get_list_setting(config['plugins'], 'search')
-        search_plugin['lang'] = language
-        wpdf_plugin = get_list_setting(config['plugins'], 'with-pdf')
-        wpdf_plugin['output_path'] = f"pdf/doc-{language}.pdf"
-
-        config['edit_uri'] = base_config['edit_uri'].replace('LANG', language)
-        config['docs_dir'] = f"{base_docs_dir}/docs-{language}"
-
-        # Override custom settings
-        config.update(custom_config)
-        config['copyright'] = get_lang_setting(custom_config, language, 'copyright')
-        config['site_name'] = get_lang_setting(custom_config, language, 'site_name')
-        config['site_description'] = get_lang_setting(custom_config, language, 'site_description')
-        config['site_author'] = get_lang_setting(custom_config, language, 'site_author')
-        validate_nav_lang_exists(custom_config['nav'], language)
-        config['nav'] = custom_config['nav'][f'nav-{language}']
-        # Check for the default index.md (required for all languages)
-        validate_index_lang_file(config['nav'], language)
-
-        if language == 'en':
-            config['site_dir'] = "../site"
-        else:
-            config['site_dir'] = f"../site/{language}"
-
-        wpdf_plugin['cover_title'] = config['site_name']
-        wpdf_plugin['cover_subtitle'] = config['site_description']
-        wpdf_plugin['author'] = config['site_author']
 
+def get_language_config(base_config, custom_config, language):
+    """ Final mkdocs config (dict) for a language. The docs_dir is the source
+        docs folder, it's replaced by the fixed one after rendering the MD files.
+        The config is built in layers (base -> custom -> language): only the values
+        changed for the language are new objects, the rest is shared with
+        base_config and custom_config (replace values, never change them in place) """
+    copyright = get_lang_setting(custom_config, language, 'copyright')
+    site_name = get_lang_setting(custom_config, language, 'site_name')
+    site_description = get_lang_setting(custom_config, language, 'site_description')
+    site_author = get_lang_setting(custom_config, language, 'site_author')
+    validate_nav_lang_exists(custom_config['nav'], language)
+    nav = custom_config['nav'][f'nav-{language}']
+    # Check for the default index.md (required for all languages)
+    validate_index_lang_file(nav, language)
+
+    # Override custom settings (e.g. theme, plugins, extra_css or extra in custom.yml)
+    merged = overlay(base_config, **custom_config)
+    plugins = overlay_list_setting(merged['plugins'], 'search', lang=language)
+    plugins = overlay_list_setting(
+        plugins, 'with-pdf', output_path=f"pdf/doc-{language}.pdf",
+        cover_title=site_name, cover_subtitle=site_description, author=site_author,
+    )
+    assets_folder = merged['extra']['assets_folder']
+    config = overlay(
+        merged,
+        theme=overlay(merged['theme'], language=language),
+        plugins=plugins,
+        edit_uri=merged['edit_uri'].replace('LANG', language),
+        docs_dir=f"{base_config['docs_dir']}/docs-{language}",
+        site_dir="../site" if language == 'en' else f"../site/{language}",
+        copyright=copyright,
+        site_name=site_name,
+        site_description=site_description,
+        site_author=site_author,
+        nav=nav,
         # fix CSS and JS statics
-        final_css = []
-        for css in config['extra_css']:
-            if css.startswith('/'):
-                css = config['extra']['assets_folder'] + css
-            final_css.append(css)
-        config['extra_css'] = final_css
-
-        final_js = []
-        for js in config['extra_javascript']:
-            if js.startswith('/'):
-                js = config['extra']['assets_folder'] + js
-            final_js.append(js)
-        config['extra_javascript'] = final_js
-
+        extra_css=[assets_folder + css if css.startswith('/') else css for css in merged['extra_css']],
+        extra_javascript=[
+            assets_folder + js if js.startswith('/') else js for js in merged['extra_javascript']
+        ],
         # Update extra values (our context values for all md and html files)
-        config['extra'].update(custom_config['custom_extra'])
+        extra=overlay(merged['extra'], **custom_config['custom_extra']),
+    )
 
-        # Add a final PDF URL for this language
+    # Add a final PDF URL for this language
+    wpdf_plugin = get_list_setting(plugins, 'with-pdf')
+    if wpdf_plugin:
         add_pdf_url(config, wpdf_plugin, language)
+    return config
 
+
+def resolve_configs(base_config, custom_config, env='local'):
+    """ Resolve the mkdocs config (dict) of each language, before rendering its MD files.
+        Return a dict with key=language and value=config """
+    # Detect languages to validate and prepare final custom mkdocs
+    languages = validate_langs(custom_config)
+    update_urls(base_config, custom_config, env)
+    return {language: get_language_config(base_config, custom_config, language) for language in languages}
+
+
+def load_configs(paths, env='local', cache_file=None):
+    """ Resolve the language configs from the base and custom config files.
+        If a cache file is defined, configs resolved from the same files (raw content)
+        and env are reused, the config files are not parsed again """
+    if cache_file:
+        key = config_cache_key(
+            read_yaml_source(paths['base_config_file']), read_yaml_source(paths['custom_config_file']), env
+        )
+        configs = load_cached_configs(cache_file, key)
+        if configs is not None:
+            click.echo('Config unchanged, using the resolved configs from the cache')
+            return configs
+
+    configs = resolve_configs(get_yaml(paths['base_config_file']), get_yaml(paths['custom_config_file']), env)
+    if cache_file:
+        save_cached_configs(cache_file, key, configs)
+    return configs
+
+
+def snippet_folders(config, base_folder):
+    """ pymdownx.snippets base paths of a language config (absolute, None if not enabled).
+        They are relative to the working directory where mkdocs runs (the project folder) """
+    base_paths = snippets_base_paths(config.get('markdown_extensions'))
+    if base_paths is None:
+        return None
+    return [os.path.abspath(os.path.join(base_folder, base_path)) for base_path in base_paths]
+
+
+def prepare_configs(
+    paths, env='local', clean=False, jobs=1, strategy=DEFAULT_STRATEGY, profiler=None,
+    write_config=True, gh_action=False, assets=True, languages=None, changed_since=None, nav_only=False,
+    vendor=False,
+):
+    """ Resolve the mkdocs config of each language and render its MD files.
+        Return a dict with key=language and value=in-memory config, ready to build
+        (see builder.in_memory_config).
+        languages, changed_since: render only these languages and/or the languages
+        affected by the changes since a git ref (see selection.py)
+        nav_only: render and copy only the docs files reachable from the nav (see reachability.py)
+        vendor: use local copies of the remote assets (see vendor.py)
+        write_config: also write the conf/mkdocs-LANG.yml files (used by the GitHub action).
+        Files with the same content are not written again
+        gh_action: update the language files in the GitHub action
+        assets: sync the user assets into the site folder """
+    profiler = profiler or Profiler(enabled=False)
+    # Unchanged configs and MD files are not resolved or rendered again unless we want a clean build
+    cache_folder = None if clean else paths['cache_folder']
+    with profiler.phase('load config'):
+        cache_file = config_cache_file(cache_folder, env) if cache_folder else None
+        resolved = load_configs(paths, env, cache_file)
+        # One Jinja environment for all languages, loading templates from the docs root folder
+        # (the parent of the language docs folders)
+        docs_dir = next(iter(resolved.values()))['docs_dir']
+        docs_root = paths['base_config_folder'] / os.path.dirname(docs_dir)
+        jinja_env = shared_jinja_env(str(docs_root), str(paths['cache_folder'] / 'jinja'))
+    all_languages = list(resolved)
+    languages, _ = select_languages(
+        paths, all_languages, languages, changed_since, pdf_template_folders(resolved, paths['base_folder'])
+    )
+    if vendor:
+        with profiler.phase('vendor assets'):
+            resolved = vendor_configs(resolved, paths, strategy=strategy)
+
+    # Sync general assets (for all languages).
+    if assets:
+        with profiler.phase('sync assets'):
+            sync_assets(paths, strategy=strategy)
+
+    # Update the GitHub action to contain the correct language files
+    if gh_action:
+        gh_workflow_file_path = paths['base_folder'] / '.github/workflows/page.yml'
+        click.echo(f'Updating GitHub action file: {gh_workflow_file_path}')
+        update_gh_action_language_files(gh_workflow_file_path, all_languages)
+
+    click.echo(f'Languages found: {", ".join(all_languages)}. Rendering: {", ".join(languages) or "none"}')
+    configs = {}
+    for language in languages:
+        config = resolved[language]
         # Update MD files with extra values
         click.echo(f'Update docs folder: {config["docs_dir"]}')
-        fixed_folder = update_md_files(config['docs_dir'], PATHS['base_config_folder'], context=config['extra'])
+        with profiler.phase('render MD files', language):
+            fixed_folder = update_md_files(
+                config['docs_dir'], paths['base_config_folder'], context=config['extra'],
+                cache_folder=cache_folder, workers=jobs, jinja_env=jinja_env, strategy=strategy,
+                nav=config['nav'] if nav_only else None,
+                snippet_paths=snippet_folders(config, paths['base_folder']),
+            )
         config['docs_dir'] = fixed_folder
 
         # Remove configurations not recognized by mkdocs
         config.pop('public_url_base_path', None)
         config.pop('custom_extra', None)
 
-        # write the final config file
-        final_config_file = PATHS['base_config_folder'] / f'mkdocs-{language}.yml'
-        with open(final_config_file, 'w') as f:
-            yaml.dump(config, f)
-        click.echo(f'Config file written to {final_config_file}')
+        final_config_file = paths['base_config_folder'] / f'mkdocs-{language}.yml'
+        configs[language] = in_memory_config(final_config_file, config)
+        if write_config:
+            with profiler.phase('write config', language):
+                written = write_if_changed(final_config_file, dump_yaml(config))
+            click.echo(f'Config file {"written to" if written else "unchanged"} {final_config_file}')
+
+    return configs
+
+
+def build_site_folder(paths, config_files, jobs=1, checksum=False, strategy=DEFAULT_STRATEGY, precompress=True,
+                      pdf_cache=True, pdf=True, deferred_pdf=False, profiler=None, languages=None, pdf_languages=None,
+                      incremental=False):
+    """ Build the site for all languages (config files or in-memory configs),
+        sync the assets and precompress the text files.
+        languages: build only the site of these languages (all by default)
+        pdf_languages: languages that only need a new PDF file
+        incremental: build only the changed pages """
+    profiler = profiler or Profiler(enabled=False)
+    # Assets synced in previous builds are not removed, only changed ones are copied again
+    assets_path = paths['site_assets_folder'].relative_to(paths['site_folder'])
+    keep = {
+        os.path.join(assets_path, rel_path)
+        for rel_path in synced_files(paths['cache_folder'] / ASSETS_MANIFEST)
+    }
+    keep |= vendored_files(paths)
+    pdf_cache_folder = paths['cache_folder'] / 'pdf' if pdf_cache else None
+    pages_cache_folder = paths['cache_folder'] / 'pages' if incremental else None
+    if languages is None or languages:
+        build_sites(
+            config_files, paths['site_folder'], jobs=jobs, keep=keep, pdf_cache_folder=pdf_cache_folder,
+            pdf=pdf, deferred_pdf=deferred_pdf, profiler=profiler, languages=languages,
+            pages_cache_folder=pages_cache_folder,
+        )
+    if pdf and pdf_languages:
+        pdf_config_files = {language: config_files[language] for language in pdf_languages}
+        build_pdfs(pdf_config_files, jobs=jobs, pdf_cache_folder=pdf_cache_folder, profiler=profiler)
+
+    # Sync general assets (same for all languages).
+    with profiler.phase('sync assets'):
+        sync_assets(paths, checksum=checksum, strategy=strategy)
+
+    if precompress:
+        with profiler.phase('precompress'):
+            precompress_site(
+                paths['site_folder'], cache_folder=paths['cache_folder'] / 'compress',
+                manifest_path=paths['cache_folder'] / COMPRESS_MANIFEST,
+            )
+
+
+def build_project(
+    paths, env='local', clean=False, jobs=1, strategy=DEFAULT_STRATEGY, write_config=False,
+    checksum=False, precompress=True, pdf_cache=True, pdf=True, deferred_pdf=False, profiler=None,
+    incremental=False, nav_only=False, vendor=False,
+):
+    """ Build config and site in one process (Python API for the build command).
+        The resolved configs are passed to mkdocs in memory, the YAML files
+        are only written with write_config """
+    profiler = profiler or Profiler(enabled=False)
+    configs = prepare_configs(
+        paths, env=env, clean=clean, jobs=jobs, strategy=strategy, profiler=profiler,
+        write_config=write_config, gh_action=False, assets=False, nav_only=nav_only, vendor=vendor,
+    )
+    build_site_folder(
+        paths, configs, jobs=jobs, checksum=checksum, strategy=strategy, precompress=precompress,
+        pdf_cache=pdf_cache, pdf=pdf, deferred_pdf=deferred_pdf, profiler=profiler, incremental=incremental,
+    )
+    return configs
+
+
+def missing_config_files(config_files):
+    """ Languages whose config file was not written yet (in-memory configs are never missing) """
+    return [
+        language for language, config_file in config_files.items()
+        if not isinstance(config_file, dict) and not os.path.exists(config_file)
+    ]
+
+
+def check_config_files(config_files):
+    missing = missing_config_files(config_files)
+    if missing:
+        raise Exception(
+            f'Config files not found for {", ".join(missing)}. '
+            'Build them first with the config phase (e.g. daemon-build --phase config)'
+        )
+
+
+def site_config_files(paths, config_files, languages, env='local'):
+    """ Config files (or in-memory configs) of all the languages for a site build of some languages.
+        The other languages are only used to keep their sites when cleaning. If their config
+        files were not written yet, their resolved configs are used """
+    check_config_files(config_files)
+    all_config_files = dict(get_language_config_files(paths), **config_files)
+    missing = missing_config_files(all_config_files)
+    if missing:
+        resolved = load_configs(paths, env, config_cache_file(paths['cache_folder'], env))
+        for language in missing:
+            all_config_files[language] = in_memory_config(all_config_files[language], resolved[language])
+    return all_config_files
+
+
+def daemon_build(paths, request):
+    """ Run a build request in the build daemon (see daemon.py).
+        phases: config (resolve the configs and render the MD files), site and/or pdf.
+        languages: all by default. The other languages are built from their config files """
+    phases = request.get('phases') or list(PHASES)
+    unknown = [phase for phase in phases if phase not in PHASES]
+    if unknown:
+        raise Exception(f'Unknown build phases: {", ".join(unknown)}. Available phases: {", ".join(PHASES)}')
+    languages = request.get('languages') or None
+    options = request.get('options', {})
+    jobs = options.get('jobs', 1)
+    pdf_cache_folder = paths['cache_folder'] / 'pdf' if options.get('pdf_cache', True) else None
+
+    config_files = get_language_config_files(paths, languages)
+    if 'config' in phases:
+        configs = prepare_configs(
+            paths, env=options.get('env', 'local'), clean=options.get('clean', False), jobs=jobs,
+            gh_action=False, assets='site' not in phases, languages=languages,
+            nav_only=options.get('nav_only', False), vendor=options.get('vendor', False),
+        )
+        config_files.update(configs)
+    if 'site' in phases:
+        # All the languages, to keep the sites of the other languages when cleaning
+        all_config_files = site_config_files(paths, config_files, languages, options.get('env', 'local'))
+        build_site_folder(
+            paths, all_config_files, jobs=jobs, pdf='pdf' in phases, pdf_cache=pdf_cache_folder is not None,
+            incremental=options.get('incremental', False), languages=languages,
+        )
+    elif 'pdf' in phases:
+        check_config_files(config_files)
+        build_pdfs(config_files, jobs=jobs, pdf_cache_folder=pdf_cache_folder)
+
+
+def materialize_option(help):
+    return click.option(
+        '--materialize', 'strategy', default=DEFAULT_STRATEGY, type=click.Choice(STRATEGIES), help=help
+    )
+
+
+def nav_only_option(command):
+    return click.option(
+        '--nav-only', is_flag=True,
+        help='Render and copy only the docs files in the nav and the files linked from them (skip drafts)'
+    )(command)
+
+
+def vendor_option(command):
+    return click.option(
+        '--vendor', is_flag=True,
+        help='Download the remote assets (logo, favicon, PDF cover logo, CDN scripts and styles) once '
+             'into .cache/vendor and use the local copies'
+    )(command)
+
+
+def selection_options(command):
+    """ Add the --lang and --changed-since options to a command """
+    command = click.option(
+        '--changed-since', metavar='REF',
+        help='Build only the languages affected by the changes since a git ref (commit, branch or tag)'
+    )(command)
+    return click.option(
+        '--lang', '-l', 'languages', multiple=True,
+        help='Languages to build, e.g. --lang es,fr (all languages by default)'
+    )(command)
+
+
+def site_options(command):
+    """ Add the options to build the site (build-local-site and build) """
+    for option in reversed([
+        click.option(
+            '--precompress/--no-precompress', default=True,
+            help='Write .gz (and .br if brotli is installed) copies of the text files'
+        ),
+        click.option('--checksum', is_flag=True, help='Compare assets by content instead of size and modification time'),
+        click.option(
+            '--pdf-cache/--no-pdf-cache', default=True, help='Reuse PDF files if their docs and templates did not change'
+        ),
+        click.option('--pdf/--no-pdf', default=True, help='Build the PDF files (skip them for quick iterations)'),
+        click.option('--deferred-pdf', is_flag=True, help='Build the HTML for all languages first and then the PDF files'),
+        click.option(
+            '--incremental', is_flag=True,
+            help='Build only the pages whose inputs changed since the last incremental build (PDF files are deferred)'
+        ),
+    ]):
+        command = option(command)
+    return command
+
+
+@cli.command(
+    'build-config',
+    short_help='Build config files for all languages'
+)
+@click.option('--env', '-e', default='local', help='Environment to build for (local or prod)')
+@click.option('--skip-gh-action', is_flag=True, help='Skip updating GitHub action file')
+@click.option('--clean', is_flag=True, help='Re-render all MD files, ignoring previous builds')
+@click.option('--jobs', '-j', default=1, type=click.INT, help='Number of processes to render MD files')
+@materialize_option('How to place non MD files (docs and assets): copy, hardlink, reflink or copy_file_range')
+@nav_only_option
+@vendor_option
+@selection_options
+@profile_options
+def build_config(
+    skip_gh_action, env, clean, jobs, strategy, nav_only, vendor, languages, changed_since, profile, profile_file,
+):
+    """ Build the config file """
+    PATHS = get_paths(BASE_FOLDER)
+    profiler = Profiler(enabled=profile)
+    prepare_configs(
+        PATHS, env=env, clean=clean, jobs=jobs, strategy=strategy, profiler=profiler,
+        write_config=True, gh_action=not skip_gh_action,
+        languages=parse_languages(languages), changed_since=changed_since, nav_only=nav_only, vendor=vendor,
+    )
+    profiler.finish('build-config', profile_file or PATHS['cache_folder'] / 'profile-build-config.json')
 
 
 @cli.command(
     'build-local-site',
     short_help='Build static site to run locally'
 )
-def build_site():
+@click.option('--jobs', '-j', default=1, type=click.INT, help='Number of languages to build in parallel')
+@materialize_option('How to place the assets: copy, hardlink, reflink or copy_file_range')
+@site_options
+@selection_options
+@profile_options
+def build_site(
+    jobs, precompress, checksum, strategy, pdf_cache, pdf, deferred_pdf, incremental, languages, changed_since,
+    profile, profile_file,
+):
     """ Build the site """
     PATHS = get_paths(BASE_FOLDER)
-    custom_config = yaml.safe_load(open(PATHS['custom_config_file']))
-    languages = custom_config['site_name'].keys()
+    profiler = Profiler(enabled=profile)
+    config_files = get_language_config_files(PATHS)
+    site_languages, pdf_languages = None, None
+    if languages or changed_since:
+        configs = {language: read_language_config(config_file)[0] for language, config_file in config_files.items()}
+        site_languages, pdf_languages = select_languages(
+            PATHS, list(config_files), parse_languages(languages), changed_since,
+            pdf_template_folders(configs, PATHS['base_folder']),
+        )
+    build_site_folder(
+        PATHS, config_files, jobs=jobs, checksum=checksum, strategy=strategy, precompress=precompress,
+        pdf_cache=pdf_cache, pdf=pdf, deferred_pdf=deferred_pdf, profiler=profiler,
+        languages=site_languages, pdf_languages=pdf_languages, incremental=incremental,
+    )
+    profiler.finish('build-local-site', profile_file or PATHS['cache_folder'] / 'profile-build-local-site.json')
 
-    c = 0
-    for language in languages:
-        config_file = PATHS['base_config_folder'] / f'mkdocs-{language}.yml'
-        c += 1
-        dirty = c > 1
-        click.echo(f'Building site for {language} (dirty:{dirty})')
-        config = mkdocs_config.load_config(config_file=open(config_file))
-        build.build(config, dirty=dirty)
 
-    # Copy general assets (same for all languages).
-    src_folder = PATHS['user_assets_folder']
-    dst_folder = PATHS['site_assets_folder']
+@cli.command(
+    'build',
+    short_help='Build config and site in one step'
+)
+@click.option('--env', '-e', default='local', help='Environment to build for (local or prod)')
+@click.option('--clean', is_flag=True, help='Re-render all MD files, ignoring previous builds')
+@click.option('--jobs', '-j', default=1, type=click.INT, help='Number of processes to render MD files and build languages')
+@materialize_option('How to place non MD files (docs and assets): copy, hardlink, reflink or copy_file_range')
+@click.option(
+    '--write-config/--no-write-config', default=False,
+    help='Also write the conf/mkdocs-LANG.yml files (e.g. for the GitHub action)'
+)
+@nav_only_option
+@vendor_option
+@site_options
+@profile_options
+def build_all(
+    env, clean, jobs, strategy, write_config, nav_only, vendor, precompress, checksum, pdf_cache, pdf, deferred_pdf,
+    incremental, profile, profile_file,
+):
+    """ Build config and site in a single process, without writing and reading
+        the config files between both steps """
+    PATHS = get_paths(BASE_FOLDER)
+    profiler = Profiler(enabled=profile)
+    build_project(
+        PATHS, env=env, clean=clean, jobs=jobs, strategy=strategy, write_config=write_config,
+        checksum=checksum, precompress=precompress, pdf_cache=pdf_cache, pdf=pdf,
+        deferred_pdf=deferred_pdf, profiler=profiler, incremental=incremental, nav_only=nav_only, vendor=vendor,
+    )
+    profiler.finish('build', profile_file or PATHS['cache_folder'] / 'profile-build.json')
+
 
-    click.echo(f'Copying assets from {src_folder}  to {dst_folder}')
-    shutil.copytree(src_folder, dst_folder, dirs_exist_ok=True)
+@cli.command(
+    'build-pdf',
+    short_help='Build the PDF files'
+)
+@click.option(
+    '--lang', '-l', 'languages', multiple=True, help='Languages to build, e.g. --lang es,en (all languages by default)'
+)
+@click.option('--jobs', '-j', default=1, type=click.INT, help='Number of PDF files to build in parallel')
+@click.option('--pdf-cache/--no-pdf-cache', default=True, help='Reuse PDF files if their docs and templates did not change')
+@profile_options
+def build_pdf(languages, jobs, pdf_cache, profile, profile_file):
+    """ Build the PDF files (after build-config) into the site folder """
+    PATHS = get_paths(BASE_FOLDER)
+    profiler = Profiler(enabled=profile)
+    config_files = get_language_config_files(PATHS, parse_languages(languages))
+    pdf_cache_folder = PATHS['cache_folder'] / 'pdf' if pdf_cache else None
+    build_pdfs(config_files, jobs=jobs, pdf_cache_folder=pdf_cache_folder, profiler=profiler)
+    profiler.finish('build-pdf', profile_file or PATHS['cache_folder'] / 'profile-build-pdf.json')
 
 
 @cli.command(
@@ -184,19 +537,88 @@ def build_site():
     short_help='Serve static site'
 )
 @click.option('--port', '-p', default=8033, type=click.INT, help='Port for the test local erver')
-def serve(port):
-    import http.server
-    import socketserver
+@click.option('--watch', '-w', is_flag=True, help='Rebuild changed pages (without PDF) while serving')
+@click.option('--cache-control', default=DEFAULT_CACHE_CONTROL, help='Cache-Control header for all files')
+@vendor_option
+@click.pass_context
+def serve(ctx, port, watch, cache_control, vendor):
+    import threading
 
-    DIRECTORY = "site"
-
-    class Handler(http.server.SimpleHTTPRequestHandler):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, directory=DIRECTORY, **kwargs)
+    PATHS = get_paths(BASE_FOLDER)
+    # Absolute path, the working directory can change while rebuilding
+    DIRECTORY = PATHS['site_folder']
 
-    with socketserver.TCPServer(("", port), Handler) as httpd:
+    with make_server(DIRECTORY, port, cache_control=cache_control) as httpd:
         print(f"serving at http://localhost:{port}")
-        httpd.serve_forever()
+        if not watch:
+            httpd.serve_forever()
+            return
+
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        # Config changes build the configs again with the same options
+        watch_project(PATHS, rebuild_config=lambda: ctx.invoke(build_config, skip_gh_action=True, vendor=vendor))
+
+
+def socket_option(command):
+    return click.option(
+        '--socket', 'socket_path', type=click.Path(dir_okay=False),
+        help='Unix socket of the build daemon (default: .cache/daemon.sock)'
+    )(command)
+
+
+@cli.command(
+    'daemon',
+    short_help='Run a build daemon (warm mkdocs, plugins and templates) on a local Unix socket'
+)
+@socket_option
+def daemon(socket_path):
+    """ Keep the build tools loaded and run the build requests from daemon-build """
+    PATHS = get_paths(BASE_FOLDER)
+    serve_daemon(
+        socket_path or daemon_socket_path(PATHS),
+        build=lambda request: daemon_build(PATHS, request),
+        warm_up=lambda: warm_up_mkdocs(get_yaml(PATHS['base_config_file'])),
+    )
+
+
+@cli.command(
+    'daemon-build',
+    short_help='Send a build request to the build daemon'
+)
+@click.option(
+    '--lang', '-l', 'languages', multiple=True, help='Languages to build, e.g. --lang es,en (all languages by default)'
+)
+@click.option(
+    '--phase', '-p', 'phases', multiple=True, type=click.Choice(PHASES),
+    help='Build phases: config (configs and MD files), site and pdf (all by default)'
+)
+@click.option('--env', '-e', default='local', help='Environment to build for (local or prod)')
+@click.option('--clean', is_flag=True, help='Re-render all MD files, ignoring previous builds')
+@click.option('--jobs', '-j', default=1, type=click.INT, help='Number of processes to render MD files and build languages')
+@click.option('--pdf-cache/--no-pdf-cache', default=True, help='Reuse PDF files if their docs and templates did not change')
+@click.option('--incremental', is_flag=True, help='Build only the pages whose inputs changed since the last build')
+@nav_only_option
+@vendor_option
+@click.option('--stop', is_flag=True, help='Stop the build daemon')
+@socket_option
+def daemon_build_request(languages, phases, env, clean, jobs, pdf_cache, incremental, nav_only, vendor, stop, socket_path):
+    """ Build with the running daemon (see the daemon command) """
+    socket_path = socket_path or daemon_socket_path(get_paths(BASE_FOLDER))
+    if stop:
+        request = {'command': 'stop'}
+    else:
+        request = {
+            'command': 'build',
+            'languages': parse_languages(languages),
+            'phases': list(phases),
+            'options': {
+                'env': env, 'clean': clean, 'jobs': jobs, 'pdf_cache': pdf_cache,
+                'incremental': incremental, 'nav_only': nav_only, 'vendor': vendor,
+            },
+        }
+    response = send_request(socket_path, request, echo=click.echo)
+    if response['status'] != 'ok':
+        raise Exception(f'Build daemon error: {response["error"]}')
 
 
 @cli.command(
@@ -0,0 +1,101 @@
+""" Select the languages to build (--lang and --changed-since).
+    Changed files since a git ref are mapped (as in watch mode) to the
+    languages whose site must be rebuilt and the languages that only need
+    a new PDF file. Config changes and shared templates rebuild all languages.
+    PDF template changes are mapped to the languages using the template
+    (with-pdf custom_template_path), the same template can be shared """
+
+import os
+import git
+from helpers import get_list_setting
+from watch import get_change_target, is_ignored_file
+
+
+def parse_languages(values):
+    """ Languages from --lang options (repeated and/or comma separated) """
+    languages = []
+    for value in values or []:
+        for language in value.split(','):
+            language = language.strip()
+            if language and language not in languages:
+                languages.append(language)
+    return languages
+
+
+def changed_files(base_folder, ref):
+    """ Absolute paths of the files changed since a git ref: committed, staged
+        and unstaged changes (including removed files) and untracked files """
+    repo = git.Repo(base_folder, search_parent_directories=True)
+    try:
+        names = repo.git.diff('--name-only', '--no-renames', ref, '--').splitlines()
+    except git.exc.GitCommandError as e:
+        raise Exception(f'Unable to get the changes since "{ref}". Is it a valid git commit, branch or tag?') from e
+    names += repo.untracked_files
+    return [os.path.join(repo.working_tree_dir, name) for name in names]
+
+
+def pdf_template_folders(configs, base_folder):
+    """ PDF template folder (absolute path) of each language with a with-pdf custom_template_path.
+        configs: dict language -> mkdocs config (dict). The path is relative to the
+        working directory where mkdocs runs (the project folder) """
+    folders = {}
+    for language, config in configs.items():
+        settings = get_list_setting(config.get('plugins', []), 'with-pdf') or {}
+        if settings.get('custom_template_path'):
+            folders[language] = os.path.abspath(os.path.join(base_folder, settings['custom_template_path']))
+    return folders
+
+
+def get_change_targets(path, paths, template_folders):
+    """ Change targets (see watch.get_change_target) for a changed file.
+        A file in a PDF template folder is a ('pdf', language) target for each language
+        using that folder. Other files in the PDF folder are not used by any language """
+    path = os.path.abspath(path)
+    if is_ignored_file(path):
+        return set()
+    languages = [language for language, folder in template_folders.items() if path.startswith(folder + os.sep)]
+    if languages:
+        return {('pdf', language) for language in languages}
+    target = get_change_target(path, paths)
+    if target is None or target[0] == 'pdf':
+        return set()
+    return {target}
+
+
+def get_rebuild_plan(targets, all_languages):
+    """ Languages to rebuild for a set of change targets (see watch.get_change_target).
+        Return (site_languages, pdf_languages): languages whose MD files, site and PDF
+        must be built again and languages that only need a new PDF file """
+    if ('config', None) in targets or ('docs', None) in targets:
+        return list(all_languages), []
+    site_languages = [language for language in all_languages if ('docs', language) in targets]
+    pdf_languages = [
+        language for language in all_languages
+        if ('pdf', language) in targets and language not in site_languages
+    ]
+    return site_languages, pdf_languages
+
+
+def select_languages(paths, all_languages, languages=None, changed_since=None, template_folders=None):
+    """ Languages to build from the --lang and --changed-since options (all by default).
+        template_folders: PDF template folder of each language (see pdf_template_folders)
+        Return (site_languages, pdf_languages) as in get_rebuild_plan """
+    for language in languages or []:
+        if language not in all_languages:
+            raise Exception(f'Language "{language}" not found. Available languages: {", ".join(all_languages)}')
+
+    site_languages, pdf_languages = list(all_languages), []
+    if changed_since:
+        targets = set()
+        for path in changed_files(paths['base_folder'], changed_since):
+            targets |= get_change_targets(path, paths, template_folders or {})
+        site_languages, pdf_languages = get_rebuild_plan(targets, all_languages)
+        print(
+            f'Changes since {changed_since}: site for [{", ".join(site_languages)}], '
+            f'PDF only for [{", ".join(pdf_languages)}]'
+            + (', assets changed' if ('assets', None) in targets else '')
+        )
+    if languages:
+        site_languages = [language for language in site_languages if language in languages]
+        pdf_languages = [language for language in pdf_languages if language in languages]
+    return site_languages, pdf_languages
@@ -0,0 +1,231 @@
+""" Static server to preview the built site.
+    One thread per connection, HTTP/1.1 keep-alive, conditional requests
+    (ETag / Last-Modified) so browsers can revalidate their cached files
+    and byte ranges (PDF viewers) sent with sendfile for large files.
+    Precompressed copies (.br, .gz) are sent to the clients that accept them. """
+
+import email.utils
+from functools import partial
+from http import HTTPStatus
+import http.server
+import io
+import os
+import urllib.parse
+from compress import available_encodings, is_compressed_fresh, is_compressible
+
+
+DEFAULT_CACHE_CONTROL = 'no-cache'
+SENDFILE_MIN_SIZE = 64 * 1024
+COPY_BUFFER_SIZE = 64 * 1024
+
+
+def make_etag(fs):
+    """ ETag based on the file stat (changes on each new build of the file) """
+    return f'"{fs.st_ino:x}-{fs.st_mtime_ns:x}-{fs.st_size:x}"'
+
+
+class SiteRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """ Serve files with validators (ETag, Last-Modified) and Cache-Control headers """
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are sent in different writes, avoid delayed ACKs on keep-alive
+    disable_nagle_algorithm = True
+    # Close idle keep-alive connections
+    timeout = 30
+    cache_control = DEFAULT_CACHE_CONTROL
+
+    def find_index(self, path):
+        for index in "index.html", "index.htm":
+            index = os.path.join(path, index)
+            if os.path.isfile(index):
+                return index
+        return None
+
+    def is_not_modified(self, etag, mtime):
+        """ Check the conditional request headers (If-None-Match has precedence) """
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags or f'W/{etag}' in tags
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is None:
+            return False
+        try:
+            ims = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            # ignore ill-formed values
+            return False
+        return int(mtime) <= ims.timestamp()
+
+    def send_cache_headers(self, etag, fs, path):
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', self.date_time_string(fs.st_mtime))
+        self.send_header('Cache-Control', self.cache_control)
+        if is_compressible(path):
+            self.send_header('Vary', 'Accept-Encoding')
+
+    def if_range_matches(self, etag, mtime):
+        """ A Range request is only valid if If-Range (when sent) matches the current file """
+        if_range = self.headers.get('If-Range')
+        if if_range is None:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith(('"', 'W/')):
+            return if_range == etag
+        try:
+            date = email.utils.parsedate_to_datetime(if_range)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        return int(mtime) <= date.timestamp()
+
+    def accepted_encodings(self):
+        """ Content encodings accepted by the client (Accept-Encoding header) """
+        accepted = set()
+        for item in self.headers.get('Accept-Encoding', '').split(','):
+            encoding, _, params = item.partition(';')
+            name, _, value = params.partition('=')
+            try:
+                quality = float(value) if name.strip() == 'q' else 1
+            except ValueError:
+                quality = 0
+            if quality > 0:
+                accepted.add(encoding.strip().lower())
+        return accepted
+
+    def find_compressed(self, path):
+        """ Return a (encoding, path) tuple for an up to date precompressed copy
+            accepted by the client, or None.
+            Byte ranges are always served from the original file """
+        if 'Range' in self.headers or not is_compressible(path):
+            return None
+        accepted = self.accepted_encodings()
+        for encoding, extension in available_encodings():
+            if (encoding in accepted or '*' in accepted) and is_compressed_fresh(path, path + extension):
+                return encoding, path + extension
+        return None
+
+    def send_head(self):
+        self.range = None
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            index = self.find_index(path)
+            if index is None or not urllib.parse.urlsplit(self.path).path.endswith('/'):
+                # Redirects and directory listings
+                return super().send_head()
+            path = index
+        if path.endswith('/'):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        compressed = self.find_compressed(path)
+        encoding, file_path = compressed if compressed else (None, path)
+        try:
+            f = open(file_path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        try:
+            return self.send_file_head(f, path, encoding)
+        except Exception:
+            f.close()
+            raise
+
+    def send_file_head(self, f, path, encoding=None):
+        """ Send the headers for an open file: 304, 416, 206 (byte range) or 200.
+            f can be a precompressed copy of path (with its content encoding) """
+        fs = os.fstat(f.fileno())
+        # Each compressed copy has its own inode, so its own ETag
+        etag = make_etag(fs)
+        if self.is_not_modified(etag, fs.st_mtime):
+            f.close()
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_cache_headers(etag, fs, path)
+            self.end_headers()
+            return None
+
+        range_header = self.headers.get('Range')
+        try:
+            if range_header and self.if_range_matches(etag, fs.st_mtime):
+                self.range = parse_range(range_header, fs.st_size)
+        except ValueError:
+            f.close()
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header('Content-Range', f'bytes */{fs.st_size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return None
+
+        if self.range:
+            start, end = self.range
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{fs.st_size}')
+            self.send_header('Content-Length', str(end - start + 1))
+        else:
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Length', str(fs.st_size))
+        self.send_header('Content-type', self.guess_type(path))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_cache_headers(etag, fs, path)
+        self.end_headers()
+        return f
+
+    def copyfile(self, source, outputfile):
+        """ Send the file (or the requested range).
+            Large files are sent with sendfile (zero-copy) when the platform allows it """
+        if not isinstance(source, io.BufferedReader):
+            # Directory listings
+            return super().copyfile(source, outputfile)
+        if self.range:
+            offset, count = self.range[0], self.range[1] - self.range[0] + 1
+        else:
+            offset, count = 0, os.fstat(source.fileno()).st_size
+        if count >= SENDFILE_MIN_SIZE and outputfile is self.wfile:
+            # socket.sendfile uses os.sendfile and falls back to send() if not available
+            self.connection.sendfile(source, offset, count)
+            return
+
+        source.seek(offset)
+        while count > 0:
+            buf = source.read(min(COPY_BUFFER_SIZE, count))
+            if not buf:
+                break
+            outputfile.write(buf)
+            count -= len(buf)
+
+
+def parse_range(header, size):
+    """ Parse a Range header for a file size.
+        Return a (start, end) tuple (both included) or None to send the full file
+        (unknown units, multiple ranges or invalid values).
+        Raise ValueError if the range can't be satisfied """
+    units, _, ranges = header.partition('=')
+    if units.strip() != 'bytes' or ',' in ranges:
+        return None
+    start, sep, end = ranges.strip().partition('-')
+    if not sep or (start == '' and end == ''):
+        return None
+    if not all(value == '' or value.isdigit() for value in (start, end)):
+        return None
+    if start == '':
+        # Last N bytes
+        length = int(end)
+        if length == 0 or size == 0:
+            raise ValueError('Empty suffix range')
+        return max(0, size - length), size - 1
+    start = int(start)
+    end = size - 1 if end == '' else min(int(end), size - 1)
+    if start >= size:
+        raise ValueError('Range start after the end of the file')
+    if end < start:
+        return None
+    return start, end
+
+
+def make_server(directory, port, cache_control=DEFAULT_CACHE_CONTROL, host=''):
+    """ Threaded HTTP server for the directory """
+    handler_class = type('Handler', (SiteRequestHandler, ), {'cache_control': cache_control})
+    handler = partial(handler_class, directory=str(directory))
+    return http.server.ThreadingHTTPServer((host, port), handler)
@@ -0,0 +1,95 @@
+""" Incremental sync of the user assets into the site folder.
+    Only new or changed files are copied. A manifest of the synced files
+    allows to remove stale files without touching other files in the
+    same destination folder (e.g. the theme assets) """
+
+import os
+import shutil
+import time
+from materialize import DEFAULT_STRATEGY, materialize
+from render import hash_file, load_manifest, save_manifest, stat_signature
+
+
+ASSETS_MANIFEST = 'manifest-assets.json'
+
+
+def is_synced(orig_file, dest_file, checksum=False):
+    """ Check if the destination file is a copy of the original one.
+        Copies keep the original mtime, so size and mtime are enough
+        unless checksum is required """
+    if not os.path.exists(dest_file):
+        return False
+    if checksum:
+        return hash_file(orig_file) == hash_file(dest_file)
+    return stat_signature(orig_file) == stat_signature(dest_file)
+
+
+def new_sync_stats():
+    return {
+        'files_copied': 0,
+        'files_skipped': 0,
+        'files_removed': 0,
+        'bytes_copied': 0,
+        'bytes_skipped': 0,
+        'duration': 0,
+    }
+
+
+def sync_folder(src_folder, dst_folder, manifest_path=None, checksum=False, strategy=DEFAULT_STRATEGY):
+    """ Copy (materialize) new and changed files from src_folder to dst_folder.
+        Files synced in a previous run (listed in the manifest) and
+        removed from the src_folder are removed from the dst_folder.
+        Return a dict with stats """
+    start = time.perf_counter()
+    stats = new_sync_stats()
+    manifest = load_manifest(manifest_path)
+    synced = {}
+    for root, _, files in os.walk(src_folder):
+        rel_root = os.path.relpath(root, src_folder)
+        for file in sorted(files):
+            orig_file = os.path.join(root, file)
+            rel_path = os.path.normpath(os.path.join(rel_root, file))
+            dest_file = os.path.join(dst_folder, rel_path)
+            size = os.path.getsize(orig_file)
+            if is_synced(orig_file, dest_file, checksum=checksum):
+                stats['files_skipped'] += 1
+                stats['bytes_skipped'] += size
+            else:
+                os.makedirs(os.path.dirname(dest_file), exist_ok=True)
+                materialize(orig_file, dest_file, strategy)
+                # Keep the mtime, used to detect changes on the next sync
+                shutil.copystat(orig_file, dest_file)
+                stats['files_copied'] += 1
+                stats['bytes_copied'] += size
+            synced[rel_path] = stat_signature(orig_file)
+
+    for rel_path in manifest['files']:
+        dest_file = os.path.join(dst_folder, rel_path)
+        if rel_path not in synced and os.path.exists(dest_file):
+            os.remove(dest_file)
+            stats['files_removed'] += 1
+
+    manifest['files'] = synced
+    save_manifest(manifest_path, manifest)
+    stats['duration'] = time.perf_counter() - start
+    return stats
+
+
+def synced_files(manifest_path):
+    """ Relative paths of the files synced in the last run """
+    return set(load_manifest(manifest_path)['files'])
+
+
+def sync_assets(paths, checksum=False, strategy=DEFAULT_STRATEGY):
+    """ Sync the user assets (for all languages) into the site assets folder """
+    src_folder = paths['user_assets_folder']
+    dst_folder = paths['site_assets_folder']
+    print(f'Syncing assets from {src_folder} to {dst_folder}')
+    manifest_path = os.path.join(paths['cache_folder'], ASSETS_MANIFEST)
+    stats = sync_folder(src_folder, dst_folder, manifest_path, checksum=checksum, strategy=strategy)
+    print(
+        f'Assets: {stats["files_copied"]} copied ({stats["bytes_copied"]} bytes), '
+        f'{stats["files_skipped"]} unchanged ({stats["bytes_skipped"]} bytes), '
+        f'{stats["files_removed"]} removed in {stats["duration"]:.2f}s'
+    )
+    return stats
@@ -0,0 +1,146 @@
+""" Local copies of the remote assets used by the site and the PDF (--vendor).
+    Remote URLs in the resolved configs (theme logo and favicon, PDF cover logo,
+    extra JS and CSS files) are downloaded once into a content-addressed cache
+    (.cache/vendor/objects, each file named by the sha256 of its content) and
+    the configs are changed to use the local copies, synced into the site
+    assets folder. URLs found in the cache index are not downloaded again,
+    so builds work offline after the first one """
+
+import hashlib
+from http.client import IncompleteRead
+import os
+import tempfile
+from urllib.parse import urlparse
+from urllib.request import urlopen
+from helpers import get_list_setting, overlay, overlay_list_setting
+from materialize import DEFAULT_STRATEGY
+from render import HASH_CHUNK_SIZE, load_manifest, save_manifest
+from sync import sync_folder, synced_files
+
+
+# Folder name in the cache folder and in the site assets folder
+VENDOR_FOLDER = 'vendor'
+VENDOR_MANIFEST = 'manifest-vendor.json'
+DOWNLOAD_TIMEOUT = 30
+
+
+def is_remote(url):
+    return isinstance(url, str) and urlparse(url).scheme in ('http', 'https')
+
+
+def asset_url(entry):
+    """ URL of an extra_javascript/extra_css entry (a string or a dict with a path) """
+    return entry.get('path') if isinstance(entry, dict) else entry
+
+
+def remote_assets(config):
+    """ Remote URLs used by a language config (unique, in order) """
+    urls = []
+    theme = config.get('theme')
+    if isinstance(theme, dict):
+        urls += [theme.get('logo'), theme.get('favicon')]
+    pdf_plugin = get_list_setting(config.get('plugins', []), 'with-pdf') or {}
+    urls.append(pdf_plugin.get('cover_logo'))
+    for key in ('extra_javascript', 'extra_css'):
+        urls += [asset_url(entry) for entry in config.get(key, [])]
+    return list(dict.fromkeys(url for url in urls if is_remote(url)))
+
+
+def download(url, objects_folder):
+    """ Download a URL into the objects folder.
+        Return the file name: the sha256 of the content and the URL file extension """
+    os.makedirs(objects_folder, exist_ok=True)
+    sha = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=objects_folder, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f, urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            for chunk in iter(lambda: response.read(HASH_CHUNK_SIZE), b''):
+                sha.update(chunk)
+                f.write(chunk)
+            if response.length:
+                # Reading by chunks doesn't check the Content-Length (a closed connection is the end)
+                raise IncompleteRead(b'', response.length)
+        extension = os.path.splitext(urlparse(url).path)[1][:10]
+        name = f'{sha.hexdigest()}{extension}'
+        os.replace(tmp_path, os.path.join(objects_folder, name))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return name
+
+
+def vendor_assets(urls, cache_folder):
+    """ Local copy (file name in the objects folder) of each URL.
+        Only the URLs not in the cache index are downloaded. URLs that can't
+        be downloaded are not included (the remote URL is used) """
+    vendor_folder = os.path.join(cache_folder, VENDOR_FOLDER)
+    objects_folder = os.path.join(vendor_folder, 'objects')
+    index_path = os.path.join(vendor_folder, 'index.json')
+    index = load_manifest(index_path)
+    local = {}
+    for url in urls:
+        name = index['files'].get(url)
+        if not name or not os.path.isfile(os.path.join(objects_folder, name)):
+            try:
+                name = download(url, objects_folder)
+            except (OSError, ValueError, IncompleteRead) as e:
+                print(f'Unable to download {url} ({e}), using the remote URL')
+                continue
+            print(f'Downloaded {url} -> {name}')
+            index['files'][url] = name
+            save_manifest(index_path, index)
+        local[url] = name
+    return local
+
+
+def vendor_config(config, local, objects_folder, config_folder):
+    """ Language config with the remote assets replaced by their local copies.
+        The site uses the copies in the site assets folder and the PDF cover
+        logo the cached file, relative to the config folder (as the other paths
+        in the config, see builder.resolve_cover_logo).
+        The config is not changed (see helpers.overlay) """
+    assets_folder = config['extra']['assets_folder']
+
+    def site_url(url):
+        return f'{assets_folder}/{VENDOR_FOLDER}/{local[url]}' if url in local else url
+
+    def site_entry(entry):
+        url = asset_url(entry)
+        if url not in local:
+            return entry
+        return overlay(entry, path=site_url(url)) if isinstance(entry, dict) else site_url(url)
+
+    changes = {key: [site_entry(entry) for entry in config.get(key, [])] for key in ('extra_javascript', 'extra_css')}
+    theme = config.get('theme')
+    if isinstance(theme, dict):
+        changes['theme'] = overlay(theme, **{key: site_url(theme[key]) for key in ('logo', 'favicon') if key in theme})
+    pdf_plugin = get_list_setting(config.get('plugins', []), 'with-pdf') or {}
+    if pdf_plugin.get('cover_logo') in local:
+        cover_logo = os.path.relpath(os.path.join(objects_folder, local[pdf_plugin['cover_logo']]), config_folder)
+        changes['plugins'] = overlay_list_setting(config['plugins'], 'with-pdf', cover_logo=cover_logo)
+    return overlay(config, **changes)
+
+
+def vendor_configs(configs, paths, strategy=DEFAULT_STRATEGY):
+    """ Vendor the remote assets of all the language configs (dict language -> config)
+        and sync the local copies into the site assets folder. Return the new configs """
+    urls = list(dict.fromkeys(url for config in configs.values() for url in remote_assets(config)))
+    local = vendor_assets(urls, paths['cache_folder'])
+    objects_folder = os.path.join(paths['cache_folder'], VENDOR_FOLDER, 'objects')
+    if local:
+        stats = sync_folder(
+            objects_folder, os.path.join(paths['site_assets_folder'], VENDOR_FOLDER),
+            os.path.join(paths['cache_folder'], VENDOR_MANIFEST), strategy=strategy,
+        )
+        print(f'Vendored assets: {len(local)} of {len(urls)} remote URLs, {stats["files_copied"]} copied to the site')
+    return {
+        language: vendor_config(config, local, objects_folder, paths['base_config_folder'])
+        for language, config in configs.items()
+    }
+
+
+def vendored_files(paths):
+    """ Paths (relative to the site folder) of the local copies synced into the site """
+    assets_path = os.path.relpath(paths['site_assets_folder'], paths['site_folder'])
+    manifest_path = os.path.join(paths['cache_folder'], VENDOR_MANIFEST)
+    return {os.path.join(assets_path, VENDOR_FOLDER, rel_path) for rel_path in synced_files(manifest_path)}
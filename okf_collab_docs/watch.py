@@ -0,0 +1,179 @@
+""" Watch the project sources and rebuild only what changed.
+    PDF files are not generated in watch mode. """
+
+import os
+import queue
+import time
+from builder import build_language
+from helpers import load_yaml, update_md_files
+from render import new_jinja_env
+from sync import sync_assets
+
+
+# Wait for this time (seconds) without new changes before rebuilding
+DEBOUNCE_TIME = 0.2
+IGNORED_SUFFIXES = ('~', '.swp', '.swx', '.tmp')
+
+
+def is_ignored_file(path):
+    """ Hidden and temporary (editor) files """
+    name = os.path.basename(path)
+    return name.startswith('.') or name.endswith(IGNORED_SUFFIXES)
+
+
+def get_change_target(path, paths):
+    """ Detect what needs to be rebuilt for a changed file.
+        Return a (kind, language) tuple or None if the file is not relevant.
+        Kinds: docs (language=None for shared templates), assets, config or pdf.
+        PDF templates can be shared by several languages, the languages using
+        a template folder are found in their configs (see selection.get_change_targets) """
+    path = os.path.abspath(path)
+    if is_ignored_file(path):
+        return None
+
+    docs_root = os.path.join(paths['base_page_folder'], 'docs')
+    if path.startswith(docs_root + os.sep):
+        folder = os.path.relpath(path, docs_root).split(os.sep)[0]
+        if folder.startswith('fixed-docs-'):
+            return None
+        if folder.startswith('docs-'):
+            return 'docs', folder[len('docs-'):]
+        # shared templates (includes, macros)
+        return 'docs', None
+
+    if path.startswith(str(paths['user_assets_folder']) + os.sep):
+        return 'assets', None
+
+    pdf_root = os.path.join(paths['base_page_folder'], 'pdf')
+    if path.startswith(pdf_root + os.sep):
+        return 'pdf', None
+
+    config_folder = str(paths['base_config_folder'])
+    name = os.path.basename(path)
+    if os.path.dirname(path) == config_folder and name.endswith('.yml') and not name.startswith('mkdocs-'):
+        return 'config', None
+
+    return None
+
+
+def get_languages(paths):
+    """ Languages defined in the custom config file """
+    with open(paths['custom_config_file']) as f:
+        return list(load_yaml(f)['site_name'].keys())
+
+
+class Rebuilder:
+    """ Rebuild the site parts affected by a group of changes """
+
+    def __init__(self, paths, rebuild_config):
+        self.paths = paths
+        # rebuild_config: function to build all the mkdocs-LANG.yml files again
+        self.rebuild_config = rebuild_config
+        self.jinja_env = None
+
+    def config_file(self, language):
+        return self.paths['base_config_folder'] / f'mkdocs-{language}.yml'
+
+    def render_language(self, language):
+        """ Render again the changed MD files for a language (based on its final config file) """
+        with open(self.config_file(language)) as f:
+            config = load_yaml(f)
+        parts = config['docs_dir'].split('/')
+        parts[-1] = parts[-1].replace('fixed-', '', 1)
+        docs_dir = '/'.join(parts)
+        if self.jinja_env is None:
+            docs_root = os.path.join(self.paths['base_config_folder'], os.path.dirname(docs_dir))
+            self.jinja_env = new_jinja_env(docs_root, self.paths['cache_folder'] / 'jinja')
+        update_md_files(
+            docs_dir, self.paths['base_config_folder'], context=config['extra'],
+            cache_folder=self.paths['cache_folder'], jinja_env=self.jinja_env,
+        )
+
+    def rebuild(self, targets):
+        """ Rebuild the site for a set of (kind, language) targets """
+        start = time.perf_counter()
+        kinds = {kind for kind, _ in targets}
+        if 'config' in kinds:
+            print('Config files changed, rebuilding all languages')
+            self.rebuild_config()
+            languages = get_languages(self.paths)
+        else:
+            languages = {language for kind, language in targets if kind == 'docs' and language}
+            if ('docs', None) in targets:
+                # shared templates are used by any language
+                languages = get_languages(self.paths)
+            for language in sorted(languages):
+                self.render_language(language)
+
+        for language in sorted(languages):
+            print(f'Building site for {language} (no PDF)')
+            build_language(self.config_file(language), dirty=True, pdf=False)
+
+        if 'assets' in kinds:
+            sync_assets(self.paths)
+        if 'pdf' in kinds:
+            print('PDF templates changed. PDF files are not generated in watch mode')
+        print(f'Rebuilt in {time.perf_counter() - start:.2f}s')
+
+
+def collect_changes(changes, paths):
+    """ Wait for a group of changes (from a queue of paths) and return their targets """
+    targets = set()
+    path = changes.get()
+    while True:
+        target = get_change_target(path, paths)
+        if target:
+            targets.add(target)
+        try:
+            path = changes.get(timeout=DEBOUNCE_TIME)
+        except queue.Empty:
+            return targets
+
+
+def start_observer(paths, changes):
+    """ Start watching docs, assets, config and PDF template folders.
+        Changed paths are added to the changes queue """
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            changes.put(event.src_path)
+            if getattr(event, 'dest_path', None):
+                changes.put(event.dest_path)
+
+    folders = [
+        (os.path.join(paths['base_page_folder'], 'docs'), True),
+        (paths['user_assets_folder'], True),
+        (os.path.join(paths['base_page_folder'], 'pdf'), True),
+        (paths['base_config_folder'], False),
+    ]
+    observer = Observer()
+    for folder, recursive in folders:
+        if os.path.exists(folder):
+            print(f'Watching {folder}')
+            observer.schedule(Handler(), str(folder), recursive=recursive)
+    observer.start()
+    return observer
+
+
+def watch(paths, rebuild_config):
+    """ Watch the project forever, rebuilding the site on changes """
+    changes = queue.Queue()
+    observer = start_observer(paths, changes)
+    rebuilder = Rebuilder(paths, rebuild_config)
+    try:
+        while True:
+            targets = collect_changes(changes, paths)
+            if not targets:
+                continue
+            try:
+                rebuilder.rebuild(targets)
+            except Exception as e:
+                # Keep watching, the user will fix the error
+                print(f'Error rebuilding the site: {e}')
+    finally:
+        observer.stop()
+        observer.join()
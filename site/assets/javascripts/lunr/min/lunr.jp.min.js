@@ -0,0 +1 @@
+module.exports=require("./lunr.ja");
\ No newline at end of file
@@ -0,0 +1,5 @@
+$( document ).ready(function() {
+
+	$("h1").addClass("some-red-text");
+
+});
\ No newline at end of file
@@ -0,0 +1,182 @@
+""" Build benchmark on synthetic projects.
+    Run with: python tests/bench_build.py [--languages N] [--pages M] [--depth D] ...
+    A project with N languages x M pages (in folders up to D levels deep) is generated
+    in a temp folder with a copy of the tool. Then build-config and build-local-site
+    (without PDF by default) are run twice each: a cold build and a warm build
+    without changes. Then the same for the single step build command. Results (wall time and the --profile report of each run)
+    are printed as JSON to compare them across releases. """
+
+import argparse
+import json
+import os
+from pathlib import Path
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import yaml
+
+
+BASE_FOLDER = Path(__file__).resolve().parent.parent
+# Languages supported by the theme and the search plugin
+LANGUAGES = ['en', 'es', 'pt', 'fr', 'de', 'it', 'nl', 'ru', 'sv', 'tr', 'fi', 'da', 'hu', 'ro', 'no']
+WORDS = 'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt'.split()
+
+
+def page_path(n, depth):
+    """ Relative path for page n, in folders up to depth levels deep """
+    levels = n % (depth + 1)
+    folders = [f'section-{level}-{n % (level + 2)}' for level in range(levels)]
+    return '/'.join(folders + [f'page-{n}.md'])
+
+
+def page_content(n, paragraphs, jinja):
+    lines = [f'# Page {n}', '']
+    for p in range(paragraphs):
+        words = ' '.join(random.choice(WORDS) for _ in range(60))
+        if jinja:
+            words += ' {{ bench_var }} {{ bench_obj.value }}'
+        lines += [words, '']
+    if jinja:
+        lines += ['{% for item in bench_list %}', ' - {{ item }}', '{% endfor %}', '']
+    return '\n'.join(lines)
+
+
+def write_random_file(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(os.urandom(size))
+
+
+def generate_docs(docs_folder, args):
+    """ Write the MD files and images of a language. Return its nav """
+    (docs_folder / 'index.md').parent.mkdir(parents=True, exist_ok=True)
+    (docs_folder / 'index.md').write_text('# Home\n\n{{ bench_var }}\n')
+    nav = [{'Home': 'index.md'}]
+    for n in range(args.pages):
+        rel_path = page_path(n, args.depth)
+        path = docs_folder / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(page_content(n, args.paragraphs, random.random() < args.jinja_ratio))
+        nav.append({f'Page {n}': rel_path})
+    for n in range(args.images):
+        write_random_file(docs_folder / 'img' / f'image-{n}.png', args.asset_size * 1024)
+    return nav
+
+
+def generate_project(folder, args):
+    """ Create a synthetic project (with a copy of the tool) in folder """
+    if args.languages > len(LANGUAGES):
+        raise Exception(f'Max languages: {len(LANGUAGES)}')
+    random.seed(args.seed)
+    folder = Path(folder)
+    shutil.copytree(BASE_FOLDER / 'okf_collab_docs', folder / 'okf_collab_docs',
+                    ignore=shutil.ignore_patterns('__pycache__'))
+    (folder / 'conf').mkdir(parents=True)
+    shutil.copy(BASE_FOLDER / 'conf' / 'base.yml', folder / 'conf' / 'base.yml')
+
+    languages = LANGUAGES[:args.languages]
+    custom = {
+        'site_name': {}, 'site_description': {}, 'site_author': {}, 'copyright': {},
+        'repo_user': 'okfn', 'repo_name': 'bench',
+        'custom_extra': {
+            'alternate': [{'name': language, 'lang': language} for language in languages],
+            'bench_var': 'Benchmark variable',
+            'bench_obj': {'value': 'Benchmark object'},
+            'bench_list': ['one', 'two', 'three'],
+        },
+        'nav': {},
+    }
+    for language in languages:
+        for key in ('site_name', 'site_description', 'site_author', 'copyright'):
+            custom[key][language] = f'{key} {language}'
+        docs_folder = folder / 'page' / 'docs' / f'docs-{language}'
+        custom['nav'][f'nav-{language}'] = generate_docs(docs_folder, args)
+        shutil.copytree(BASE_FOLDER / 'page' / 'pdf' / 'pdf-template-en', folder / 'page' / 'pdf' / f'pdf-template-{language}')
+    with open(folder / 'conf' / 'custom.yml', 'w') as f:
+        yaml.dump(custom, f, allow_unicode=True)
+
+    for n in range(args.assets):
+        write_random_file(folder / 'page' / 'assets' / 'img' / f'asset-{n}.jpg', args.asset_size * 1024)
+    shutil.copytree(BASE_FOLDER / 'page' / 'assets' / 'css', folder / 'page' / 'assets' / 'css')
+    shutil.copytree(BASE_FOLDER / 'page' / 'assets' / 'js', folder / 'page' / 'assets' / 'js')
+    return folder
+
+
+def run_command(folder, name, command):
+    """ Run a tool command in the project. Return its wall time and profile report """
+    profile_file = folder / '.cache' / f'bench-{name}.json'
+    cmd = [sys.executable, str(folder / 'okf_collab_docs' / 'run.py')] + command + [
+        '--profile', '--profile-file', str(profile_file),
+    ]
+    start = time.perf_counter()
+    result = subprocess.run(cmd, cwd=folder, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        raise Exception(f'Command failed: {" ".join(command)}\n{result.stdout}\n{result.stderr}')
+    with open(profile_file) as f:
+        profile = json.load(f)
+    return {'name': name, 'command': command, 'wall': round(wall, 3), 'profile': profile}
+
+
+def run_benchmark(folder, args):
+    """ Cold and warm runs of build-config and build-local-site, then of build """
+    jobs = ['--jobs', str(args.jobs)]
+    pdf = [] if args.pdf else ['--no-pdf']
+    site_command = ['build-local-site'] + jobs + pdf
+    runs = [
+        ('build-config-cold', ['build-config', '--skip-gh-action'] + jobs),
+        ('build-config-warm', ['build-config', '--skip-gh-action'] + jobs),
+        ('build-local-site-cold', site_command),
+        ('build-local-site-warm', site_command),
+        ('build-cold', ['build', '--clean'] + jobs + pdf),
+        ('build-warm', ['build'] + jobs + pdf),
+    ]
+    return [run_command(folder, name, command) for name, command in runs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--languages', type=int, default=2)
+    parser.add_argument('--pages', type=int, default=50, help='Pages per language')
+    parser.add_argument('--depth', type=int, default=2, help='Max folder depth for the pages')
+    parser.add_argument('--paragraphs', type=int, default=10, help='Paragraphs per page')
+    parser.add_argument('--jinja-ratio', type=float, default=0.5, help='Ratio of pages with Jinja markup')
+    parser.add_argument('--images', type=int, default=5, help='Images in each docs folder')
+    parser.add_argument('--assets', type=int, default=20, help='Images in page/assets')
+    parser.add_argument('--asset-size', type=int, default=100, help='Size of each image (KB)')
+    parser.add_argument('--jobs', type=int, default=1)
+    parser.add_argument('--pdf', action='store_true', help='Build the PDF files too')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='Write the JSON results to this file')
+    parser.add_argument('--keep', action='store_true', help='Keep (and print) the generated project folder')
+    args = parser.parse_args()
+
+    folder = Path(tempfile.mkdtemp(prefix='okf-bench-'))
+    try:
+        generate_project(folder, args)
+        results = {
+            'params': vars(args),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'runs': run_benchmark(folder, args),
+        }
+    finally:
+        if args.keep:
+            print(f'Project kept at {folder}', file=sys.stderr)
+        else:
+            shutil.rmtree(folder)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
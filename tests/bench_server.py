@@ -0,0 +1,130 @@
+""" Throughput benchmark: original serve handler vs the threaded site server.
+    Run with: python tests/bench_server.py [--requests N] [--clients N]
+    While the clients request small pages, a slow client downloads a large file
+    (like a PDF). Results are printed as JSON. """
+
+import argparse
+import http.client
+import http.server
+import json
+import os
+from pathlib import Path
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'okf_collab_docs'))
+from server import make_server  # noqa: E402
+
+
+class QuietLegacyHandler(http.server.SimpleHTTPRequestHandler):
+    """ Handler used by the serve command before the site server """
+    def log_message(self, format, *args):
+        pass
+
+
+class QuietLegacyServer(socketserver.TCPServer):
+    allow_reuse_address = True
+
+    def handle_error(self, request, client_address):
+        # The slow client is disconnected at the end
+        pass
+
+
+def make_legacy_server(directory):
+    def handler(*args, **kwargs):
+        return QuietLegacyHandler(*args, directory=str(directory), **kwargs)
+    return QuietLegacyServer(('127.0.0.1', 0), handler)
+
+
+def make_quiet_server(directory):
+    httpd = make_server(directory, 0, host='127.0.0.1')
+    httpd.RequestHandlerClass.func.log_message = lambda *args: None
+    httpd.handle_error = lambda *args: None
+    return httpd
+
+
+def create_site(folder, pages, large_size):
+    for n in range(pages):
+        (folder / f'page{n}.html').write_text(f'<h1>Page {n}</h1>' + 'text ' * 2000)
+    with open(folder / 'doc.pdf', 'wb') as f:
+        f.write(os.urandom(large_size))
+
+
+def slow_download(port, stop):
+    """ Download the large file reading a small chunk at a time """
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    conn.request('GET', '/doc.pdf')
+    response = conn.getresponse()
+    while not stop.is_set() and response.read(16 * 1024):
+        time.sleep(0.01)
+    conn.close()
+
+
+def client(port, pages, requests, keep_alive, errors):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    for n in range(requests):
+        try:
+            conn.request('GET', f'/page{n % pages}.html')
+            conn.getresponse().read()
+        except (OSError, http.client.HTTPException):
+            errors.append(n)
+            conn.close()
+        if not keep_alive:
+            conn.close()
+
+
+def run(httpd, args, keep_alive):
+    port = httpd.server_address[1]
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    stop = threading.Event()
+    slow = threading.Thread(target=slow_download, args=(port, stop), daemon=True)
+    slow.start()
+    time.sleep(0.1)
+
+    errors = []
+    start = time.perf_counter()
+    clients = [
+        threading.Thread(target=client, args=(port, args.pages, args.requests, keep_alive, errors))
+        for _ in range(args.clients)
+    ]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    duration = time.perf_counter() - start
+
+    stop.set()
+    httpd.shutdown()
+    httpd.server_close()
+    total = args.requests * args.clients
+    return {
+        'requests': total,
+        'errors': len(errors),
+        'duration': round(duration, 3),
+        'requests_per_second': round(total / duration, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=200, help='Requests per client')
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--pages', type=int, default=50)
+    parser.add_argument('--large-size', type=int, default=20 * 1024 * 1024, help='Size of the large file (bytes)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+        create_site(folder, args.pages, args.large_size)
+        results = {
+            'legacy': run(make_legacy_server(folder), args, keep_alive=False),
+            'site_server': run(make_quiet_server(folder), args, keep_alive=True),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
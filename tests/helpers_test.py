@@ -1,8 +1,9 @@
 import copy
+import io
 import os
 from unittest.mock import patch
 from click.testing import CliRunner
-from helpers import get_yaml
+from helpers import get_yaml, read_yaml_source
 from run import build_config
 
 
@@ -42,7 +43,7 @@ def side_open_read(path, result=None, replace_path=None):
             return original_open_fn(*args, **kwargs)
         if args[0] == path:
             if result:
-                return result
+                return io.StringIO(result)
             elif replace_path:
                 return original_open_fn(replace_path, 'r', **kwargs)
         else:
@@ -84,7 +85,11 @@ def build_overrided(
     }
     side_effect = get_yaml_and_override(overrides)
 
-    with patch('run.get_yaml') as get_yaml:
+    def read_source(path):
+        # The overrides change the config files (and the config cache key)
+        return read_yaml_source(path) + repr(overrides.get(path))
+
+    with patch('run.get_yaml') as get_yaml, patch('run.read_yaml_source', side_effect=read_source):
         get_yaml.side_effect = side_effect
         runner = CliRunner()
         result = runner.invoke(build_config, [f'--env={env}'] + extra_build_params)
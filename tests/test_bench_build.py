@@ -0,0 +1,21 @@
+from argparse import Namespace
+from bench_build import generate_project, run_command
+import yaml
+
+
+def test_bench_project(tmp_path):
+    args = Namespace(
+        languages=2, pages=6, depth=2, paragraphs=2, jinja_ratio=0.5,
+        images=1, assets=1, asset_size=1, seed=1,
+    )
+    folder = generate_project(tmp_path / 'project', args)
+
+    custom = yaml.safe_load((folder / 'conf' / 'custom.yml').read_text())
+    assert list(custom['site_name']) == ['en', 'es']
+    assert len(custom['nav']['nav-es']) == 7
+    assert (folder / 'page' / 'docs' / 'docs-es' / 'section-0-1' / 'section-1-2' / 'page-5.md').exists()
+
+    result = run_command(folder, 'build-config', ['build-config', '--skip-gh-action'])
+    phases = {(phase['name'], phase['language']) for phase in result['profile']['phases']}
+    assert ('render MD files', 'es') in phases
+    assert (folder / 'page' / 'docs' / 'fixed-docs-es' / 'index.md').read_text() == '# Home\n\nBenchmark variable\n'
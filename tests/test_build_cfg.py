@@ -1,3 +1,4 @@
+import copy
 from unittest.mock import patch
 from click.testing import CliRunner
 import pytest
@@ -5,6 +6,7 @@ from run import (
     BASE_FOLDER,
     build_config,
     get_paths,
+    resolve_configs,
 )
 from helpers import get_yaml
 from helpers_test import (
@@ -119,3 +121,55 @@ def test_PDF_url():
     assert res['extra']['pdf_url'] == f"{site_url}/es/pdf/doc-es.pdf"
     # Check nav menu
     assert ['PDF'] in [list(val.keys()) for val in res['nav']]
+
+
+def test_language_configs_isolated():
+    """ Language configs share the unchanged settings but never change each other """
+    base_config = get_yaml(PATHS['base_config_file'])
+    custom_config = get_yaml(PATHS['custom_config_file'])
+    orig_base_config = copy.deepcopy(base_config)
+
+    configs = resolve_configs(base_config, custom_config)
+
+    assert base_config == orig_base_config
+    en, es = configs['en'], configs['es']
+    assert (en['theme']['language'], es['theme']['language']) == ('en', 'es')
+    assert en['plugins'][0]['search']['lang'] == 'en'
+    assert es['plugins'][1]['with-pdf']['output_path'] == 'pdf/doc-es.pdf'
+    assert [item for item in en['nav'] if 'PDF' in item] == [{'PDF': en['extra']['pdf_url']}]
+    assert [item for item in es['nav'] if 'PDF' in item] == [{'PDF': es['extra']['pdf_url']}]
+    assert 'PDF' not in str(custom_config['nav'])
+    # Unchanged settings are shared
+    assert en['markdown_extensions'] is es['markdown_extensions']
+    assert en['theme']['palette'] is es['theme']['palette']
+
+
+def test_custom_config_overrides():
+    """ Settings from custom.yml override the base ones (as any other setting) """
+    base_config = get_yaml(PATHS['base_config_file'])
+    custom_config = get_yaml(PATHS['custom_config_file'])
+    custom_config.update({
+        'theme': {'name': 'mkdocs'},
+        'plugins': [{'search': {}}, {'with-pdf': {'cover': False}}],
+        'extra_css': ['/css/other.css', 'https://example.com/style.css'],
+        'extra_javascript': ['/js/other.js'],
+        'extra': {'assets_folder': '/static', 'my_value': 'custom'},
+    })
+
+    es = resolve_configs(base_config, custom_config)['es']
+
+    assert es['theme'] == {'name': 'mkdocs', 'language': 'es'}
+    assert es['plugins'] == [
+        {'search': {'lang': 'es'}},
+        {'with-pdf': {
+            'cover': False, 'output_path': 'pdf/doc-es.pdf', 'cover_title': 'Mi sitio',
+            'cover_subtitle': es['site_description'], 'author': 'Yo yo@okfn.org',
+        }},
+    ]
+    assert es['extra_css'] == ['/static/css/other.css', 'https://example.com/style.css']
+    assert es['extra_javascript'] == ['/static/js/other.js']
+    assert es['extra']['my_value'] == 'custom'
+    assert es['extra']['assets_folder'] == '/static'
+    # Values from custom_extra are added
+    for key, value in custom_config['custom_extra'].items():
+        assert es['extra'][key] == value
@@ -0,0 +1,177 @@
+import logging
+from unittest.mock import ANY, call, patch
+import yaml
+import copy
+from builder import build_sites, in_memory_config, load_language_config, resolve_cover_logo
+
+
+def create_project(base_folder, languages):
+    """ Create a minimal mkdocs project (no PDF) with one config file per language.
+        Return the config files dict and the site folder """
+    conf_folder = base_folder / 'conf'
+    conf_folder.mkdir()
+    config_files = {}
+    for language in languages:
+        docs_folder = base_folder / 'page' / f'fixed-docs-{language}'
+        docs_folder.mkdir(parents=True)
+        (docs_folder / 'index.md').write_text(f'# Home {language}')
+        # Bigger languages should be built first
+        for n in range(len(language)):
+            (docs_folder / f'page{n}.md').write_text(f'# Page {n} ' * 100)
+        config = {
+            'site_name': f'Site {language}',
+            'docs_dir': f'../page/fixed-docs-{language}',
+            'site_dir': '../site' if language == 'en' else f'../site/{language}',
+            'theme': {'name': 'mkdocs'},
+            'plugins': ['search'],
+        }
+        config_file = conf_folder / f'mkdocs-{language}.yml'
+        config_file.write_text(yaml.dump(config))
+        config_files[language] = config_file
+
+    return config_files, base_folder / 'site'
+
+
+def test_build_sites_parallel(tmp_path):
+    config_files, site_folder = create_project(tmp_path, ['en', 'es', 'pt'])
+    site_folder.mkdir()
+    (site_folder / 'old-file.html').write_text('stale')
+
+    build_sites(config_files, site_folder, jobs=3)
+
+    assert not (site_folder / 'old-file.html').exists()
+    # The EN root build must not clean other languages
+    assert 'Home en' in (site_folder / 'index.html').read_text()
+    assert 'Home es' in (site_folder / 'es' / 'index.html').read_text()
+    assert 'Home pt' in (site_folder / 'pt' / 'index.html').read_text()
+    assert (site_folder / 'es' / 'search' / 'search_index.json').exists()
+
+
+def test_build_sites_no_dirty_warning(tmp_path, caplog):
+    config_files, site_folder = create_project(tmp_path, ['en', 'es'])
+    caplog.set_level(logging.INFO)
+    build_sites(config_files, site_folder)
+    # The site folder is cleaned once, the dirty builds of each language are expected
+    assert "A 'dirty' build is being performed" not in caplog.text
+    assert 'Documentation built' in caplog.text
+
+
+def test_build_sites_sequential_order(tmp_path, capsys):
+    config_files, site_folder = create_project(tmp_path, ['en', 'esp'])
+
+    build_sites(config_files, site_folder, jobs=1)
+
+    out = capsys.readouterr().out
+    assert out.index('Building site for esp') < out.index('Building site for en')
+    assert (site_folder / 'index.html').exists()
+    assert (site_folder / 'esp' / 'index.html').exists()
+
+
+def test_build_sites_keep_files(tmp_path):
+    config_files, site_folder = create_project(tmp_path, ['en'])
+    (site_folder / 'assets' / 'img').mkdir(parents=True)
+    (site_folder / 'assets' / 'img' / 'logo.png').write_bytes(b'logo')
+    (site_folder / 'assets' / 'old.css').write_text('stale')
+
+    build_sites(config_files, site_folder, keep={'assets/img/logo.png'})
+
+    assert (site_folder / 'assets' / 'img' / 'logo.png').exists()
+    assert not (site_folder / 'assets' / 'old.css').exists()
+    assert (site_folder / 'index.html').exists()
+
+
+@patch('builder.build_pdf')
+def test_build_sites_deferred_pdf(build_pdf, tmp_path):
+    config_files, site_folder = create_project(tmp_path, ['en', 'esp'])
+
+    def check_html(config_file, pdf_cache_folder, profiler):
+        # HTML for all languages is ready before the first PDF
+        assert (site_folder / 'index.html').exists()
+        assert (site_folder / 'esp' / 'index.html').exists()
+    build_pdf.side_effect = check_html
+
+    build_sites(config_files, site_folder, deferred_pdf=True, pdf_cache_folder='cache')
+
+    assert build_pdf.call_args_list == [
+        call(config_files['esp'], profiler=ANY, pdf_cache_folder='cache'),
+        call(config_files['en'], profiler=ANY, pdf_cache_folder='cache'),
+    ]
+
+
+@patch('builder.build_pdf')
+def test_build_sites_no_pdf(build_pdf, tmp_path):
+    config_files, site_folder = create_project(tmp_path, ['en'])
+    build_sites(config_files, site_folder, pdf=False, deferred_pdf=True)
+    build_pdf.assert_not_called()
+
+    # The PDF files from previous builds are kept (the nav links to them)
+    (site_folder / 'pdf').mkdir()
+    (site_folder / 'pdf' / 'doc-en.pdf').write_bytes(b'pdf')
+    (site_folder / 'old-file.html').write_text('stale')
+    build_sites(config_files, site_folder, pdf=False)
+    assert (site_folder / 'pdf' / 'doc-en.pdf').read_bytes() == b'pdf'
+    assert not (site_folder / 'old-file.html').exists()
+    build_sites(config_files, site_folder, pdf=False, languages=['en'])
+    assert (site_folder / 'pdf' / 'doc-en.pdf').read_bytes() == b'pdf'
+
+
+def test_build_sites_languages(tmp_path):
+    config_files, site_folder = create_project(tmp_path, ['en', 'es', 'pt'])
+    build_sites(config_files, site_folder)
+    (site_folder / 'old-en.html').write_text('stale')
+    (site_folder / 'es' / 'old-es.html').write_text('stale')
+    (site_folder / 'assets').mkdir()
+    (site_folder / 'assets' / 'logo.png').write_bytes(b'logo')
+    (tmp_path / 'page' / 'fixed-docs-en' / 'index.md').write_text('# New home en')
+
+    build_sites(config_files, site_folder, keep={'assets/logo.png'}, languages=['en'])
+
+    assert 'New home en' in (site_folder / 'index.html').read_text()
+    assert not (site_folder / 'old-en.html').exists()
+    # Other languages are not cleaned or built again
+    assert (site_folder / 'es' / 'old-es.html').exists()
+    assert (site_folder / 'pt' / 'index.html').exists()
+    assert (site_folder / 'assets' / 'logo.png').exists()
+
+
+def test_build_sites_in_memory(tmp_path):
+    config_files, site_folder = create_project(tmp_path, ['en', 'es'])
+    configs = {}
+    for language, config_file in config_files.items():
+        config = yaml.safe_load(config_file.read_text())
+        config['site_name'] = f'Memory {language}'
+        # Only the folder of the config file is used
+        config_file.unlink()
+        configs[language] = in_memory_config(config_file, config)
+    orig_configs = copy.deepcopy(configs)
+
+    build_sites(configs, site_folder, jobs=2)
+
+    assert configs == orig_configs
+    assert not (tmp_path / 'conf' / 'mkdocs-en.yml').exists()
+    assert 'Memory en' in (site_folder / 'index.html').read_text()
+    assert 'Memory es' in (site_folder / 'es' / 'index.html').read_text()
+
+
+def test_load_language_config_in_memory(tmp_path):
+    config_files, site_folder = create_project(tmp_path, ['en'])
+    from_file = load_language_config(config_files['en'])
+    config = yaml.safe_load(config_files['en'].read_text())
+    from_memory = load_language_config(in_memory_config(config_files['en'], config))
+
+    for key in ('site_name', 'docs_dir', 'site_dir', 'config_file_path'):
+        assert from_memory[key] == from_file[key]
+    assert config['theme'] == {'name': 'mkdocs'}
+
+
+def test_resolve_cover_logo(tmp_path):
+    (tmp_path / 'conf').mkdir()
+    (tmp_path / 'logo.png').write_bytes(b'logo')
+    plugins = ['search', {'with-pdf': {'cover_logo': '../logo.png', 'cover': True}}]
+    assert resolve_cover_logo(plugins, tmp_path / 'conf') == [
+        'search', {'with-pdf': {'cover_logo': str(tmp_path / 'logo.png'), 'cover': True}},
+    ]
+    # Not a file relative to the config folder: the plugin looks for it
+    assert resolve_cover_logo([{'with-pdf': {'cover_logo': 'logo.png'}}], tmp_path / 'conf') is None
+    assert resolve_cover_logo([{'with-pdf': {'cover_logo': 'https://example.com/logo.png'}}], tmp_path) is None
+    assert resolve_cover_logo(['search'], tmp_path) is None
@@ -0,0 +1,89 @@
+import gzip
+import os
+import pytest
+import compress
+from compress import precompress_site
+
+
+@pytest.fixture
+def site(tmp_path):
+    (tmp_path / 'index.html').write_text('<p>Home</p>' * 100)
+    (tmp_path / 'assets').mkdir()
+    (tmp_path / 'assets' / 'app.js').write_text('var a = 1;' * 100)
+    (tmp_path / 'assets' / 'small.css').write_text('p {}')
+    (tmp_path / 'assets' / 'logo.png').write_bytes(os.urandom(1000))
+    return tmp_path
+
+
+@pytest.mark.parametrize("brotli", [None, compress.brotli])
+def test_precompress_site(site, monkeypatch, brotli):
+    if brotli is None:
+        monkeypatch.setattr(compress, 'brotli', None)
+    extensions = [extension for _, extension in compress.available_encodings()]
+
+    stats = precompress_site(site)
+    assert stats['files_compressed'] == 2
+    for extension in extensions:
+        assert os.path.exists(site / f'index.html{extension}')
+        assert os.path.exists(site / 'assets' / f'app.js{extension}')
+        assert not os.path.exists(site / 'assets' / f'small.css{extension}')
+        assert not os.path.exists(site / 'assets' / f'logo.png{extension}')
+    assert gzip.decompress((site / 'index.html.gz').read_bytes()) == (site / 'index.html').read_bytes()
+    assert (extensions == ['.gz']) == (brotli is None)
+
+    stats = precompress_site(site)
+    assert stats['files_compressed'] == 0
+    assert stats['files_skipped'] == 2
+    assert stats['bytes_written'] == 0
+
+
+def test_precompress_changed_and_removed_files(site, tmp_path):
+    manifest_path = tmp_path / 'cache' / 'manifest-compress.json'
+    precompress_site(site, manifest_path=manifest_path)
+    (site / 'index.html').write_text('<p>New home</p>' * 100)
+    os.utime(site / 'index.html', ns=(0, 10 ** 18))
+    os.remove(site / 'assets' / 'app.js')
+
+    stats = precompress_site(site, manifest_path=manifest_path)
+    assert stats['files_compressed'] == 1
+    assert stats['files_removed'] == len(compress.available_encodings())
+    assert gzip.decompress((site / 'index.html.gz').read_bytes()) == (site / 'index.html').read_bytes()
+    assert not os.path.exists(site / 'assets' / 'app.js.gz')
+
+
+def test_precompress_keeps_other_compressed_files(site, tmp_path):
+    manifest_path = tmp_path / 'cache' / 'manifest-compress.json'
+    # Compressed files shipped with the site (no source file)
+    (site / 'downloads').mkdir()
+    (site / 'downloads' / 'docs.tar.gz').write_bytes(b'archive')
+    (site / 'assets' / 'lib.js.gz').write_bytes(gzip.compress(b'lib'))
+
+    precompress_site(site, manifest_path=manifest_path)
+    stats = precompress_site(site, manifest_path=manifest_path)
+    assert stats['files_removed'] == 0
+    assert (site / 'downloads' / 'docs.tar.gz').exists()
+    assert (site / 'assets' / 'lib.js.gz').exists()
+    # Without a manifest nothing is removed
+    os.remove(site / 'assets' / 'app.js')
+    assert precompress_site(site)['files_removed'] == 0
+    assert (site / 'assets' / 'app.js.gz').exists()
+
+
+def test_precompress_cache(site, tmp_path):
+    cache_folder = tmp_path / 'compress-cache'
+    stats = precompress_site(site, cache_folder=cache_folder)
+    assert stats['copies_from_cache'] == 0
+
+    # Site built again, same content
+    content = (site / 'index.html').read_text()
+    (site / 'index.html').unlink()
+    (site / 'index.html.gz').unlink()
+    (site / 'index.html').write_text(content)
+    (site / 'assets' / 'app.js').write_text('var b = 2;' * 100)
+
+    stats = precompress_site(site, cache_folder=cache_folder)
+    encodings = len(compress.available_encodings())
+    assert stats['files_compressed'] == 2
+    assert stats['copies_from_cache'] == encodings
+    assert gzip.decompress((site / 'index.html.gz').read_bytes()).decode() == content
+    assert gzip.decompress((site / 'assets' / 'app.js.gz').read_bytes()) == b'var b = 2;' * 100
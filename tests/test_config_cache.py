@@ -0,0 +1,75 @@
+import os
+from unittest.mock import patch
+from config_cache import (
+    config_cache_key,
+    load_cached_configs,
+    save_cached_configs,
+    write_if_changed,
+)
+from run import (
+    BASE_FOLDER,
+    get_paths,
+    load_configs,
+)
+from helpers_test import build_overrided
+
+
+PATHS = get_paths(BASE_FOLDER)
+
+
+def test_config_cache_key():
+    base = 'site_dir: ../site\n'
+    custom = 'site_name:\n  en: Site\n'
+    key = config_cache_key(base, custom, 'local')
+    assert key == config_cache_key(base, custom, 'local')
+    assert key != config_cache_key(base, custom, 'prod')
+    assert key != config_cache_key(base, custom.replace('Site', 'Other'), 'local')
+    # Raw content, not the parsed values
+    assert key != config_cache_key(base, custom + '# comment\n', 'local')
+
+
+def test_cached_configs(tmp_path):
+    cache_file = tmp_path / 'cache' / 'configs-local.pickle'
+    assert load_cached_configs(cache_file, 'key') is None
+
+    configs = {'en': {'site_name': 'Site', 'nav': [{'Home': 'index.md'}]}}
+    save_cached_configs(cache_file, 'key', configs)
+    assert load_cached_configs(cache_file, 'key') == configs
+    assert load_cached_configs(cache_file, 'other-key') is None
+
+    cache_file.write_bytes(b'broken')
+    assert load_cached_configs(cache_file, 'key') is None
+
+
+def test_write_if_changed(tmp_path):
+    path = tmp_path / 'mkdocs-en.yml'
+    assert write_if_changed(path, 'site_name: Site\n')
+    os.utime(path, ns=(1000, 1000))
+    assert not write_if_changed(path, 'site_name: Site\n')
+    assert os.stat(path).st_mtime_ns == 1000
+    assert write_if_changed(path, 'site_name: Other\n')
+    assert path.read_text() == 'site_name: Other\n'
+
+
+def test_build_config_unchanged():
+    """ A second build with the same inputs reuses the configs and doesn't touch the config files """
+    overrides = {'site_name': {'en': 'Cached site', 'es': 'Sitio en cache'}}
+    result = build_overrided(PATHS, override_custom=overrides)
+    assert result.exit_code == 0
+    config_file = PATHS['base_config_folder'] / 'mkdocs-en.yml'
+    os.utime(config_file, ns=(1000, 1000))
+
+    result = build_overrided(PATHS, override_custom=overrides)
+    assert result.exit_code == 0
+    assert 'using the resolved configs from the cache' in result.output
+    assert f'Config file unchanged {config_file}' in result.output
+    assert os.stat(config_file).st_mtime_ns == 1000
+    assert 'site_name: Cached site' in config_file.read_text()
+
+
+def test_load_configs_cache_hit(tmp_path):
+    """ A cache hit doesn't parse the config files """
+    cache_file = tmp_path / 'configs-local.pickle'
+    configs = load_configs(PATHS, cache_file=cache_file)
+    with patch('run.get_yaml', side_effect=Exception('Parsed')):
+        assert load_configs(PATHS, cache_file=cache_file) == configs
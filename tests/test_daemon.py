@@ -0,0 +1,173 @@
+import logging
+import os
+import shutil
+import threading
+import pytest
+import run
+from helpers import get_paths
+from daemon import new_daemon_server, send_request, serve_daemon
+
+
+def fake_build(request):
+    print('Building', ', '.join(request['languages']))
+    if 'fail' in request['languages']:
+        raise Exception('Build failed')
+    print('partial line', end='')
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """ Run the daemon with a fake build in a thread. Yield the socket path """
+    socket_path = tmp_path / 'daemon.sock'
+    started = threading.Event()
+    thread = threading.Thread(
+        target=serve_daemon, args=(socket_path, fake_build), kwargs={'warm_up': started.set}, daemon=True
+    )
+    thread.start()
+    started.wait(5)
+    yield socket_path
+    if thread.is_alive():
+        send_request(socket_path, {'command': 'stop'})
+        thread.join(5)
+
+
+def test_daemon_build(daemon):
+    output = []
+    response = send_request(daemon, {'command': 'build', 'languages': ['es']}, echo=output.append)
+    assert response == {'status': 'ok'}
+    assert output == ['Building es', 'partial line']
+
+    # The daemon keeps running after a failed build
+    output = []
+    response = send_request(daemon, {'command': 'build', 'languages': ['fail']}, echo=output.append)
+    assert response == {'status': 'error', 'error': 'Exception: Build failed'}
+    assert output == ['Building fail']
+    assert send_request(daemon, {'command': 'ping'}) == {'status': 'ok'}
+    assert send_request(daemon, {'command': 'other'})['status'] == 'error'
+
+
+def test_daemon_stop(daemon):
+    assert os.path.exists(daemon)
+    assert send_request(daemon, {'command': 'stop'}, echo=lambda line: None) == {'status': 'ok'}
+    for _ in range(50):
+        if not os.path.exists(daemon):
+            break
+        threading.Event().wait(0.1)
+    assert not os.path.exists(daemon)
+    with pytest.raises(Exception, match='No build daemon running'):
+        send_request(daemon, {'command': 'ping'})
+
+
+def test_daemon_socket_in_use(daemon, tmp_path):
+    with pytest.raises(Exception, match='already running'):
+        new_daemon_server(daemon, fake_build)
+    # A socket file left by a daemon that didn't stop cleanly is replaced
+    stale_path = tmp_path / 'stale.sock'
+    new_daemon_server(stale_path, fake_build).server_close()
+    assert os.path.exists(stale_path)
+    server = new_daemon_server(stale_path, fake_build)
+    server.server_close()
+
+
+@pytest.fixture
+def build_calls(monkeypatch, tmp_path):
+    """ Record the build steps run by daemon_build """
+    calls = []
+    config_files = {'en': 'conf/mkdocs-en.yml', 'es': 'conf/mkdocs-es.yml'}
+
+    def get_language_config_files(paths, languages=None):
+        return {language: path for language, path in config_files.items() if not languages or language in languages}
+
+    def prepare_configs(paths, languages=None, **kwargs):
+        calls.append(('config', languages, kwargs['assets']))
+        return {language: {'config_file': path} for language, path in get_language_config_files(paths, languages).items()}
+
+    monkeypatch.setattr(run, 'get_language_config_files', get_language_config_files)
+    monkeypatch.setattr(run, 'prepare_configs', prepare_configs)
+    monkeypatch.setattr(run, 'build_site_folder', lambda paths, config_files, **kwargs: calls.append(
+        ('site', config_files, kwargs['languages'], kwargs['pdf'])
+    ))
+    monkeypatch.setattr(run, 'build_pdfs', lambda config_files, **kwargs: calls.append(('pdf', config_files)))
+    return calls
+
+
+def test_daemon_build_phases(build_calls, tmp_path):
+    paths = {'cache_folder': tmp_path}
+    run.daemon_build(paths, {'languages': ['es'], 'phases': ['config', 'site']})
+    assert build_calls == [
+        ('config', ['es'], False),
+        # In-memory config for the built language, config files for the others
+        ('site', {'en': 'conf/mkdocs-en.yml', 'es': {'config_file': 'conf/mkdocs-es.yml'}}, ['es'], False),
+    ]
+
+    build_calls.clear()
+    run.daemon_build(paths, {'phases': ['pdf']})
+    assert build_calls == [('pdf', {'en': 'conf/mkdocs-en.yml', 'es': 'conf/mkdocs-es.yml'})]
+
+    build_calls.clear()
+    run.daemon_build(paths, {})
+    assert [call[0] for call in build_calls] == ['config', 'site']
+    assert build_calls[1][3] is True
+
+    with pytest.raises(Exception, match='Unknown build phases: html'):
+        run.daemon_build(paths, {'phases': ['html']})
+
+
+@pytest.fixture
+def project(tmp_path):
+    """ Copy of this project (config and docs) in a temp folder. Return its paths """
+    for folder in ['conf', 'page']:
+        shutil.copytree(
+            os.path.join(run.BASE_FOLDER, folder), tmp_path / folder,
+            ignore=shutil.ignore_patterns('mkdocs-*.yml', 'fixed-docs-*'),
+        )
+    return get_paths(tmp_path)
+
+
+def test_daemon_failed_build(project, tmp_path):
+    socket_path = tmp_path / 'daemon.sock'
+    started = threading.Event()
+
+    def build(request):
+        logging.getLogger('mkdocs').warning('A warning from mkdocs')
+        run.daemon_build(project, request)
+
+    thread = threading.Thread(
+        target=serve_daemon, args=(socket_path, build), kwargs={'warm_up': started.set}, daemon=True
+    )
+    thread.start()
+    started.wait(5)
+    cwd = os.getcwd()
+    index_file = project['base_page_folder'] / 'docs' / 'docs-es' / 'index.md'
+    source = index_file.read_text()
+    try:
+        index_file.write_text('Broken {{ x }')
+        output = []
+        response = send_request(socket_path, {'phases': ['config'], 'languages': ['es']}, echo=output.append)
+        assert response['status'] == 'error'
+        assert 'Error rendering MD file' in response['error']
+        # Log records are sent to the client
+        assert 'WARNING -  A warning from mkdocs' in output
+        assert os.getcwd() == cwd
+
+        index_file.write_text(source)
+        response = send_request(socket_path, {'phases': ['config'], 'languages': ['es']}, echo=output.append)
+        assert response == {'status': 'ok'}
+        assert os.getcwd() == cwd
+        assert (project['base_config_folder'] / 'mkdocs-es.yml').exists()
+    finally:
+        send_request(socket_path, {'command': 'stop'})
+        thread.join(5)
+
+
+def test_daemon_build_missing_config_files(project):
+    # Fresh checkout: no conf/mkdocs-LANG.yml files
+    with pytest.raises(Exception, match='Config files not found for es. Build them first with the config phase'):
+        run.daemon_build(project, {'languages': ['es'], 'phases': ['site']})
+    with pytest.raises(Exception, match='Config files not found for es'):
+        run.daemon_build(project, {'languages': ['es'], 'phases': ['pdf']})
+
+    # The other languages (without config files) only need their site folder
+    run.daemon_build(project, {'languages': ['es'], 'phases': ['config', 'site']})
+    assert (project['site_folder'] / 'es' / 'index.html').exists()
+    assert not (project['base_config_folder'] / 'mkdocs-en.yml').exists()
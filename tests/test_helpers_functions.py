@@ -3,6 +3,8 @@ from unittest.mock import mock_open, patch
 from helpers import (
     get_lang_setting,
     get_list_setting,
+    overlay,
+    overlay_list_setting,
     update_gh_action_language_files,
     update_language_paths,
 )
@@ -34,6 +36,25 @@ def test_get_list_setting():
     assert get_list_setting(cfg_list, key) == {'k20': 'v20', 'k21': 'v21'}
 
 
+def test_overlay():
+    base = {'theme': {'name': 'material'}, 'extra': {'big': list(range(100))}}
+    new = overlay(base, theme=overlay(base['theme'], language='es'))
+
+    assert new == {'theme': {'name': 'material', 'language': 'es'}, 'extra': base['extra']}
+    assert base['theme'] == {'name': 'material'}
+    # unchanged values are shared, not copied
+    assert new['extra'] is base['extra']
+
+
+def test_overlay_list_setting():
+    cfg_list = [{'set1': {'k10': 'v10'}}, {'set2': {'k20': 'v20'}}]
+    new = overlay_list_setting(cfg_list, 'set2', k20='new', k21='v21')
+
+    assert new == [{'set1': {'k10': 'v10'}}, {'set2': {'k20': 'new', 'k21': 'v21'}}]
+    assert cfg_list[1] == {'set2': {'k20': 'v20'}}
+    assert new[0] is cfg_list[0]
+
+
 def test_update_language_paths_local():
     config = {
         'public_url_base_path': '/some-path',
@@ -0,0 +1,115 @@
+import json
+import os
+import yaml
+from builder import build_language
+from incremental import snippet_references
+
+
+def create_site(base_folder, nav=None):
+    """ Minimal mkdocs project with 3 pages and a snippet. Return the config file """
+    docs_folder = base_folder / 'docs'
+    docs_folder.mkdir(parents=True, exist_ok=True)
+    (base_folder / 'snippets').mkdir(exist_ok=True)
+    (base_folder / 'snippets' / 'note.md').write_text('Snippet text')
+    (docs_folder / 'index.md').write_text('# Home\n\nWelcome')
+    (docs_folder / 'one.md').write_text('# One\n\nFirst page')
+    (docs_folder / 'two.md').write_text('# Two\n\n--8<-- "note.md"\n')
+    config = {
+        'site_name': 'Incremental',
+        'docs_dir': 'docs',
+        'site_dir': 'site',
+        'theme': {'name': 'mkdocs'},
+        'plugins': ['search'],
+        'markdown_extensions': [{'pymdownx.snippets': {'base_path': [str(base_folder / 'snippets')]}}],
+        'nav': nav or [{'Home': 'index.md'}, 'one.md', 'two.md'],
+    }
+    config_file = base_folder / 'mkdocs.yml'
+    config_file.write_text(yaml.dump(config))
+    return config_file
+
+
+def build(config_file, capsys):
+    build_language(config_file, dirty=True, pages_cache_folder=config_file.parent / 'cache')
+    return capsys.readouterr().out
+
+
+def page_mtimes(site_folder):
+    return {name: os.stat(site_folder / name / 'index.html').st_mtime_ns for name in ('one', 'two')}
+
+
+def search_docs(site_folder):
+    with open(site_folder / 'search' / 'search_index.json') as f:
+        return sorted(json.load(f)['docs'], key=lambda doc: doc['location'])
+
+
+def test_snippet_references():
+    markdown = '\n'.join([
+        '--8<-- "a.md"',
+        '--8<-- \'b.md:1:3\'',
+        ';--8<-- "escaped.md"',
+        '--8<-- "https://example.com/remote.md"',
+        '--8<--',
+        'c.md',
+        '',
+        '--8<--',
+        'text with --8<-- "inline.md"',
+    ])
+    assert snippet_references(markdown) == ['a.md', 'b.md', 'c.md']
+
+
+def test_incremental_build(tmp_path, capsys):
+    config_file = create_site(tmp_path)
+    site_folder = tmp_path / 'site'
+    assert 'Pages: 3 built, 0 unchanged' in build(config_file, capsys)
+    full_search = search_docs(site_folder)
+    mtimes = page_mtimes(site_folder)
+
+    assert 'Pages: 0 built, 3 unchanged' in build(config_file, capsys)
+    assert page_mtimes(site_folder) == mtimes
+    assert search_docs(site_folder) == full_search
+
+    (tmp_path / 'docs' / 'one.md').write_text('# One\n\nChanged page')
+    assert 'Pages: 1 built, 2 unchanged' in build(config_file, capsys)
+    new_mtimes = page_mtimes(site_folder)
+    assert new_mtimes['two'] == mtimes['two']
+    assert new_mtimes['one'] != mtimes['one']
+    assert 'Changed page' in (site_folder / 'one' / 'index.html').read_text()
+    # The search index has the unchanged pages too
+    assert {doc['location'] for doc in search_docs(site_folder)} == {doc['location'] for doc in full_search}
+    assert 'Changed page' in json.dumps(search_docs(site_folder))
+
+
+def test_incremental_snippet_changed(tmp_path, capsys):
+    config_file = create_site(tmp_path)
+    build(config_file, capsys)
+    (tmp_path / 'snippets' / 'note.md').write_text('New snippet text')
+    assert 'Pages: 1 built, 2 unchanged' in build(config_file, capsys)
+    assert 'New snippet text' in (tmp_path / 'site' / 'two' / 'index.html').read_text()
+
+
+def test_incremental_nav_changed(tmp_path, capsys):
+    config_file = create_site(tmp_path)
+    build(config_file, capsys)
+    create_site(tmp_path, nav=[{'Home': 'index.md'}, {'Page two': 'two.md'}, 'one.md'])
+    assert 'Pages: 3 built, 0 unchanged' in build(config_file, capsys)
+
+
+def test_incremental_title_changed(tmp_path, capsys):
+    config_file = create_site(tmp_path)
+    build(config_file, capsys)
+    # The title is in the nav of all the pages
+    (tmp_path / 'docs' / 'one.md').write_text('# New title\n\nFirst page')
+    out = build(config_file, capsys)
+    assert 'Page titles changed, building all the pages' in out
+    assert 'Pages: 3 built, 0 unchanged' in out
+    assert 'New title' in (tmp_path / 'site' / 'two' / 'index.html').read_text()
+
+
+def test_incremental_removed_page(tmp_path, capsys):
+    config_file = create_site(tmp_path)
+    build(config_file, capsys)
+    create_site(tmp_path, nav=[{'Home': 'index.md'}, 'two.md'])
+    (tmp_path / 'docs' / 'one.md').unlink()
+    build(config_file, capsys)
+    assert not (tmp_path / 'site' / 'one' / 'index.html').exists()
+    assert (tmp_path / 'site' / 'two' / 'index.html').exists()
@@ -0,0 +1,43 @@
+import errno
+import os
+import pytest
+import materialize as materialize_module
+from materialize import STRATEGIES, materialize
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_materialize(tmp_path, strategy):
+    orig = tmp_path / 'image.png'
+    orig.write_bytes(os.urandom(1000))
+    dest = tmp_path / 'fixed' / 'image.png'
+    dest.parent.mkdir()
+    # Existing files (maybe hardlinks from a previous build) are replaced, never written
+    linked = tmp_path / 'linked.png'
+    linked.write_bytes(b'old')
+    os.link(linked, dest)
+
+    used = materialize(orig, dest, strategy)
+
+    assert used in STRATEGIES
+    assert dest.read_bytes() == orig.read_bytes()
+    assert linked.read_bytes() == b'old'
+    if used == 'hardlink':
+        assert os.path.samefile(orig, dest)
+    else:
+        assert not os.path.samefile(orig, dest)
+
+
+def test_materialize_fallback(tmp_path, monkeypatch):
+    def cross_device_link(src, dst):
+        raise OSError(errno.EXDEV, 'Invalid cross-device link')
+    monkeypatch.setattr(materialize_module.os, 'link', cross_device_link)
+    orig = tmp_path / 'doc.pdf'
+    orig.write_bytes(b'pdf')
+
+    assert materialize(orig, tmp_path / 'copy.pdf', 'hardlink') == 'copy'
+    assert (tmp_path / 'copy.pdf').read_bytes() == b'pdf'
+
+
+def test_materialize_unknown_strategy(tmp_path):
+    with pytest.raises(Exception, match='Unknown materialization strategy'):
+        materialize(tmp_path / 'a', tmp_path / 'b', 'symlink')
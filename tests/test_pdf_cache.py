@@ -0,0 +1,156 @@
+import os
+from unittest.mock import patch
+import yaml
+from builder import PDF_PLUGIN, build_pdf, build_with_pdf_cache
+from pdf_cache import cached_pdf_path, pdf_cache_key, store_pdf
+
+
+class FakePdfPlugin:
+    """ Write a PDF on post_build, counting the renders """
+    def __init__(self):
+        self.config = {'output_path': 'pdf/doc-en.pdf'}
+        self.renders = 0
+
+    def on_post_build(self, config):
+        self.renders += 1
+        pdf_file = os.path.join(config['site_dir'], self.config['output_path'])
+        os.makedirs(os.path.dirname(pdf_file), exist_ok=True)
+        with open(pdf_file, 'w') as f:
+            f.write(f'PDF render {self.renders}')
+
+
+class FakePlugins(dict):
+    def __init__(self, plugin):
+        super().__init__({PDF_PLUGIN: plugin})
+        self.events = {'post_build': [plugin.on_post_build]}
+
+
+def fake_build(config, dirty=False):
+    for event in config.plugins.events['post_build']:
+        event(config=config)
+
+
+def create_project(base_folder):
+    conf_folder = base_folder / 'conf'
+    conf_folder.mkdir()
+    docs_folder = base_folder / 'page' / 'fixed-docs-en'
+    docs_folder.mkdir(parents=True)
+    (docs_folder / 'index.md').write_text('# Home')
+    template_folder = base_folder / 'pdf-template-en'
+    template_folder.mkdir()
+    (template_folder / 'cover.html').write_text('<h1>Cover</h1>')
+    config = {
+        'docs_dir': '../page/fixed-docs-en',
+        'nav': [{'Home': 'index.md'}],
+        'plugins': ['search', {PDF_PLUGIN: {
+            'custom_template_path': str(template_folder), 'cover': True, 'output_path': 'pdf/doc-en.pdf',
+        }}],
+    }
+    config_file = conf_folder / 'mkdocs-en.yml'
+    config_file.write_text(yaml.dump(config))
+    return config_file, config
+
+
+def get_key(config_file):
+    config = yaml.safe_load(config_file.read_text())
+    return pdf_cache_key(config, config_file.parent, config['plugins'][1][PDF_PLUGIN])
+
+
+def test_pdf_cache_key(tmp_path, monkeypatch):
+    # The event hook is loaded from the working directory
+    monkeypatch.chdir(tmp_path)
+    config_file, config = create_project(tmp_path)
+    snippets_folder = tmp_path / 'snippets'
+    snippets_folder.mkdir()
+    (snippets_folder / 'note.md').write_text('Note')
+    (tmp_path / 'page' / 'fixed-docs-en' / 'index.md').write_text('# Home\n--8<-- "note.md"\n')
+    config['markdown_extensions'] = [{'pymdownx.snippets': {'base_path': str(snippets_folder)}}]
+    config_file.write_text(yaml.dump(config))
+    keys = {get_key(config_file)}
+    assert get_key(config_file) in keys
+
+    (tmp_path / 'page' / 'fixed-docs-en' / 'index.md').write_text('# New home\n--8<-- "note.md"\n')
+    keys.add(get_key(config_file))
+    (tmp_path / 'pdf-template-en' / 'cover.html').write_text('<h1>New cover</h1>')
+    keys.add(get_key(config_file))
+    config['nav'].append({'About': 'about.md'})
+    config_file.write_text(yaml.dump(config))
+    keys.add(get_key(config_file))
+    config['plugins'][1][PDF_PLUGIN]['cover'] = False
+    config_file.write_text(yaml.dump(config))
+    keys.add(get_key(config_file))
+    # Snippets included by the docs
+    (snippets_folder / 'note.md').write_text('New note')
+    keys.add(get_key(config_file))
+    # PDF event hook
+    (tmp_path / 'pdf_event_hook.py').write_text('# hook')
+    keys.add(get_key(config_file))
+    (tmp_path / 'pdf_event_hook.py').write_text('# new hook')
+    keys.add(get_key(config_file))
+
+    assert len(keys) == 8
+
+
+def test_store_pdf_removes_old_versions(tmp_path):
+    pdf_file = tmp_path / 'doc-en.pdf'
+    pdf_file.write_text('PDF')
+    cache_folder = tmp_path / 'cache'
+    other_language = cached_pdf_path(cache_folder, 'pdf/doc-en-gb.pdf', 'abc')
+    store_pdf(pdf_file, other_language)
+    store_pdf(pdf_file, cached_pdf_path(cache_folder, 'pdf/doc-en.pdf', 'old'))
+    store_pdf(pdf_file, cached_pdf_path(cache_folder, 'pdf/doc-en.pdf', 'new'))
+
+    assert sorted(os.listdir(cache_folder)) == ['doc-en-gb-abc.pdf', 'doc-en-new.pdf']
+
+
+@patch('builder.build.build', side_effect=fake_build)
+def test_build_with_pdf_cache(build, tmp_path, capsys):
+    config_file, _ = create_project(tmp_path)
+    site_folder = tmp_path / 'site'
+    pdf_file = site_folder / 'pdf' / 'doc-en.pdf'
+    cache_folder = tmp_path / '.cache' / 'pdf'
+
+    def build_language():
+        plugin = FakePdfPlugin()
+        config = {'site_dir': str(site_folder)}
+        config = type('Config', (dict, ), {'plugins': FakePlugins(plugin)})(config)
+        build_with_pdf_cache(config, config_file, True, cache_folder)
+        return plugin
+
+    assert build_language().renders == 1
+    assert 'PDF cache miss' in capsys.readouterr().out
+
+    # Cache hit: the PDF is restored without rendering it
+    pdf_file.unlink()
+    assert build_language().renders == 0
+    assert 'PDF cache hit' in capsys.readouterr().out
+    assert pdf_file.read_text() == 'PDF render 1'
+
+    # Docs changed
+    (tmp_path / 'page' / 'fixed-docs-en' / 'index.md').write_text('# New home')
+    assert build_language().renders == 1
+    assert len(os.listdir(cache_folder)) == 1
+
+
+@patch('builder.build.build', side_effect=fake_build)
+def test_build_pdf(build, tmp_path):
+    config_file, config = create_project(tmp_path)
+    config['site_dir'] = '../site'
+    config_file.write_text(yaml.dump(config))
+    pdf_file = tmp_path / 'site' / 'pdf' / 'doc-en.pdf'
+    cache_folder = tmp_path / '.cache' / 'pdf'
+    plugin = FakePdfPlugin()
+
+    def load_language_config(config_file, site_dir):
+        return type('Config', (dict, ), {'plugins': FakePlugins(plugin)})({'site_dir': site_dir})
+
+    with patch('builder.load_language_config', side_effect=load_language_config):
+        build_pdf(config_file, cache_folder)
+        assert pdf_file.read_text() == 'PDF render 1'
+        # Only the PDF is copied to the site
+        assert os.listdir(tmp_path / 'site') == ['pdf']
+
+        pdf_file.unlink()
+        build_pdf(config_file, cache_folder)
+        assert plugin.renders == 1
+        assert pdf_file.read_text() == 'PDF render 1'
@@ -0,0 +1,57 @@
+import json
+from profiling import Profiler, run_profiled
+
+
+def allocate(size, profiler):
+    with profiler.phase('allocate'):
+        data = bytearray(size)
+        data[-1] = 1
+
+
+def test_profiler_phases():
+    profiler = Profiler()
+    with profiler.phase('build', 'en'):
+        allocate(50 * 1024 * 1024, profiler)
+    with profiler.phase('small'):
+        pass
+
+    build, inner, small = profiler.records
+    assert (build['name'], build['language'], build['depth']) == ('build', 'en', 0)
+    assert (inner['name'], inner['depth']) == ('allocate', 1)
+    assert build['wall'] >= inner['wall'] >= 0
+    assert build['cpu'] >= 0
+    # The outer phase includes the peak of the inner one
+    assert build['peak_rss'] >= inner['peak_rss'] >= 50 * 1024 * 1024
+    assert small['peak_rss'] < inner['peak_rss']
+
+
+def test_profiler_disabled():
+    profiler = Profiler(enabled=False)
+    with profiler.phase('build'):
+        pass
+    assert profiler.records == []
+
+
+def test_profiler_worker_records(tmp_path, capsys):
+    profiler = Profiler()
+    with profiler.phase('pool'):
+        records = run_profiled(allocate, 'build', 'es', 1024)
+        profiler.add_records(records, 'es')
+    assert [(r['name'], r['language'], r['depth']) for r in profiler.records] == [
+        ('pool', None, 0), ('build', 'es', 1), ('allocate', 'es', 2),
+    ]
+
+    report_file = tmp_path / 'profile.json'
+    profiler.finish('build-local-site', report_file)
+    report = json.loads(report_file.read_text())
+    assert report['command'] == 'build-local-site'
+    assert len(report['phases']) == 3
+    assert 'allocate' in capsys.readouterr().out
+
+
+def test_profiler_nested_language():
+    profiler = Profiler()
+    with profiler.phase('build', 'es'):
+        with profiler.phase('search index'):
+            pass
+    assert [record['language'] for record in profiler.records] == ['es', 'es']
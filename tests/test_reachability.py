@@ -0,0 +1,86 @@
+from reachability import include_targets, link_targets, nav_files, reachable_files, resolve_link
+
+
+def test_nav_files():
+    nav = [
+        {'Home': 'index.md'},
+        {'Guide': [{'Start': 'guide/start.md'}, 'guide/./more.md']},
+        {'External': 'https://example.com/page.md'},
+        {'Absolute': '/other/'},
+    ]
+    assert nav_files(nav) == ['index.md', 'guide/start.md', 'guide/more.md']
+
+
+def test_link_targets():
+    markdown = '\n'.join([
+        'See [the guide](guide/start.md#intro "Title") and ![logo](<img/my logo.png>).',
+        '[ref]: about.md',
+        '<img src="img/photo.jpg"> <a href=\'other.md\'>other</a>',
+    ])
+    assert sorted(link_targets(markdown)) == sorted([
+        'guide/start.md#intro', 'img/my logo.png', 'about.md', 'img/photo.jpg', 'other.md',
+    ])
+
+
+def test_include_targets(tmp_path):
+    docs_folder = tmp_path / 'docs-en'
+    (docs_folder / 'partials').mkdir(parents=True)
+    (docs_folder / 'partials/note.md').write_text('Note')
+    markdown = '\n'.join([
+        '{% include "docs-en/partials/note.md" %}',
+        "{%- include 'shared.md' %}",
+        '{% include "docs-es/partials/note.md" %}',
+        '{% include "docs-en/missing.md" %}',
+    ])
+    assert include_targets(markdown, str(docs_folder)) == ['partials/note.md']
+
+
+def test_resolve_link(tmp_path):
+    for rel_path in ['index.md', 'about.md', 'guide/index.md', 'guide/start.md', 'img/my logo.png']:
+        (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel_path).write_text('')
+    assert resolve_link('start.md#intro', 'guide/index.md', tmp_path) == ['guide/start.md']
+    assert resolve_link('../img/my%20logo.png', 'guide/start.md', tmp_path) == ['img/my logo.png']
+    # Links to the page URL
+    assert resolve_link('about/', 'index.md', tmp_path) == ['about.md']
+    assert resolve_link('guide/', 'index.md', tmp_path) == ['guide/index.md']
+    # Ignored links
+    for target in ['https://example.com', 'mailto:a@b.c', '#anchor', '/about.md', '{{ url }}', '../../out.md']:
+        assert resolve_link(target, 'guide/start.md', tmp_path) == []
+
+
+def test_reachable_files(tmp_path):
+    files = {
+        'index.md': '[Guide](guide/start.md)',
+        'guide/start.md': '![Image](../img/image.png) [Linked](linked.md) [Missing](missing.md)',
+        'guide/linked.md': '[Back](start.md) [Home](../index.md)',
+        'img/image.png': 'fake image',
+        'img/unused.png': 'fake image',
+        'draft.md': '[Guide](guide/start.md)',
+    }
+    for rel_path, content in files.items():
+        (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel_path).write_text(content)
+    assert reachable_files(str(tmp_path), [{'Home': 'index.md'}]) == {
+        'index.md', 'guide/start.md', 'guide/linked.md', 'img/image.png',
+    }
+
+
+def test_reachable_files_snippets(tmp_path):
+    docs_folder = tmp_path / 'page' / 'docs' / 'docs-en'
+    files = {
+        'index.md': '# Home\n--8<-- "snippets/note.md"\n',
+        'snippets/note.md': 'Note\n--8<--\ndocs-en/snippets/other.md\n--8<--\n',
+        'snippets/other.md': 'Other',
+        'snippets/unused.md': 'Unused',
+    }
+    for rel_path, content in files.items():
+        (docs_folder / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (docs_folder / rel_path).write_text(content)
+    nav = [{'Home': 'index.md'}]
+    assert reachable_files(str(docs_folder), nav) == {'index.md'}
+    # Base paths: the fixed docs folder (as built by mkdocs) and the docs root folder
+    snippet_paths = [str(tmp_path / 'page' / 'docs' / 'fixed-docs-en'), str(tmp_path / 'page' / 'docs')]
+    assert reachable_files(str(docs_folder), nav, snippet_paths) == {
+        'index.md', 'snippets/note.md', 'snippets/other.md',
+    }
@@ -0,0 +1,358 @@
+import json
+import os
+import pytest
+import render
+from helpers import update_md_files
+import tracemalloc
+from render import is_template_free, new_jinja_env, stream_md_file, write_md_file
+
+
+def create_docs(base_folder, files):
+    """ Create a docs folder with the given {relative path: content} files """
+    docs_folder = base_folder / 'docs' / 'docs-en'
+    for rel_path, content in files.items():
+        path = docs_folder / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return docs_folder
+
+
+def rendered_files(capsys, base_folder, docs_folder, context, cache_folder):
+    """ Run update_md_files and return the list of MD files rendered """
+    capsys.readouterr()
+    update_md_files(str(docs_folder), base_folder, context, cache_folder=cache_folder)
+    lines = capsys.readouterr().out.splitlines()
+    return sorted(
+        os.path.basename(line.split(' -> ')[0])
+        for line in lines
+        if line.startswith('Fixing ') and line.endswith('.md')
+    )
+
+
+def test_update_md_files_incremental(tmp_path, capsys):
+    docs_folder = create_docs(tmp_path, {
+        'index.md': '# {{ title }}',
+        'about/other.md': '# {{ other }}',
+        'img/image.png': 'fake image',
+    })
+    cache_folder = tmp_path / 'cache'
+    context = {'title': 'Title', 'other': 'Other'}
+
+    assert rendered_files(capsys, tmp_path, docs_folder, context, cache_folder) == ['index.md', 'other.md']
+    fixed_folder = tmp_path / 'docs' / 'fixed-docs-en'
+    assert (fixed_folder / 'index.md').read_text() == '# Title'
+    assert (fixed_folder / 'img/image.png').read_text() == 'fake image'
+
+    # Nothing changed
+    assert rendered_files(capsys, tmp_path, docs_folder, context, cache_folder) == []
+
+    # Only the file using the changed context value
+    context['other'] = 'New other'
+    assert rendered_files(capsys, tmp_path, docs_folder, context, cache_folder) == ['other.md']
+    assert (fixed_folder / 'about/other.md').read_text() == '# New other'
+
+    # Only the changed source
+    (docs_folder / 'index.md').write_text('# New {{ title }}')
+    assert rendered_files(capsys, tmp_path, docs_folder, context, cache_folder) == ['index.md']
+
+    # Removed sources are pruned from the fixed folder
+    (docs_folder / 'about/other.md').unlink()
+    assert rendered_files(capsys, tmp_path, docs_folder, context, cache_folder) == []
+    assert not (fixed_folder / 'about').exists()
+    assert (fixed_folder / 'index.md').read_text() == '# New Title'
+
+
+def test_update_md_files_no_cache(tmp_path, capsys):
+    docs_folder = create_docs(tmp_path, {'index.md': '# {{ title }}'})
+    context = {'title': 'Title'}
+
+    assert rendered_files(capsys, tmp_path, docs_folder, context, None) == ['index.md']
+    assert rendered_files(capsys, tmp_path, docs_folder, context, None) == ['index.md']
+
+
+def test_update_md_files_nested_single_pass(tmp_path, capsys):
+    """ Each file is rendered/copied only once, whatever the folder depth """
+    files = {}
+    folder = ''
+    for depth in range(6):
+        folder += f'level{depth}/'
+        files[f'{folder}page.md'] = '# {{ title }}'
+        files[f'{folder}image.png'] = 'fake image'
+    docs_folder = create_docs(tmp_path, files)
+
+    stats = {}
+    update_md_files(str(docs_folder), tmp_path, {'title': 'Title'}, stats=stats)
+    assert stats['files_rendered'] == 6
+    assert stats['files_copied'] == 6
+    assert stats['files_skipped'] == 0
+    assert stats['bytes_written'] == 6 * len('# Title') + 6 * len('fake image')
+    assert capsys.readouterr().out.count('Fixing ') == 6 + 1
+
+
+def test_update_md_files_workers(tmp_path):
+    files = {f'section{n % 3}/page{n}.md': f'# {{{{ title }}}} {n}' for n in range(20)}
+    docs_folder = create_docs(tmp_path, files)
+
+    stats = {}
+    update_md_files(str(docs_folder), tmp_path, {'title': 'Title'}, stats=stats, workers=3)
+    assert stats['files_rendered'] == 20
+    fixed_folder = tmp_path / 'docs' / 'fixed-docs-en'
+    for n in range(20):
+        assert (fixed_folder / f'section{n % 3}/page{n}.md').read_text() == f'# Title {n}'
+
+
+def test_update_md_files_workers_error(tmp_path):
+    docs_folder = create_docs(tmp_path, {
+        'a.md': '# {{ title }}',
+        'b.md': '# {% if %}',
+        'c.md': '# {{ title }',
+    })
+
+    with pytest.raises(Exception) as e:
+        update_md_files(str(docs_folder), tmp_path, {'title': 'Title'}, workers=2)
+    # Always the first failing file
+    assert 'Error rendering MD file' in str(e.value)
+    assert 'b.md (line 1): TemplateSyntaxError' in str(e.value)
+
+
+def test_update_md_files_includes(tmp_path, capsys):
+    docs_folder = create_docs(tmp_path, {
+        'index.md': "# {{ title }}\n{% include 'shared/footer.md' %}",
+        'other.md': '# Other',
+    })
+    shared_folder = tmp_path / 'docs' / 'shared'
+    shared_folder.mkdir()
+    (shared_folder / 'footer.md').write_text('Footer {{ footer }}')
+    cache_folder = tmp_path / 'cache'
+    context = {'title': 'Title', 'footer': 'text'}
+
+    # other.md has no template markup
+    assert rendered_files(capsys, tmp_path, docs_folder, context, cache_folder) == ['index.md']
+    fixed_folder = tmp_path / 'docs' / 'fixed-docs-en'
+    assert (fixed_folder / 'index.md').read_text() == '# Title\nFooter text'
+    # Compiled templates are stored for the next builds
+    assert list((cache_folder / 'jinja').iterdir())
+
+    # Context values used by included templates
+    context['footer'] = 'new text'
+    assert rendered_files(capsys, tmp_path, docs_folder, context, cache_folder) == ['index.md']
+    assert (fixed_folder / 'index.md').read_text() == '# Title\nFooter new text'
+
+    # Included templates changes
+    (shared_folder / 'footer.md').write_text('New footer')
+    assert rendered_files(capsys, tmp_path, docs_folder, context, cache_folder) == ['index.md']
+    assert (fixed_folder / 'index.md').read_text() == '# Title\nNew footer'
+
+
+def test_update_md_files_nested_includes(tmp_path, capsys):
+    docs_folder = create_docs(tmp_path, {'index.md': "# Home\n{% include 'shared/a.md' %}"})
+    shared_folder = tmp_path / 'docs' / 'shared'
+    shared_folder.mkdir()
+    (shared_folder / 'a.md').write_text("A {% include 'shared/b.md' %}")
+    (shared_folder / 'b.md').write_text('B')
+    cache_folder = tmp_path / 'cache'
+    fixed_file = tmp_path / 'docs' / 'fixed-docs-en' / 'index.md'
+
+    assert rendered_files(capsys, tmp_path, docs_folder, {}, cache_folder) == ['index.md']
+    assert fixed_file.read_text() == '# Home\nA B'
+    assert rendered_files(capsys, tmp_path, docs_folder, {}, cache_folder) == []
+    # The manifest stores all the templates used, not only the direct references
+    manifest_path, = cache_folder.glob('manifest-*.json')
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest['version'] == render.MD_MANIFEST_VERSION
+    assert sorted(manifest['files']['index.md']['deps']) == ['shared/a.md', 'shared/b.md']
+    # Manifests from older versions (direct references only) are not used
+    manifest['version'] = 2
+    manifest_path.write_text(json.dumps(manifest))
+    assert rendered_files(capsys, tmp_path, docs_folder, {}, cache_folder) == ['index.md']
+
+    # A template included by an included template
+    (shared_folder / 'b.md').write_text('New B')
+    assert rendered_files(capsys, tmp_path, docs_folder, {}, cache_folder) == ['index.md']
+    assert fixed_file.read_text() == '# Home\nA New B'
+
+    # Templates included with a variable name can't be tracked
+    (shared_folder / 'b.md').write_text("{% include name %}")
+    (shared_folder / 'c.md').write_text('C')
+    assert rendered_files(capsys, tmp_path, docs_folder, {'name': 'shared/c.md'}, cache_folder) == ['index.md']
+    assert rendered_files(capsys, tmp_path, docs_folder, {'name': 'shared/c.md'}, cache_folder) == ['index.md']
+
+
+def test_update_md_files_fast_path(tmp_path, capsys):
+    plain = '# Plain page\r\n\nNo templates { here }\n'
+    docs_folder = create_docs(tmp_path, {'plain.md': plain, 'index.md': '# {{ title }}\n'})
+    cache_folder = tmp_path / 'cache'
+
+    stats = {}
+    update_md_files(str(docs_folder), tmp_path, {'title': 'Title'}, cache_folder=cache_folder, stats=stats)
+    assert stats['files_rendered'] == 1
+    assert stats['files_fast_path'] == 1
+    assert 'MD without templates (fast path)' in capsys.readouterr().out
+    fixed_folder = tmp_path / 'docs' / 'fixed-docs-en'
+    assert (fixed_folder / 'plain.md').read_bytes() == (docs_folder / 'plain.md').read_bytes()
+    assert (fixed_folder / 'index.md').read_text() == '# Title\n'
+
+    # Template markup added to a plain file
+    (docs_folder / 'plain.md').write_text('# {{ title }} plain')
+    update_md_files(str(docs_folder), tmp_path, {'title': 'Title'}, cache_folder=cache_folder, stats=stats)
+    assert stats['files_rendered'] == 1
+    assert stats['files_fast_path'] == 0
+    assert (fixed_folder / 'plain.md').read_text() == '# Title plain'
+
+
+@pytest.mark.parametrize("content,expected", [
+    ('No templates at all { }', True),
+    ('A {{ var }}', False),
+    ('A {% if x %}{% endif %}', False),
+    ('A {# comment #}', False),
+    # Marks split between read chunks
+    ('abc{{ var }}', False),
+    ('abcd{% if x %}{% endif %}', False),
+])
+def test_is_template_free(tmp_path, monkeypatch, content, expected):
+    monkeypatch.setattr(render, 'HASH_CHUNK_SIZE', 4)
+    path = tmp_path / 'page.md'
+    path.write_text(content)
+    assert is_template_free(path) == expected
+
+
+def test_hardlink_docs_files(tmp_path):
+    docs_folder = create_docs(tmp_path, {
+        'index.md': '# {{ title }}',
+        'plain.md': '# No markup',
+        'img/image.png': 'fake image',
+    })
+
+    update_md_files(str(docs_folder), tmp_path, {'title': 'Title'}, cache_folder=tmp_path / 'cache', strategy='hardlink')
+
+    fixed_folder = tmp_path / 'docs' / 'fixed-docs-en'
+    assert os.path.samefile(docs_folder / 'img/image.png', fixed_folder / 'img/image.png')
+    # MD files are never hardlinked, they could be rendered later into the same file
+    assert not os.path.samefile(docs_folder / 'plain.md', fixed_folder / 'plain.md')
+
+    # A changed file is replaced, the original file is not modified
+    (docs_folder / 'img/image.png').unlink()
+    (docs_folder / 'img/image.png').write_text('new image')
+    update_md_files(str(docs_folder), tmp_path, {'title': 'Title'}, cache_folder=tmp_path / 'cache', strategy='hardlink')
+    assert (fixed_folder / 'img/image.png').read_text() == 'new image'
+
+
+def test_update_md_files_nav_only(tmp_path, capsys):
+    docs_folder = create_docs(tmp_path, {
+        'index.md': '# {{ title }} [About](about.md)',
+        'about.md': '![Image](img/image.png)',
+        'draft.md': '# Draft',
+        'img/image.png': 'fake image',
+        'img/old.png': 'fake image',
+    })
+    fixed_folder = tmp_path / 'docs' / 'fixed-docs-en'
+    cache_folder = tmp_path / 'cache'
+    update_md_files(str(docs_folder), tmp_path, {'title': 'Title'}, cache_folder=cache_folder)
+    assert (fixed_folder / 'draft.md').exists()
+
+    stats = render.new_walk_stats()
+    capsys.readouterr()
+    update_md_files(
+        str(docs_folder), tmp_path, {'title': 'Title'}, cache_folder=cache_folder, stats=stats,
+        nav=[{'Home': 'index.md'}],
+    )
+    assert 'Excluding draft.md (not reachable from the nav)' in capsys.readouterr().out
+    assert stats['files_excluded'] == 2
+    assert sorted(
+        str(path.relative_to(fixed_folder)) for path in fixed_folder.rglob('*') if path.is_file()
+    ) == ['about.md', 'img/image.png', 'index.md']
+    assert (fixed_folder / 'index.md').read_text() == '# Title [About](about.md)'
+
+
+STREAM_TEMPLATE = """# {{ title }}
+{% set total = 3 %}
+{% macro item(name) -%}
+  - {{ name }}
+{%- endmacro %}
+{% for i in range(total) %}
+{{ item('Item ' ~ i) }}
+{% endfor %}
+{# A multiline
+   comment #}
+{% raw %}
+{{ not rendered }}
+{% endraw %}
+Total: {{ total }}
+   {%- if title %} (stripped){% endif %}
+{% include 'shared/footer.md' %}
+Last line {{ title | upper }}
+"""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10, 40, 10000])
+def test_stream_md_file(tmp_path, chunk_size):
+    docs_folder = create_docs(tmp_path, {'big.md': STREAM_TEMPLATE})
+    (tmp_path / 'docs' / 'shared').mkdir()
+    (tmp_path / 'docs' / 'shared' / 'footer.md').write_text('Footer {{ footer }}\n')
+    env = new_jinja_env(str(tmp_path / 'docs'))
+    context = {'title': 'Title', 'footer': 'text'}
+    orig_file = str(docs_folder / 'big.md')
+
+    write_md_file(env, orig_file, str(tmp_path / 'whole.md'), context, render.hash_file(orig_file))
+    variables, references = stream_md_file(env, orig_file, str(tmp_path / 'streamed.md'), context, chunk_size)
+    assert (tmp_path / 'streamed.md').read_text() == (tmp_path / 'whole.md').read_text()
+    assert 'footer' not in variables and 'title' in variables
+    assert references == ['shared/footer.md']
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 20])
+def test_stream_md_file_trailing_whitespace_control(tmp_path, chunk_size):
+    content = (
+        'Line {{ n }} {{ x -}}\n   indented {%- if x %} X{% endif -%}  \n\n'
+        '  end {# c -#}\n  last\n\n\n  {%- if x %}!{% endif %}\n'
+    )
+    docs_folder = create_docs(tmp_path, {'big.md': content})
+    env = new_jinja_env(str(tmp_path / 'docs'))
+    context = {'n': 0, 'x': 'X'}
+    orig_file = str(docs_folder / 'big.md')
+
+    write_md_file(env, orig_file, str(tmp_path / 'whole.md'), context, render.hash_file(orig_file))
+    stream_md_file(env, orig_file, str(tmp_path / 'streamed.md'), context, chunk_size)
+    assert (tmp_path / 'whole.md').read_text().startswith('Line 0 Xindented')
+    assert (tmp_path / 'streamed.md').read_text() == (tmp_path / 'whole.md').read_text()
+
+
+def test_stream_md_file_error_line(tmp_path):
+    docs_folder = create_docs(tmp_path, {'big.md': '# {{ title }}\n' * 20 + 'Bad {{ title }\n'})
+    env = new_jinja_env(str(tmp_path / 'docs'))
+    with pytest.raises(Exception) as e:
+        stream_md_file(env, str(docs_folder / 'big.md'), str(tmp_path / 'out.md'), {'title': 'Title'}, 20)
+    assert e.value.lineno == 21
+
+
+def stream_peak_memory(tmp_path, blocks):
+    """ Peak memory (bytes) used to render a generated page by segments """
+    block = ''.join(f'Reference line {i} without markup.\n' for i in range(50)) + '## {{ title }}\n'
+    path = tmp_path / f'page-{blocks}.md'
+    path.write_text(block * blocks)
+    env = new_jinja_env(str(tmp_path))
+    tracemalloc.start()
+    try:
+        stream_md_file(env, str(path), str(tmp_path / 'out.md'), {'title': 'Title'}, 32 * 1024)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_stream_md_file_memory(tmp_path):
+    small = stream_peak_memory(tmp_path, 250)
+    large = stream_peak_memory(tmp_path, 1000)
+    size = (tmp_path / 'page-1000.md').stat().st_size
+    assert size > 1.5 * 1024 * 1024
+    # Bounded by the segment size, not by the file size
+    assert large < small * 1.2
+    assert large < size / 2
+    assert (tmp_path / 'out.md').read_text().count('## Title') == 1000
+
+
+def test_update_md_files_large_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(render, 'STREAM_MIN_SIZE', 10)
+    docs_folder = create_docs(tmp_path, {'index.md': '# {{ title }}\n{% set x = 1 %}\n' * 3 + '{{ x }}\n'})
+    update_md_files(str(docs_folder), tmp_path, {'title': 'Title'})
+    fixed_folder = tmp_path / 'docs' / 'fixed-docs-en'
+    assert (fixed_folder / 'index.md').read_text() == '# Title\n\n' * 3 + '1\n'
@@ -0,0 +1,118 @@
+from unittest.mock import patch
+import git
+import pytest
+from helpers import get_paths
+from run import BASE_FOLDER
+from selection import (
+    changed_files,
+    get_change_targets,
+    get_rebuild_plan,
+    parse_languages,
+    pdf_template_folders,
+    select_languages,
+)
+
+
+PATHS = get_paths(BASE_FOLDER)
+LANGUAGES = ['en', 'es', 'fr']
+PDF_FOLDER = PATHS['base_page_folder'] / 'pdf'
+TEMPLATE_FOLDERS = {language: str(PDF_FOLDER / f'pdf-template-{language}') for language in LANGUAGES}
+
+
+def pdf_config(template_path):
+    return {'plugins': [{'search': {}}, {'with-pdf': {'custom_template_path': template_path}}]}
+
+
+def test_parse_languages():
+    assert parse_languages(('es,fr', 'en', ' es ,')) == ['es', 'fr', 'en']
+    assert parse_languages(()) == []
+
+
+@pytest.mark.parametrize("targets, expected", [
+    ({('docs', 'es')}, (['es'], [])),
+    ({('pdf', 'fr'), ('docs', 'es')}, (['es'], ['fr'])),
+    ({('pdf', 'es'), ('docs', 'es')}, (['es'], [])),
+    ({('assets', None)}, ([], [])),
+    ({('docs', 'xx')}, ([], [])),
+    ({('docs', None)}, (LANGUAGES, [])),
+    ({('config', None), ('pdf', 'es')}, (LANGUAGES, [])),
+])
+def test_get_rebuild_plan(targets, expected):
+    assert get_rebuild_plan(targets, LANGUAGES) == expected
+
+
+def test_changed_files(tmp_path):
+    repo = git.Repo.init(tmp_path)
+    (tmp_path / 'changed.md').write_text('v1')
+    (tmp_path / 'removed.md').write_text('v1')
+    (tmp_path / 'same.md').write_text('v1')
+    repo.index.add(['changed.md', 'removed.md', 'same.md'])
+    repo.index.commit('first', author=git.Actor('test', 'test@example.com'))
+
+    (tmp_path / 'changed.md').write_text('v2')
+    (tmp_path / 'removed.md').unlink()
+    (tmp_path / 'new.md').write_text('v1')
+
+    files = changed_files(tmp_path, 'HEAD')
+    assert sorted(files) == [str(tmp_path / name) for name in ('changed.md', 'new.md', 'removed.md')]
+
+    with pytest.raises(Exception) as e:
+        changed_files(tmp_path, 'unknown-ref')
+    assert 'Unable to get the changes since "unknown-ref"' in str(e.value)
+
+
+def test_pdf_template_folders():
+    configs = {
+        'en': pdf_config('page/pdf/pdf-template-en'),
+        'es': pdf_config('page/pdf/pdf-template-en'),
+        'fr': {'plugins': [{'search': {}}]},
+    }
+    assert pdf_template_folders(configs, PATHS['base_folder']) == {
+        'en': TEMPLATE_FOLDERS['en'],
+        'es': TEMPLATE_FOLDERS['en'],
+    }
+
+
+def test_get_change_targets_shared_pdf_template():
+    # Both languages use the English template (as in conf/base.yml)
+    template_folders = {'en': TEMPLATE_FOLDERS['en'], 'es': TEMPLATE_FOLDERS['en']}
+    assert get_change_targets(PDF_FOLDER / 'pdf-template-en' / 'style.css', PATHS, template_folders) == {
+        ('pdf', 'en'), ('pdf', 'es'),
+    }
+    # Not used by any language
+    assert get_change_targets(PDF_FOLDER / 'pdf-template-es' / 'style.css', PATHS, template_folders) == set()
+    assert get_change_targets(PDF_FOLDER / 'pdf-template-en' / '.style.css.swp', PATHS, template_folders) == set()
+    docs_file = PATHS['base_page_folder'] / 'docs' / 'docs-es' / 'index.md'
+    assert get_change_targets(docs_file, PATHS, template_folders) == {('docs', 'es')}
+
+
+@patch('selection.changed_files')
+def test_select_languages_changed_since(changed, capsys):
+    docs_folder = PATHS['base_page_folder'] / 'docs'
+    changed.return_value = [
+        str(docs_folder / 'docs-es' / 'index.md'),
+        str(docs_folder / 'fixed-docs-en' / 'index.md'),
+        str(PATHS['base_page_folder'] / 'pdf' / 'pdf-template-fr' / 'style.css'),
+        str(PATHS['user_assets_folder'] / 'css' / 'custom.css'),
+    ]
+    assert select_languages(PATHS, LANGUAGES, changed_since='main', template_folders=TEMPLATE_FOLDERS) == (['es'], ['fr'])
+    assert 'site for [es], PDF only for [fr], assets changed' in capsys.readouterr().out
+
+    assert select_languages(PATHS, LANGUAGES, ['en', 'fr'], 'main', TEMPLATE_FOLDERS) == ([], ['fr'])
+
+    # A template shared by all languages
+    shared_folders = {language: TEMPLATE_FOLDERS['fr'] for language in LANGUAGES}
+    assert select_languages(PATHS, LANGUAGES, changed_since='main', template_folders=shared_folders) == (
+        ['es'], ['en', 'fr']
+    )
+
+    changed.return_value = [str(PATHS['custom_config_file'])]
+    assert select_languages(PATHS, LANGUAGES, ['en', 'fr'], changed_since='main') == (['en', 'fr'], [])
+
+
+def test_select_languages():
+    assert select_languages(PATHS, LANGUAGES) == (LANGUAGES, [])
+    assert select_languages(PATHS, LANGUAGES, ['fr', 'es']) == (['es', 'fr'], [])
+    with pytest.raises(Exception) as e:
+        select_languages(PATHS, LANGUAGES, ['pt'])
+    assert 'Language "pt" not found. Available languages: en, es, fr' in str(e.value)
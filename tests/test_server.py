@@ -0,0 +1,160 @@
+import gzip
+import http.client
+import os
+import threading
+import pytest
+import compress
+from compress import precompress_site
+from server import make_server, parse_range
+
+
+@pytest.fixture
+def site(tmp_path):
+    """ Serve a small site from a temp folder. Yield (folder, port) """
+    (tmp_path / 'index.html').write_text('<h1>Home</h1>')
+    (tmp_path / 'es').mkdir()
+    (tmp_path / 'es' / 'index.html').write_text('<h1>Inicio</h1>')
+    httpd = make_server(tmp_path, 0, cache_control='public, max-age=60', host='127.0.0.1')
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield tmp_path, httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get(conn, path, headers={}):
+    conn.request('GET', path, headers=headers)
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def test_serve_cache_headers(site):
+    folder, port = site
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    response, body = get(conn, '/index.html')
+    assert response.status == 200
+    assert body == b'<h1>Home</h1>'
+    assert response.getheader('ETag')
+    assert response.getheader('Last-Modified')
+    assert response.getheader('Cache-Control') == 'public, max-age=60'
+
+
+def test_serve_conditional_requests(site):
+    folder, port = site
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    response, _ = get(conn, '/')
+    etag = response.getheader('ETag')
+    last_modified = response.getheader('Last-Modified')
+
+    # Same connection (keep-alive)
+    response, body = get(conn, '/', {'If-None-Match': etag})
+    assert response.status == 304
+    assert body == b''
+    assert response.getheader('ETag') == etag
+
+    response, body = get(conn, '/', {'If-Modified-Since': last_modified})
+    assert response.status == 304
+
+    # New version of the file
+    (folder / 'index.html').write_text('<h1>New home</h1>')
+    response, body = get(conn, '/', {'If-None-Match': etag})
+    assert response.status == 200
+    assert body == b'<h1>New home</h1>'
+    assert response.getheader('ETag') != etag
+
+
+def test_serve_redirect_and_not_found(site):
+    folder, port = site
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    response, _ = get(conn, '/es')
+    assert response.status == 301
+    assert response.getheader('Location') == '/es/'
+    response, body = get(conn, '/es/')
+    assert body == b'<h1>Inicio</h1>'
+    response, _ = get(conn, '/missing.html')
+    assert response.status == 404
+
+
+@pytest.mark.parametrize("header,size,expected", [
+    ('bytes=0-9', 100, (0, 9)),
+    ('bytes=90-', 100, (90, 99)),
+    ('bytes=-10', 100, (90, 99)),
+    ('bytes=-200', 100, (0, 99)),
+    ('bytes=50-500', 100, (50, 99)),
+    ('bytes=0-1,5-6', 100, None),
+    ('items=0-9', 100, None),
+    ('bytes=a-b', 100, None),
+    ('bytes=9-0', 100, None),
+])
+def test_parse_range(header, size, expected):
+    assert parse_range(header, size) == expected
+
+
+@pytest.mark.parametrize("header", ['bytes=100-', 'bytes=-0'])
+def test_parse_range_not_satisfiable(header):
+    with pytest.raises(ValueError):
+        parse_range(header, 100)
+
+
+@pytest.mark.parametrize("size", [1000, 300 * 1024])
+def test_serve_ranges(site, size):
+    """ Small files are copied, large ones sent with sendfile """
+    folder, port = site
+    data = os.urandom(size)
+    (folder / 'doc.pdf').write_bytes(data)
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+
+    response, body = get(conn, '/doc.pdf')
+    assert response.status == 200
+    assert response.getheader('Accept-Ranges') == 'bytes'
+    assert body == data
+    etag = response.getheader('ETag')
+
+    response, body = get(conn, '/doc.pdf', {'Range': 'bytes=100-'})
+    assert response.status == 206
+    assert response.getheader('Content-Range') == f'bytes 100-{size - 1}/{size}'
+    assert body == data[100:]
+
+    response, body = get(conn, '/doc.pdf', {'Range': 'bytes=-50', 'If-Range': etag})
+    assert response.status == 206
+    assert body == data[-50:]
+
+    # The file changed, the full file is sent
+    response, body = get(conn, '/doc.pdf', {'Range': 'bytes=0-9', 'If-Range': '"old-etag"'})
+    assert response.status == 200
+    assert body == data
+
+    response, body = get(conn, '/doc.pdf', {'Range': f'bytes={size}-'})
+    assert response.status == 416
+    assert response.getheader('Content-Range') == f'bytes */{size}'
+
+
+def test_serve_precompressed(site, monkeypatch):
+    monkeypatch.setattr(compress, 'brotli', None)
+    folder, port = site
+    content = b'<p>Home</p>' * 100
+    (folder / 'index.html').write_bytes(content)
+    precompress_site(folder)
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+
+    response, body = get(conn, '/', {'Accept-Encoding': 'br, gzip'})
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert response.getheader('Vary') == 'Accept-Encoding'
+    assert gzip.decompress(body) == content
+    gzip_etag = response.getheader('ETag')
+
+    response, body = get(conn, '/', {'Accept-Encoding': 'gzip;q=0'})
+    assert response.getheader('Content-Encoding') is None
+    assert response.getheader('Vary') == 'Accept-Encoding'
+    assert response.getheader('ETag') != gzip_etag
+    assert body == content
+
+    response, body = get(conn, '/', {'Accept-Encoding': 'gzip', 'Range': 'bytes=0-2'})
+    assert response.status == 206
+    assert body == content[:3]
+
+    # Outdated compressed copy
+    (folder / 'index.html').write_bytes(b'<p>New home</p>')
+    response, body = get(conn, '/', {'Accept-Encoding': 'gzip'})
+    assert response.getheader('Content-Encoding') is None
+    assert body == b'<p>New home</p>'
@@ -0,0 +1,55 @@
+import os
+from sync import sync_folder
+
+
+def create_assets(folder):
+    (folder / 'img').mkdir(parents=True)
+    (folder / 'img' / 'logo.png').write_bytes(b'logo')
+    (folder / 'css').mkdir()
+    (folder / 'css' / 'extra.css').write_text('p {}')
+
+
+def test_sync_folder(tmp_path):
+    src, dst = tmp_path / 'assets', tmp_path / 'site' / 'assets'
+    manifest = tmp_path / '.cache' / 'manifest-assets.json'
+    create_assets(src)
+    # Theme files in the same folder
+    (dst / 'javascripts').mkdir(parents=True)
+    (dst / 'javascripts' / 'bundle.js').write_text('theme')
+
+    stats = sync_folder(src, dst, manifest)
+    assert stats['files_copied'] == 2
+    assert stats['bytes_copied'] == 8
+    assert (dst / 'img' / 'logo.png').read_bytes() == b'logo'
+
+    stats = sync_folder(src, dst, manifest)
+    assert stats['files_copied'] == 0
+    assert stats['files_skipped'] == 2
+    assert stats['bytes_skipped'] == 8
+
+    (src / 'css' / 'extra.css').write_text('p { color: red; }')
+    os.remove(src / 'img' / 'logo.png')
+    stats = sync_folder(src, dst, manifest)
+    assert stats['files_copied'] == 1
+    assert stats['files_removed'] == 1
+    assert (dst / 'css' / 'extra.css').read_text() == 'p { color: red; }'
+    assert not (dst / 'img' / 'logo.png').exists()
+    # Only synced files are removed
+    assert (dst / 'javascripts' / 'bundle.js').exists()
+
+
+def test_sync_folder_checksum(tmp_path):
+    src, dst = tmp_path / 'assets', tmp_path / 'site'
+    create_assets(src)
+    sync_folder(src, dst)
+
+    # Same size and mtime, different content
+    logo = src / 'img' / 'logo.png'
+    fs = os.stat(logo)
+    logo.write_bytes(b'LOGO')
+    os.utime(logo, ns=(fs.st_atime_ns, fs.st_mtime_ns))
+
+    assert sync_folder(src, dst)['files_copied'] == 0
+    stats = sync_folder(src, dst, checksum=True)
+    assert stats['files_copied'] == 1
+    assert (dst / 'img' / 'logo.png').read_bytes() == b'LOGO'
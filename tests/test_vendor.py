@@ -0,0 +1,109 @@
+import hashlib
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from helpers import get_list_setting, get_paths
+from vendor import remote_assets, vendor_configs, vendored_files
+
+
+class CountingHandler(SimpleHTTPRequestHandler):
+    """ Static files handler counting the requests (stand-in for the remote hosts) """
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.path == '/truncated.png':
+            # The connection is closed before the announced length
+            self.send_response(200)
+            self.send_header('Content-Length', '100')
+            self.end_headers()
+            self.wfile.write(b'logo')
+            return
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def remote(tmp_path):
+    """ Serve the remote assets from a temp folder. Yield (httpd, base URL) """
+    folder = tmp_path / 'remote'
+    folder.mkdir()
+    (folder / 'logo.png').write_bytes(b'logo')
+    (folder / 'jquery.min.js').write_text('jquery')
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), partial(CountingHandler, directory=str(folder)))
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd, f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def language_config(base_url):
+    return {
+        'theme': {'name': 'material', 'logo': f'{base_url}/logo.png', 'favicon': f'{base_url}/logo.png'},
+        'plugins': [
+            {'search': {'lang': 'en'}},
+            {'with-pdf': {'cover_logo': f'{base_url}/logo.png'}},
+        ],
+        'extra_javascript': [f'{base_url}/jquery.min.js', '/assets/js/app.js'],
+        'extra_css': [{'path': f'{base_url}/jquery.min.js'}, '/assets/css/custom.css'],
+        'extra': {'assets_folder': '/assets'},
+    }
+
+
+def test_remote_assets():
+    config = language_config('https://example.com')
+    assert remote_assets(config) == ['https://example.com/logo.png', 'https://example.com/jquery.min.js']
+
+
+def test_vendor_configs(tmp_path, remote):
+    httpd, base_url = remote
+    paths = get_paths(tmp_path)
+    paths['base_config_folder'].mkdir()
+    config = language_config(base_url)
+    logo = hashlib.sha256(b'logo').hexdigest() + '.png'
+    script = hashlib.sha256(b'jquery').hexdigest() + '.js'
+
+    configs = vendor_configs({'en': config, 'es': language_config(base_url)}, paths)
+    # Each URL is downloaded once for all languages
+    assert sorted(httpd.requests) == ['/jquery.min.js', '/logo.png']
+    vendored = configs['en']
+    assert vendored['theme']['logo'] == f'/assets/vendor/{logo}'
+    assert vendored['theme']['favicon'] == f'/assets/vendor/{logo}'
+    assert vendored['extra_javascript'] == [f'/assets/vendor/{script}', '/assets/js/app.js']
+    assert vendored['extra_css'] == [{'path': f'/assets/vendor/{script}'}, '/assets/css/custom.css']
+    # Relative to the config folder, as the other paths in the config files
+    cover_logo = get_list_setting(vendored['plugins'], 'with-pdf')['cover_logo']
+    assert cover_logo == os.path.join('..', '.cache', 'vendor', 'objects', logo)
+    assert (paths['base_config_folder'] / cover_logo).read_bytes() == b'logo'
+    # The local copies are in the site and kept when cleaning the language sites
+    assert (paths['site_assets_folder'] / 'vendor' / logo).read_bytes() == b'logo'
+    assert vendored_files(paths) == {os.path.join('assets', 'vendor', name) for name in (logo, script)}
+    # The resolved config is not changed
+    assert config == language_config(base_url)
+
+    # Offline: cache hit, nothing downloaded
+    httpd.shutdown()
+    httpd.requests.clear()
+    assert vendor_configs({'en': config}, paths)['en'] == vendored
+    assert httpd.requests == []
+
+
+def test_vendor_configs_download_error(tmp_path, remote, capsys):
+    httpd, base_url = remote
+    config = language_config(base_url)
+    config['theme']['logo'] = f'{base_url}/missing.png'
+    config['plugins'][1]['with-pdf']['cover_logo'] = f'{base_url}/truncated.png'
+    vendored = vendor_configs({'en': config}, get_paths(tmp_path))['en']
+    out = capsys.readouterr().out
+    assert f'Unable to download {base_url}/missing.png' in out
+    assert f'Unable to download {base_url}/truncated.png' in out
+    # The remote URL is used
+    assert vendored['theme']['logo'] == f'{base_url}/missing.png'
+    assert get_list_setting(vendored['plugins'], 'with-pdf')['cover_logo'] == f'{base_url}/truncated.png'
+    assert vendored['theme']['favicon'].startswith('/assets/vendor/')
+    assert not [name for name in os.listdir(tmp_path / '.cache' / 'vendor' / 'objects') if name.endswith('.tmp')]
@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock, call, patch
+from click.testing import CliRunner
+import pytest
+import run
+from helpers import get_paths
+from watch import Rebuilder, get_change_target
+
+
+PATHS = get_paths('/project')
+
+
+@pytest.mark.parametrize("path,expected", [
+    ('/project/page/docs/docs-es/about/general.md', ('docs', 'es')),
+    ('/project/page/docs/shared/footer.md', ('docs', None)),
+    ('/project/page/docs/fixed-docs-es/index.md', None),
+    ('/project/page/docs/docs-es/.index.md.swp', None),
+    ('/project/page/assets/img/logo.png', ('assets', None)),
+    ('/project/page/pdf/pdf-template-es/cover.html', ('pdf', None)),
+    ('/project/conf/custom.yml', ('config', None)),
+    ('/project/conf/mkdocs-es.yml', None),
+    ('/project/site/index.html', None),
+])
+def test_get_change_target(path, expected):
+    assert get_change_target(path, PATHS) == expected
+
+
+@patch('watch.build_language')
+def test_rebuild_only_changed_language(build_language):
+    rebuild_config = MagicMock()
+    rebuilder = Rebuilder(PATHS, rebuild_config)
+    rebuilder.render_language = MagicMock()
+
+    rebuilder.rebuild({('docs', 'es'), ('pdf', 'en')})
+
+    rebuild_config.assert_not_called()
+    rebuilder.render_language.assert_called_once_with('es')
+    build_language.assert_called_once_with(PATHS['base_config_folder'] / 'mkdocs-es.yml', dirty=True, pdf=False)
+
+
+@patch('watch.get_languages', return_value=['en', 'es'])
+@patch('watch.build_language')
+def test_rebuild_config_changed(build_language, get_languages):
+    rebuild_config = MagicMock()
+    rebuilder = Rebuilder(PATHS, rebuild_config)
+    rebuilder.render_language = MagicMock()
+
+    rebuilder.rebuild({('config', None), ('docs', 'es')})
+
+    rebuild_config.assert_called_once()
+    # build-config already rendered all the MD files
+    rebuilder.render_language.assert_not_called()
+    assert build_language.call_args_list == [
+        call(PATHS['base_config_folder'] / 'mkdocs-en.yml', dirty=True, pdf=False),
+        call(PATHS['base_config_folder'] / 'mkdocs-es.yml', dirty=True, pdf=False),
+    ]
+
+
+@patch('run.prepare_configs')
+@patch('run.watch_project')
+@patch('run.make_server')
+def test_serve_watch_vendor(make_server, watch_project, prepare_configs):
+    result = CliRunner().invoke(run.serve, ['--watch', '--vendor'])
+    assert result.exit_code == 0
+    # Config changes in watch mode keep the --vendor option
+    watch_project.call_args.kwargs['rebuild_config']()
+    assert prepare_configs.call_args.kwargs['vendor'] is True